@@ -1,5 +1,7 @@
 from app.src.logging_config import logger
 from app.src.pcaster import PCaster
+from app.src.shards import ShardCommitter
+from app.src.helpers import retry_upload
 from typing import List, Optional
 
 def run_pcaster(
@@ -22,6 +24,12 @@ def run_pcaster(
         sources: Optional[List[str]] = None,
         platforms: Optional[List[str]] = None,
         countries: Optional[List[str]] = None,
+        concurrency: int = 1,   # Number of charts scraped in parallel
+        fetch_mode: str = "auto",   # "auto" (HTTP fast path, browser fallback) or "browser"
+        use_cache: bool = True,     # Reuse charts already scraped today (chart cache)
+        resume: bool = False,       # Re-scrape only the failed jobs of today's partitions
+        shard: Optional[str] = None,    # Write today's results as the part of this shard
+        prometheus: bool = False,       # Also upload the scrape metrics in the Prometheus text format
         
         # Retry parameters
         delay: int = 1,     # Delay in seconds between retries
@@ -48,7 +56,13 @@ def run_pcaster(
                 "sources": sources,
                 "platforms": platforms,
                 "countries": countries
-            }
+            },
+            "concurrency": concurrency,
+            "fetch_mode": fetch_mode,
+            "use_cache": use_cache,
+            "resume": resume,
+            "shard": shard,
+            "prometheus": prometheus
         }
 
         # Initialize and run the PCaster
@@ -63,6 +77,37 @@ def run_pcaster(
         raise
 
 
+def run_commit_shards(
+        storage_client_constructor,
+        shards: List[str],
+        date: Optional[str] = None,    # Date partition, today (UTC) by default
+        storage_credentials: Optional[dict] = None,
+        container_name: str = "",
+        sink_dir: str = "",
+
+        # Retry parameters
+        delay: int = 1,
+        retries: int = 3
+    ) -> dict:
+    """
+    Merge the parts of finished shards and publish the manifest and latest.json.
+    Fails without publishing anything if one of the shards is missing.
+    """
+    try:
+        committer = ShardCommitter(
+            storage_client=storage_client_constructor(credentials=storage_credentials),
+            container_name=container_name,
+            sink_dir=sink_dir,
+            shards=shards,
+            date=date,
+            runner=retry_upload(retries=retries, delay=delay)
+        )
+        return committer.commit()
+    except Exception as e:
+        logger.error(f"An error occurred while committing shards: {e}")
+        raise
+
+
 
 if __name__ == "__main__":
     import argparse
@@ -0,0 +1,141 @@
+import os
+import time
+import typer
+import pandas as pd
+from typing import List, Optional
+from app.src.fixtures import FixtureStore, SAMPLE_FIXTURES_DIR
+from app.src.logging_config import logger
+from app.src.podcast_scraper import PlaywrightPodcastScraper
+from app.src.throttle import DomainThrottle
+
+"""
+Offline benchmark of the scrapers.
+`record` scrapes the live sites once and stores their responses as fixtures,
+`run` replays them (no network) and reports per chart latency and wall time.
+`run` defaults to the sample fixtures shipped in `app/fixtures` (every chart of country "us"),
+`record` to `./fixtures`, so it never overwrites them (or writes into site-packages).
+"""
+
+# Replayed responses do not need pacing, the limiter would dominate the timings
+UNTHROTTLED_RATE = 1e9
+
+fixtures_dir_env = os.getenv("PCASTER_FIXTURES_DIR")
+# Recordings go to the working directory, the shipped samples are replayed by default
+record_dir_default = fixtures_dir_env or "fixtures"
+replay_dir_default = fixtures_dir_env or SAMPLE_FIXTURES_DIR
+
+app = typer.Typer()
+
+
+@app.command("record")
+def record_cmd(
+    fixtures_dir: str = typer.Option(
+        record_dir_default,
+        help="Directory the responses are recorded to"
+    ),
+    sources: Optional[List[str]] = typer.Option(None, "--source", "-s", help="List of sources", show_default=False),
+    platforms: Optional[List[str]] = typer.Option(None, "--platform", "-p", help="List of platforms", show_default=False),
+    countries: Optional[List[str]] = typer.Option(None, "--country", "-c", help="List of countries", show_default=False),
+    fetch_mode: str = typer.Option(
+        "auto",
+        help="auto records the HTTP fast paths (and browser fallbacks), browser records the rendered pages"
+    )
+):
+    """
+    Scrape the live sites once and record their responses as fixtures.
+    """
+    with FixtureStore(fixtures_dir, mode="record") as fixtures:
+        scraper = PlaywrightPodcastScraper(
+            sources=sources,
+            platforms=platforms,
+            countries=countries,
+            fetch_mode=fetch_mode,
+            fixtures=fixtures
+        )
+        df_top_podcasts, df_scrape_results = scraper.scrape_podcasts()
+
+    failed = int((df_scrape_results["status"] != "success").sum())
+    typer.echo(
+        f"Recorded {len(fixtures)} responses of {len(df_scrape_results)} charts "
+        f"({len(df_top_podcasts)} rows, {failed} failed) to {fixtures_dir}"
+    )
+
+
+@app.command("run")
+def run_cmd(
+    fixtures_dir: str = typer.Option(
+        replay_dir_default,
+        help="Directory of the recorded responses (default: the sample fixtures in app/fixtures)"
+    ),
+    sources: Optional[List[str]] = typer.Option(None, "--source", "-s", help="List of sources", show_default=False),
+    platforms: Optional[List[str]] = typer.Option(None, "--platform", "-p", help="List of platforms", show_default=False),
+    countries: Optional[List[str]] = typer.Option(None, "--country", "-c", help="List of countries", show_default=False),
+    concurrency: int = typer.Option(1, min=1, help="Number of charts scraped in parallel"),
+    fetch_mode: str = typer.Option("auto", help="auto (HTTP fast path, browser fallback) or browser"),
+    repeat: int = typer.Option(1, min=1, help="Number of benchmark runs"),
+    throttle: bool = typer.Option(
+        False,
+        help="Keep the per domain rate limits of a live scrape (off: timings without pacing)"
+    ),
+    output: Optional[str] = typer.Option(
+        None,
+        help="Write the per chart metrics of all runs to this CSV file"
+    )
+):
+    """
+    Run PlaywrightPodcastScraper.scrape_podcasts against the recorded fixtures
+    and report per chart latency and total wall time.
+    """
+    fixtures = FixtureStore(fixtures_dir, mode="replay")
+
+    runs, walls = [], []
+    for run in range(1, repeat + 1):
+        scraper = PlaywrightPodcastScraper(
+            sources=sources,
+            platforms=platforms,
+            countries=countries,
+            concurrency=concurrency,
+            fetch_mode=fetch_mode,
+            fixtures=fixtures,
+            throttle=None if throttle else DomainThrottle(rate=UNTHROTTLED_RATE, rates={})
+        )
+        start = time.perf_counter()
+        _, df_scrape_results = scraper.scrape_podcasts()
+        wall = time.perf_counter() - start
+
+        walls.append(wall)
+        runs.append(scraper.metrics.to_dataframe().assign(run=run))
+        failed = int((df_scrape_results["status"] != "success").sum())
+        typer.echo(f"Run {run}/{repeat}: {len(df_scrape_results)} charts in {wall:.2f}s, {failed} failed")
+
+    df = pd.concat(runs, ignore_index=True)
+    per_chart = (
+        df.groupby(["source", "platform", "country", "sort_by", "method"], as_index=False)
+        .agg(
+            duration_s=("duration_s", "median"),
+            parse_s=("parse_s", "median"),
+            rows=("rows", "max"),
+            bytes=("bytes", "max"),
+            failed=("status", lambda status: int((status != "success").sum()))
+        )
+        .sort_values("duration_s", ascending=False, ignore_index=True)
+    )
+    with pd.option_context("display.max_rows", None, "display.width", 200):
+        typer.echo(per_chart.to_string(index=False))
+
+    latency = df["duration_s"]
+    typer.echo(
+        f"\nWall time: mean {sum(walls) / len(walls):.2f}s, min {min(walls):.2f}s, max {max(walls):.2f}s "
+        f"over {repeat} runs (concurrency {concurrency}, fetch mode {fetch_mode})\n"
+        f"Chart latency: p50 {latency.quantile(0.5):.3f}s, p95 {latency.quantile(0.95):.3f}s, "
+        f"max {latency.max():.3f}s\n"
+        f"Fixtures: {fixtures.hits} served, {fixtures.misses} missing"
+    )
+
+    if output:
+        df.to_csv(output, index=False)
+        logger.info(f"Per chart metrics written to {output}")
+
+
+if __name__ == "__main__":
+    app()
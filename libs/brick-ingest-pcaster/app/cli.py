@@ -1,5 +1,5 @@
 import typer, os
-from app.app import run_pcaster
+from app.app import run_pcaster, run_commit_shards
 from typing import List, Optional
 
 if os.getenv("ENVIRONMENT") != "production":
@@ -18,6 +18,7 @@ def parse_comma_env(value: Optional[str]) -> Optional[List[str]]:
 sources_env = parse_comma_env(os.getenv("PCASTER_SOURCES", None))
 platforms_env = parse_comma_env(os.getenv("PCASTER_PLATFORMS", None))
 countries_env = parse_comma_env(os.getenv("PCASTER_COUNTRIES", None))
+commit_shards_env = parse_comma_env(os.getenv("PCASTER_COMMIT_SHARDS", None))
 
 app = typer.Typer()
 
@@ -67,6 +68,44 @@ def scrape_cmd(
         help="List of countries", 
         show_default=False
     ),
+    concurrency: int = typer.Option(
+        int(os.getenv("PCASTER_CONCURRENCY", 1)),
+        min=1,
+        help="Number of charts scraped in parallel (one browser per worker)"
+    ),
+    fetch_mode: str = typer.Option(
+        os.getenv("PCASTER_FETCH_MODE", "auto"),
+        help="auto: read charts over HTTP where possible, fall back to the browser; browser: always render"
+    ),
+    use_cache: bool = typer.Option(
+        os.getenv("PCASTER_CHART_CACHE", "true").lower() != "false",
+        "--cache/--no-cache",
+        help="Reuse charts already scraped today, only charts without a snapshot are scraped"
+    ),
+    resume: bool = typer.Option(
+        False,
+        help="Re-scrape only the failed jobs of today's scrape_job_status and merge them into the existing blobs"
+    ),
+    prometheus: bool = typer.Option(
+        os.getenv("PCASTER_PROMETHEUS", "false").lower() == "true",
+        help="Also upload the scrape metrics as scrape_metrics.prom (Prometheus text format)"
+    ),
+
+    # Shard parameters
+    shard: Optional[str] = typer.Option(
+        os.getenv("PCASTER_SHARD", None),
+        help="Write results as top_podcasts/part-<shard>.parquet of the date, latest.json is left to the commit"
+    ),
+    commit_shards: Optional[List[str]] = typer.Option(
+        commit_shards_env,
+        "--commit-shard",
+        help="Expected shards; only merges their parts and publishes the manifest and latest.json (no scraping)",
+        show_default=False
+    ),
+    commit_date: Optional[str] = typer.Option(
+        os.getenv("PCASTER_COMMIT_DATE", None),
+        help="Date partition (YYYY-MM-DD) committed by --commit-shard, default today (UTC)"
+    ),
 
     # Retry parameters
     delay: int = typer.Option(
@@ -79,6 +118,31 @@ def scrape_cmd(
     )
     
 ):
+    if commit_shards:
+        try:
+            run_commit_shards(
+                storage_client_constructor=StorageClient,
+                shards=commit_shards,
+                date=commit_date,
+                storage_credentials={
+                    "azure_storage_account": azure_storage_account,
+                    "azure_storage_key": os.getenv("AZURE_STORAGE_KEY", ""),
+                    "s3_access_key": s3_access_key,
+                    "s3_secret_key": os.getenv("S3_SECRET_KEY", ""),
+                    "s3_endpoint_url": os.getenv("S3_ENDPOINT_URL", ""),
+                    "s3_use_ssl": os.getenv("S3_USE_SSL", None),
+                    "s3_region_name": os.getenv("S3_REGION_NAME", "")
+                },
+                container_name=container_name,
+                sink_dir=sink_dir,
+                delay=delay,
+                retries=retries
+            )
+        except Exception as e:
+            typer.echo(f"An error occurred while committing shards: {e}", err=True)
+            raise typer.Exit(code=1)
+        return
+
     try:
         run_pcaster(        
             storage_client_constructor=StorageClient,
@@ -105,6 +169,12 @@ def scrape_cmd(
             sources=sources,
             platforms=platforms,
             countries=countries,
+            concurrency=concurrency,
+            fetch_mode=fetch_mode,
+            use_cache=use_cache,
+            resume=resume,
+            shard=shard,
+            prometheus=prometheus,
 
             # Sink parameters
             delay=delay,
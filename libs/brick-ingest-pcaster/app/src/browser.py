@@ -0,0 +1,84 @@
+from playwright.sync_api import sync_playwright
+from app.src.logging_config import logger
+
+
+class LazyBrowser:
+    """
+    Chromium that is only launched when the first browser context is requested.
+    Charts served by the HTTP fast path never need it,
+    so a run without fallbacks does not pay the browser start-up.
+    The sync Playwright API is bound to its thread,
+    create (and close) one LazyBrowser per thread.
+
+    Usage:
+        with LazyBrowser(headless=True) as browser:
+            context = browser.new_context()  # launches Chromium on first call
+    """
+
+    def __init__(
+            self,
+            **launch_options
+        ):
+        """
+        :param launch_options: Options of chromium.launch, e.g. headless, slow_mo.
+        """
+        self.launch_options = launch_options
+        self._playwright = None
+        self._browser = None
+
+
+    def __enter__(
+            self
+        ) -> "LazyBrowser":
+        return self
+
+    def __exit__(
+            self,
+            exc_type,
+            exc,
+            tb
+        ) -> None:
+        self.close()
+
+
+    @property
+    def launched(
+            self
+        ) -> bool:
+        return self._browser is not None
+
+
+    def _get_browser(
+            self
+        ):
+        if self._browser is None:
+            logger.info("Launching Chromium.")
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(**self.launch_options)
+        return self._browser
+
+
+    def new_context(
+            self,
+            **kwargs
+        ):
+        """
+        Create a browser context, launching the browser if needed.
+        """
+        return self._get_browser().new_context(**kwargs)
+
+
+    def close(
+            self
+        ) -> None:
+        """
+        Close the browser and stop Playwright (if they were started).
+        """
+        try:
+            if self._browser is not None:
+                self._browser.close()
+        finally:
+            if self._playwright is not None:
+                self._playwright.stop()
+            self._browser = None
+            self._playwright = None
@@ -0,0 +1,187 @@
+import datetime
+import hashlib
+import json
+import threading
+from typing import Any, NamedTuple, Optional
+from app.src.logging_config import logger
+
+# (source, platform, country, sort_by)
+ChartKey = tuple[str, str, str, str]
+# Format of `scraped_at` in the scraped tables (local time)
+SCRAPED_AT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class CachedChart(NamedTuple):
+    """
+    Entries of a cached chart and the time they were scraped (SCRAPED_AT_FORMAT),
+    None for snapshots without `cached_at`.
+    """
+    entries: list[dict[str, Any]]
+    scraped_at: Optional[str]
+
+
+def entries_hash(
+        entries: list[dict[str, Any]]
+    ) -> str:
+    """
+    Content hash of chart entries (order sensitive, as the order is the rank).
+    """
+    payload = json.dumps(entries, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ChartCache:
+    """
+    Storage backed snapshots of scraped charts, one JSON object per chart:
+    `{prefix}/date=YYYY-MM-DD/{source}/{platform}/{country}/{sort_by}.json`
+    holding the parsed entries and their content hash.
+
+    Snapshots of the date are loaded once before scraping,
+    charts with a snapshot are served from it instead of being scraped again,
+    so a rerun after transient failures only scrapes the charts that failed.
+    Snapshots are written as soon as a chart is scraped (thread safe),
+    a crashed run keeps the charts it already finished.
+    """
+
+    def __init__(
+            self,
+            storage_client,
+            container_name: str,
+            prefix: str,
+            date: Optional[str] = None
+        ):
+        """
+        :param storage_client: storage_lib client (StorageClient / LocalStorageClient).
+        :param prefix: Directory of the cache, e.g. "raw_podcasts_data/chart_cache".
+        :param date: Date partition (YYYY-MM-DD), today (UTC) if None.
+        """
+        self.storage_client = storage_client
+        self.container_name = container_name
+        self.date = date or datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%d")
+        self.base = f"{prefix.rstrip('/')}/date={self.date}"
+        self._snapshots: dict[ChartKey, dict] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.writes = 0
+
+
+    def storage_key(
+            self,
+            key: ChartKey
+        ) -> str:
+        source, platform, country, sort_by = key
+        return f"{self.base}/{source}/{platform}/{country}/{sort_by}.json"
+
+
+    def load(
+            self
+        ) -> int:
+        """
+        Load all snapshots of the date (downloaded in parallel).
+        Errors are logged, never raised: unreadable snapshots are skipped
+        and their charts scraped again, a failed listing loads nothing.
+        :return: Number of cached charts.
+        """
+        try:
+            storage_keys = [
+                storage_key
+                for storage_key in self.storage_client.list_keys(
+                    container_name=self.container_name,
+                    prefix=f"{self.base}/"
+                )
+                if storage_key.endswith(".json")
+            ]
+            downloaded = self.storage_client.download_many(
+                storage_keys=storage_keys,
+                container_name=self.container_name
+            )
+        except Exception as e:
+            logger.warning(f"Could not list cached charts in {self.container_name}/{self.base}: {e}")
+            return 0
+
+        snapshots = {}
+        for storage_key, result in downloaded.items():
+            if not result.ok:
+                continue  # re-scraped, failure is logged by download_many
+            try:
+                snapshot = json.loads(result.value.read().decode("utf-8"))
+                snapshots[tuple(snapshot["key"])] = snapshot
+            except Exception as e:
+                logger.warning(f"Skipping unreadable cached chart {storage_key}: {e}")
+
+        with self._lock:
+            self._snapshots.update(snapshots)
+        logger.info(f"Loaded {len(snapshots)} cached charts from {self.container_name}/{self.base}")
+        return len(snapshots)
+
+
+    def get(
+            self,
+            key: ChartKey
+        ) -> Optional[CachedChart]:
+        """
+        Cached entries of the chart and their scrape time,
+        None if it was not scraped (successfully) yet.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                return None
+            self.hits += 1
+        return CachedChart(snapshot["entries"], self._scraped_at(snapshot))
+
+
+    @staticmethod
+    def _scraped_at(
+            snapshot: dict
+        ) -> Optional[str]:
+        """
+        `cached_at` (UTC, ISO 8601) of the snapshot in local SCRAPED_AT_FORMAT.
+        """
+        try:
+            cached_at = datetime.datetime.fromisoformat(snapshot["cached_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return cached_at.astimezone().strftime(SCRAPED_AT_FORMAT)
+
+
+    def put(
+            self,
+            key: ChartKey,
+            entries: list[dict[str, Any]]
+        ) -> None:
+        """
+        Store the chart entries, skipped when the content hash did not change.
+        Empty charts are not cached. Errors are logged, never raised,
+        the cache must not fail a scrape.
+        """
+        if not entries:
+            return
+
+        content_hash = entries_hash(entries)
+        with self._lock:
+            previous = self._snapshots.get(key)
+            if previous is not None and previous.get("content_hash") == content_hash:
+                return
+
+        snapshot = {
+            "key": list(key),
+            "date": self.date,
+            "content_hash": content_hash,
+            "cached_at": datetime.datetime.now(datetime.UTC).isoformat(),
+            "entries": entries
+        }
+        try:
+            self.storage_client.upload_json(
+                storage_key=self.storage_key(key),
+                data=snapshot,
+                container_name=self.container_name,
+                overwrite=True
+            )
+        except Exception as e:
+            logger.warning(f"Could not cache chart {key}: {e}")
+            return
+
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self.writes += 1
@@ -0,0 +1,165 @@
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from app.src.http_client import USER_AGENT
+from app.src.logging_config import logger
+
+# Warm contexts kept for reuse (per browser / worker thread)
+DEFAULT_CONTEXT_POOL_SIZE = 2
+# A context is closed and replaced after serving this many pages
+DEFAULT_MAX_PAGES_PER_CONTEXT = 20
+# Request types aborted by default, none of the scrapers read them
+BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+
+
+class ContextPool:
+    """
+    Pool of warmed browser contexts.
+    Contexts are reused between charts (keeping the connections, cache and
+    cookies of the site), recycled after `max_pages` pages or after an error,
+    and pages are always closed, also when scraping fails.
+    Requests for images, fonts and media are aborted by default.
+    The sync Playwright API is bound to its thread, use one pool per browser.
+
+    Usage:
+        with ContextPool(browser) as pool:
+            with pool.page() as page:
+                page.goto(url)
+    """
+
+    def __init__(
+            self,
+            browser,
+            max_size: int = DEFAULT_CONTEXT_POOL_SIZE,
+            max_pages: int = DEFAULT_MAX_PAGES_PER_CONTEXT,
+            block_resources: Optional[tuple[str, ...]] = BLOCKED_RESOURCE_TYPES,
+            context_options: Optional[dict] = None,
+            fixtures=None
+        ):
+        """
+        :param browser: Browser (or LazyBrowser) creating the contexts.
+        :param max_size: Maximal number of idle contexts kept for reuse.
+        :param max_pages: Pages served by a context before it is recycled.
+        :param block_resources: Playwright resource types to abort, None to load everything.
+        :param context_options: Options of browser.new_context, default sets the user agent.
+        :param fixtures: FixtureStore recording or replaying the pages' requests, live network if None.
+        """
+        if max_size < 1 or max_pages < 1:
+            raise ValueError("max_size and max_pages must be positive")
+
+        self.browser = browser
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.block_resources = frozenset(block_resources or ())
+        self.context_options = context_options or {"user_agent": USER_AGENT}
+        self.fixtures = fixtures
+        self._idle: list = []
+        self._pages_served: dict[int, int] = {}
+
+
+    def __enter__(
+            self
+        ) -> "ContextPool":
+        return self
+
+    def __exit__(
+            self,
+            exc_type,
+            exc,
+            tb
+        ) -> None:
+        self.close()
+
+
+    def _route(
+            self,
+            route
+        ) -> None:
+        if route.request.resource_type in self.block_resources:
+            route.abort()
+        elif self.fixtures is not None:
+            self.fixtures.route(route)
+        else:
+            route.continue_()
+
+
+    def _new_context(
+            self
+        ):
+        context = self.browser.new_context(**self.context_options)
+        if self.block_resources or self.fixtures is not None:
+            context.route("**/*", self._route)
+        self._pages_served[id(context)] = 0
+        return context
+
+
+    def _acquire(
+            self
+        ):
+        return self._idle.pop() if self._idle else self._new_context()
+
+
+    def _release(
+            self,
+            context,
+            failed: bool
+        ) -> None:
+        """
+        Return the context to the pool, or close it when it failed,
+        served `max_pages` pages or the pool is full.
+        """
+        self._pages_served[id(context)] += 1
+        if (
+            failed
+            or self._pages_served[id(context)] >= self.max_pages
+            or len(self._idle) >= self.max_size
+        ):
+            self._close_context(context)
+        else:
+            self._idle.append(context)
+
+
+    def _close_context(
+            self,
+            context
+        ) -> None:
+        self._pages_served.pop(id(context), None)
+        try:
+            context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+
+
+    @contextmanager
+    def page(
+            self
+        ) -> Iterator:
+        """
+        Yield a fresh page of a pooled context.
+        The page is always closed, the context is recycled if an error occurred.
+        """
+        context = self._acquire()
+        failed = False
+        page = None
+        try:
+            page = context.new_page()
+            yield page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            if page is not None:
+                try:
+                    page.close()
+                except Exception:
+                    failed = True
+            self._release(context, failed)
+
+
+    def close(
+            self
+        ) -> None:
+        """
+        Close all idle contexts.
+        """
+        while self._idle:
+            self._close_context(self._idle.pop())
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Literal, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import requests
+from requests.structures import CaseInsensitiveDict
+from app.src.http_client import HttpFetcher
+from app.src.logging_config import logger
+
+FixtureMode = Literal["record", "replay"]
+FIXTURE_MODES = ("record", "replay")
+
+# Bodies are stored decoded, headers describing the wire encoding do not apply on replay
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "set-cookie"})
+# Query params that change between runs (Podchaser charts carry today's date),
+# left out of the fixture key so recordings replay on later days
+DEFAULT_IGNORED_PARAMS = frozenset({"date"})
+
+# Sample fixtures shipped with the app: every chart of country "us"
+SAMPLE_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures")
+
+
+class FixtureMissingError(Exception):
+    """
+    Replayed request without a recorded response.
+    """
+
+    def __init__(
+            self,
+            url: str
+        ):
+        super().__init__(f"No recorded fixture for {url}")
+        self.url = url
+
+
+class FixtureStore:
+    """
+    Recorded responses of the scraped sites for offline runs.
+    `index.json` maps a request (method + url) to its status, headers and body file
+    in `bodies/`, so fixtures can be inspected and edited by hand.
+
+    In "record" mode requests go to the network and their responses are stored,
+    in "replay" mode they are served from the store and missing ones fail.
+    Rendered pages use `route` (installed by the ContextPool on every context),
+    HTTP fast paths use a FixtureFetcher.
+
+    Usage:
+        with FixtureStore("fixtures", mode="record") as fixtures:
+            PlaywrightPodcastScraper(fixtures=fixtures).scrape_podcasts()
+    """
+
+    def __init__(
+            self,
+            directory: str,
+            mode: FixtureMode = "replay",
+            ignored_params: frozenset[str] = DEFAULT_IGNORED_PARAMS
+        ):
+        """
+        :param directory: Directory of the fixtures, created when recording.
+        :param mode: "record" (live network, responses stored) or "replay" (offline).
+        :param ignored_params: Query params not part of the request key.
+        """
+        if mode not in FIXTURE_MODES:
+            raise ValueError(f"mode must be one of {FIXTURE_MODES}")
+
+        self.directory = directory
+        self.mode = mode
+        self.ignored_params = ignored_params
+        self.index_path = os.path.join(directory, "index.json")
+        self._index: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self._index = json.load(f)
+        elif mode == "replay":
+            raise FileNotFoundError(f"No fixtures recorded in {directory}")
+
+
+    def __enter__(
+            self
+        ) -> "FixtureStore":
+        return self
+
+    def __exit__(
+            self,
+            exc_type,
+            exc,
+            tb
+        ) -> None:
+        self.save()
+
+
+    def __len__(
+            self
+        ) -> int:
+        return len(self._index)
+
+
+    def key(
+            self,
+            url: str,
+            method: str = "GET"
+        ) -> str:
+        parts = urlsplit(url)
+        query = urlencode([
+            (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if name not in self.ignored_params
+        ])
+        url = urlunsplit(parts._replace(query=query))
+        return hashlib.sha1(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+
+
+    def get(
+            self,
+            url: str,
+            method: str = "GET"
+        ) -> Optional[tuple[int, dict, bytes]]:
+        """
+        Recorded (status, headers, body) of the request, None if it was not recorded.
+        """
+        key = self.key(url, method)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+            body = f.read()
+        return entry["status"], dict(entry["headers"]), body
+
+
+    def put(
+            self,
+            url: str,
+            status: int,
+            headers: dict,
+            body: bytes,
+            method: str = "GET"
+        ) -> None:
+        """
+        Store the response of the request (replaces an earlier recording).
+        """
+        key = self.key(url, method)
+        file = f"bodies/{key}.bin"
+        os.makedirs(os.path.join(self.directory, "bodies"), exist_ok=True)
+        with open(os.path.join(self.directory, file), "wb") as f:
+            f.write(body)
+
+        with self._lock:
+            self._index[key] = {
+                "method": method.upper(),
+                "url": url,
+                "status": status,
+                "headers": {
+                    name.lower(): value
+                    for name, value in headers.items()
+                    if name.lower() not in _DROPPED_HEADERS
+                },
+                "file": file
+            }
+
+
+    def save(
+            self
+        ) -> None:
+        """
+        Write the index (recording only, replay never changes the store).
+        """
+        if self.mode != "record":
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            index = dict(sorted(self._index.items(), key=lambda item: item[1]["url"]))
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+        logger.info(f"Saved {len(index)} fixtures to {self.directory}")
+
+
+    def route(
+            self,
+            route
+        ) -> None:
+        """
+        Playwright route handler: record the response, or fulfill it from the store.
+        Requests missing in replay are aborted, the page must not reach the network.
+        """
+        request = route.request
+        if self.mode == "record":
+            response = route.fetch()
+            self.put(request.url, response.status, response.headers, response.body(), request.method)
+            route.fulfill(response=response)
+            return
+
+        fixture = self.get(request.url, request.method)
+        if fixture is None:
+            logger.debug(f"No fixture for {request.method} {request.url}, aborting.")
+            route.abort()
+            return
+        status, headers, body = fixture
+        headers["content-length"] = str(len(body))
+        route.fulfill(status=status, headers=headers, body=body)
+
+
+class FixtureFetcher(HttpFetcher):
+    """
+    HttpFetcher recording its responses to, or replaying them from, a FixtureStore.
+    """
+
+    def __init__(
+            self,
+            fixtures: FixtureStore,
+            **kwargs
+        ):
+        """
+        :param fixtures: Store of the recorded responses.
+        :param kwargs: Options of HttpFetcher (used when recording).
+        """
+        super().__init__(**kwargs)
+        self.fixtures = fixtures
+
+
+    def get(
+            self,
+            url: str,
+            **kwargs
+        ) -> requests.Response:
+        """
+        GET the url from the store (replay) or the network (record).
+        Error responses are not recorded.
+        :raises FixtureMissingError: If the url was not recorded (replay).
+        """
+        if self.fixtures.mode == "record":
+            response = super().get(url, **kwargs)
+            self.fixtures.put(url, response.status_code, dict(response.headers), response.content)
+            return response
+
+        fixture = self.fixtures.get(url)
+        if fixture is None:
+            raise FixtureMissingError(url)
+
+        status, headers, body = fixture
+        response = requests.Response()
+        response.url = url
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+        response.raise_for_status()
+        return response
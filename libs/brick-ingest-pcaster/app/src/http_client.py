@@ -0,0 +1,105 @@
+import threading
+from typing import Any, Optional
+import requests
+from requests.adapters import HTTPAdapter
+
+# Same user agent for plain HTTP requests and browser contexts
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/116.0.0.0 Safari/537.36"
+)
+
+DEFAULT_HTTP_TIMEOUT = 10       # seconds
+DEFAULT_HTTP_POOL_SIZE = 10     # keep-alive connections per host
+
+
+class HttpFetcher:
+    """
+    Pooled HTTP client for scrapers that can read their data without rendering,
+    e.g. embedded JSON (`__NEXT_DATA__`) or public JSON feeds.
+    One requests Session is shared by all scrapers and worker threads,
+    so connections (and TLS handshakes) are reused between charts.
+    """
+
+    def __init__(
+            self,
+            pool_size: int = DEFAULT_HTTP_POOL_SIZE,
+            timeout: float = DEFAULT_HTTP_TIMEOUT
+        ):
+        """
+        :param pool_size: Connections kept alive per host, should cover the scrape concurrency.
+        :param timeout: Seconds to wait for the server (connect and read).
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+
+    @property
+    def session(
+            self
+        ) -> requests.Session:
+        """
+        Lazily created shared session.
+        """
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update({
+                        "User-Agent": USER_AGENT,
+                        "Accept-Language": "en-US,en;q=0.9"
+                    })
+                    self._session = session
+        return self._session
+
+
+    def get(
+            self,
+            url: str,
+            **kwargs
+        ) -> requests.Response:
+        """
+        GET the url, raises requests.HTTPError on 4xx / 5xx responses.
+        """
+        response = self.session.get(url, timeout=kwargs.pop("timeout", self.timeout), **kwargs)
+        response.raise_for_status()
+        return response
+
+
+    def get_text(
+            self,
+            url: str
+        ) -> str:
+        return self.get(url).text
+
+
+    def get_json(
+            self,
+            url: str
+        ) -> Any:
+        return self.get(url, headers={"Accept": "application/json"}).json()
+
+
+    def close(
+            self
+        ) -> None:
+        """
+        Close the pooled connections.
+        """
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+# Shared by all scrapers (and worker threads) of the process
+http_fetcher = HttpFetcher()
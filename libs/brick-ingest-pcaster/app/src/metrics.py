@@ -0,0 +1,229 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+import pandas as pd
+
+# Timed phases of a chart, seconds summed over retries
+PHASES = (
+    "throttle_wait",        # waiting for the domain's rate limiter
+    "http_fetch",           # HTTP fast path requests
+    "navigation",           # page.goto of the browser
+    "wait_for_selector",    # waiting for the rendered chart
+    "parse",                # reading the rendered page
+)
+
+METRIC_COLUMNS = (
+    "source", "platform", "country", "sort_by", "method", "status", "started_at",
+    "duration_s", *(f"{phase}_s" for phase in PHASES),
+    "rows", "bytes", "rows_per_second"
+)
+
+
+class ChartMetrics:
+    """
+    Timings and volume of one scraped chart.
+    """
+    __slots__ = ("key", "method", "status", "started_at", "duration", "phases", "rows", "bytes")
+
+    def __init__(
+            self,
+            key: tuple[str, str, str, str]
+        ):
+        self.key = key
+        self.method = "browser"     # "cache", "http" or "browser", the one that produced the rows
+        self.status = "failed"
+        self.started_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        self.duration = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.rows = 0
+        self.bytes = 0
+
+
+    def as_record(
+            self
+        ) -> tuple:
+        return (
+            *self.key, self.method, self.status, self.started_at,
+            round(self.duration, 4), *(round(self.phases[phase], 4) for phase in PHASES),
+            self.rows, self.bytes,
+            round(self.rows / self.duration, 2) if self.duration > 0 else 0.0
+        )
+
+
+class ScrapeMetrics:
+    """
+    Thread safe collector of per chart timing spans.
+    `chart()` opens the record of the chart scraped by the current thread,
+    `span()` / `add_bytes()` called anywhere below it (page loads, HTTP fetches)
+    are attributed to that chart, outside of a chart they are ignored.
+    One collector is shared by all scrapers and worker threads of a run.
+
+    Usage:
+        with metrics.chart(("rephonic", "apple", "us", "top_podcasts")) as chart:
+            with metrics.span("navigation"):
+                page.goto(url)
+            chart.rows = 100
+    """
+
+    def __init__(
+            self
+        ):
+        self._charts: list[ChartMetrics] = []
+        self._runs: dict[str, float] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+
+    @property
+    def current(
+            self
+        ) -> Optional[ChartMetrics]:
+        """
+        Chart scraped by the calling thread, None outside of `chart()`.
+        """
+        return getattr(self._local, "chart", None)
+
+
+    @contextmanager
+    def chart(
+            self,
+            key: tuple[str, str, str, str]
+        ) -> Iterator[ChartMetrics]:
+        """
+        Time the (source, platform, country, sort_by) chart, the record is kept on errors too.
+        """
+        chart = ChartMetrics(key)
+        self._local.chart = chart
+        start = time.perf_counter()
+        try:
+            yield chart
+        finally:
+            chart.duration = time.perf_counter() - start
+            self._local.chart = None
+            with self._lock:
+                self._charts.append(chart)
+
+
+    @contextmanager
+    def span(
+            self,
+            phase: str
+        ) -> Iterator[None]:
+        """
+        Add the duration of the block to a phase of the current chart.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(phase, time.perf_counter() - start)
+
+
+    def add_time(
+            self,
+            phase: str,
+            seconds: float
+        ) -> None:
+        chart = self.current
+        if chart is not None:
+            chart.phases[phase] += seconds
+
+
+    def add_bytes(
+            self,
+            size: int
+        ) -> None:
+        chart = self.current
+        if chart is not None:
+            chart.bytes += size
+
+
+    def record_run(
+            self,
+            run: str,
+            seconds: float
+        ) -> None:
+        """
+        Wall time of a run: a source's `scrape_all`, or "total" for a whole scrape.
+        """
+        with self._lock:
+            self._runs[run] = self._runs.get(run, 0.0) + seconds
+
+
+    def to_dataframe(
+            self
+        ) -> pd.DataFrame:
+        """
+        One row per chart (see METRIC_COLUMNS), slowest first.
+        """
+        with self._lock:
+            records = [chart.as_record() for chart in self._charts]
+        df = pd.DataFrame.from_records(records, columns=list(METRIC_COLUMNS))
+        return df.sort_values("duration_s", ascending=False, ignore_index=True).convert_dtypes()
+
+
+    def to_prometheus(
+            self
+        ) -> str:
+        """
+        Metrics in the Prometheus text exposition format (e.g. for the node exporter textfile collector).
+        """
+        df = self.to_dataframe()
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, samples: list[tuple[dict, float]]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_str = ",".join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f"{name}{{{label_str}}} {value}")
+
+        def chart_labels(row) -> dict:
+            return {
+                "source": row.source, "platform": row.platform, "country": row.country,
+                "sort_by": row.sort_by, "method": row.method, "status": row.status
+            }
+
+        rows = list(df.itertuples(index=False))
+        metric(
+            "pcaster_chart_duration_seconds", "gauge", "Wall time of a chart scrape.",
+            [(chart_labels(row), row.duration_s) for row in rows]
+        )
+        metric(
+            "pcaster_chart_phase_seconds", "gauge", "Time spent per phase of a chart scrape.",
+            [
+                ({**chart_labels(row), "phase": phase}, getattr(row, f"{phase}_s"))
+                for row in rows for phase in PHASES
+            ]
+        )
+        metric(
+            "pcaster_chart_rows", "gauge", "Rows scraped from a chart.",
+            [(chart_labels(row), row.rows) for row in rows]
+        )
+        metric(
+            "pcaster_chart_bytes", "gauge", "Bytes downloaded for a chart.",
+            [(chart_labels(row), row.bytes) for row in rows]
+        )
+        with self._lock:
+            runs = dict(self._runs)
+        metric(
+            "pcaster_run_seconds", "gauge", "Wall time of a scrape run (per source or total).",
+            [({"run": run}, round(seconds, 4)) for run, seconds in runs.items()]
+        )
+        return "\n".join(lines) + "\n"
+
+
+    def summary(
+            self
+        ) -> str:
+        df = self.to_dataframe()
+        if df.empty:
+            return "no charts"
+        total = df["duration_s"].sum()
+        slowest = df.iloc[0]
+        return (
+            f"{len(df)} charts in {total:.1f}s (sum), {int(df['rows'].sum())} rows, "
+            f"{int(df['bytes'].sum()) / 1e6:.1f} MB; slowest: {slowest['source']} "
+            f"{slowest['platform']}/{slowest['country']}/{slowest['sort_by']} {slowest['duration_s']:.1f}s"
+        )
@@ -1,5 +1,8 @@
 import datetime
-from app.src.podcast_scraper import PlaywrightPodcastScraper
+from app.src.podcast_scraper import PlaywrightPodcastScraper, DEFAULT_CONCURRENCY
+from app.src.chart_cache import ChartCache
+from app.src.resume import failed_jobs, merge_resumed
+from app.src.shards import shard_blob_paths, shard_part_path, validate_shard_name
 from app.src.logging_config import logger
 from app.src.helpers import retry_upload
 from typing import Literal, Dict, Optional
@@ -22,7 +25,13 @@ class PCaster:
             storage_credentials: dict = None,
             retries: int = 3,
             delay: int = 1,
-            filters: Dict[Literal["sources", "platforms", "countries"], Optional[str]] = None
+            filters: Dict[Literal["sources", "platforms", "countries"], Optional[str]] = None,
+            concurrency: int = DEFAULT_CONCURRENCY,
+            fetch_mode: Literal["auto", "browser"] = "auto",
+            use_cache: bool = True,
+            resume: bool = False,
+            shard: Optional[str] = None,
+            prometheus: bool = False
         ):
         """
         Main configuration class for the Podcast Rankings App."""
@@ -39,7 +48,8 @@ class PCaster:
         Results dictionary to store the results of the scraping process."""
         self.scraped = {
             "top_podcasts": None,
-            "scrape_job_status": None
+            "scrape_job_status": None,
+            "scrape_metrics": None
         }
 
         self.filters = {
@@ -47,6 +57,8 @@ class PCaster:
             "platforms":  filters.get("platforms", None) if filters else None,  # all platforms
             "countries":  filters.get("countries", None) if filters else None   # all countries
         }
+        self.concurrency = concurrency
+        self.fetch_mode = fetch_mode
 
         """
         Sink configuration for Azure Blob Storage. """
@@ -61,6 +73,23 @@ class PCaster:
         self.podcasts_blob_path = f"{sink_dir}/date={today}/top_podcasts.parquet"
         self.results_blob_path = f"{sink_dir}/date={today}/scrape_job_status.parquet"
         self.latest_blob_path = f"{sink_dir}/latest.json"
+        # Per chart timings of the run, optionally also in the Prometheus text format
+        self.metrics_blob_path = f"{sink_dir}/date={today}/scrape_metrics.parquet"
+        self.prometheus = prometheus
+
+        # Shard mode, parts of the date partition are merged and published by the commit step
+        self.shard = validate_shard_name(shard) if shard is not None else None
+        if self.shard:
+            self.podcasts_blob_path, self.results_blob_path = shard_blob_paths(sink_dir, today, self.shard)
+            self.metrics_blob_path = shard_part_path(sink_dir, today, "scrape_metrics", self.shard)
+        # Per chart snapshots, a rerun of the day only scrapes charts not cached yet
+        self.chart_cache_dir = f"{sink_dir}/chart_cache"
+        self.use_cache = use_cache
+        self._today = today
+
+        # Resume mode, re-scrape only the failed jobs of the existing partitions
+        self.resume = resume
+        self._existing_blobs = False
 
         """
         Runner for retry upload logic (curred)."""
@@ -86,16 +115,19 @@ class PCaster:
                 f"\nPodcasts Blob Path: {self.container_name}/{self.podcasts_blob_path}"
                 f"\nResults Blob Path: {self.container_name}/{self.results_blob_path}"
             )
-        if (
-            self.storage_client.key_exists(
-                container_name = self.container_name, 
-                storage_key = self.podcasts_blob_path
-            ) and 
-            self.storage_client.key_exists(
-                container_name = self.container_name, 
-                storage_key = self.results_blob_path
-            )
-        ):
+        # Both existence checks run in parallel on the shared client
+        existing = self.storage_client.exists_many(
+            container_name = self.container_name, 
+            storage_keys = [self.podcasts_blob_path, self.results_blob_path]
+        )
+
+        self._existing_blobs = all(result.unwrap() for result in existing.values())
+        if self._existing_blobs:
+            if self.resume:
+                logger.info(
+                    "Resume flag is set. Will re-scrape failed jobs and rewrite existing blobs."
+                )
+                return
             if self.overwrite:
                 logger.warning(
                     "Overwrite flag is set. Will overwrite existing blobs."
@@ -109,9 +141,38 @@ class PCaster:
                 self.valid = False
             return
         
+        if self.resume:
+            logger.warning("Resume flag is set but no existing blobs found. Running a full scrape.")
         logger.info("No existing blobs found.")
         return
 
+    def _matches_filters(
+            self,
+            job: tuple
+        ) -> bool:
+        """
+        Check a (source, platform, country, sort_by) job against the source / platform / country filters."""
+        source, platform, country, _ = job
+        return all(
+            not self.filters.get(name) or value in self.filters[name]
+            for name, value in (("sources", source), ("platforms", platform), ("countries", country))
+        )
+
+    def _load_previous(
+            self
+        ) -> tuple:
+        """
+        Read the existing top podcasts and scrape job status partitions of the date."""
+        df_top_podcasts = self.storage_client.read_parquet(
+            container_name=self.container_name,
+            storage_key=self.podcasts_blob_path
+        )
+        df_scrape_results = self.storage_client.read_parquet(
+            container_name=self.container_name,
+            storage_key=self.results_blob_path
+        )
+        return df_top_podcasts, df_scrape_results
+
     def scrape(
             self
         ) -> "PCaster":
@@ -126,13 +187,48 @@ class PCaster:
         
         logger.info("Proceeding with scraping.")
 
+        chart_cache = None
+        if self.use_cache:
+            chart_cache = ChartCache(
+                storage_client=self.storage_client,
+                container_name=self.container_name,
+                prefix=self.chart_cache_dir,
+                date=self._today
+            )
+            chart_cache.load()
+
+        previous, jobs = None, None
+        if self.resume and self._existing_blobs:
+            previous = self._load_previous()
+            jobs = [job for job in failed_jobs(previous[1]) if self._matches_filters(job)]
+            if not jobs:
+                logger.info("No failed jobs to resume. Existing blobs are kept.")
+                self.valid = False
+                return self
+            logger.info(f"Resuming {len(jobs)} failed jobs of {len(previous[1])}.")
+
         podcast_scraper = self.scraper_constructor(
             sources     =  self.filters.get("sources", None),
             platforms   =  self.filters.get("platforms", None),
             countries   =  self.filters.get("countries", None),
+            concurrency =  self.concurrency,
+            fetch_mode  =  self.fetch_mode,
+            chart_cache =  chart_cache,
+            jobs        =  jobs,
         )
 
         df_top_podcasts, df_scrape_results = podcast_scraper.scrape_podcasts()
+        self.scraped["scrape_metrics"] = podcast_scraper.metrics
+
+        if previous is not None:
+            # Replace the failed jobs, job_ids are recomputed
+            df_top_podcasts, df_scrape_results = merge_resumed(
+                *previous, df_top_podcasts, df_scrape_results
+            )
+            logger.info(
+                f"Resumed jobs: {(df_scrape_results['status'] == 'success').sum()} "
+                f"of {len(df_scrape_results)} successful after merge."
+            )
 
         # Check if the DataFrames are empty
         if df_top_podcasts.empty:
@@ -148,6 +244,10 @@ class PCaster:
         self.scraped["top_podcasts"] = df_top_podcasts
         self.scraped["scrape_job_status"] = df_scrape_results
 
+        if chart_cache is not None:
+            logger.info(
+                f"Chart cache: {chart_cache.hits} charts reused, {chart_cache.writes} snapshots written."
+            )
         logger.info("Successfully scraped podcasts.")
 
         return self
@@ -182,32 +282,68 @@ class PCaster:
             self.storage_client.upload_df_as_parquet,
             container_name=self.container_name,
             storage_key=self.podcasts_blob_path,
-            df=self.scraped["top_podcasts"]
+            df=self.scraped["top_podcasts"],
+            skip_unchanged=True
         )
         self.runner(
             self.storage_client.upload_df_as_parquet,
             container_name=self.container_name,
             storage_key=self.results_blob_path,
-            df=self.scraped["scrape_job_status"]
+            df=self.scraped["scrape_job_status"],
+            skip_unchanged=True
         )
 
-        # Write the latest metadata to a JSON file
-        self.runner(
-            self.storage_client.upload_timestamp,
-            container_name=self.container_name,
-            storage_key=self.latest_blob_path,
-            utc_time=self._now,
-            overwrite=True
-        )
+        self._upload_metrics()
+
+        # Write the latest metadata to a JSON file, shards leave it to the commit step
+        if self.shard:
+            logger.info(f"Shard {self.shard} done, latest.json is published by the shard commit.")
+        else:
+            self.runner(
+                self.storage_client.upload_timestamp,
+                container_name=self.container_name,
+                storage_key=self.latest_blob_path,
+                utc_time=self._now,
+                overwrite=True
+            )
 
         logger.info(
             f"Successfully uploaded DataFrames to Azure Blob Storage:\n"
             f"Podcasts Blob Path: {self.container_name}/{self.podcasts_blob_path}\n"
-            f"Results Blob Path: {self.container_name}/{self.results_blob_path}"
+            f"Results Blob Path: {self.container_name}/{self.results_blob_path}\n"
+            f"Transfer: {self.storage_client.transfer_stats.summary()}"
         )
 
         return self
 
+    def _upload_metrics(
+            self
+        ) -> None:
+        """
+        Upload the scrape metrics next to the scrape job status.
+        Metrics are diagnostics, a failed upload is logged and does not fail the run."""
+        metrics = self.scraped.get("scrape_metrics")
+        if metrics is None:
+            return
+
+        try:
+            self.runner(
+                self.storage_client.upload_df_as_parquet,
+                container_name=self.container_name,
+                storage_key=self.metrics_blob_path,
+                df=metrics.to_dataframe()
+            )
+            if self.prometheus:
+                self.runner(
+                    self.storage_client.upload_object,
+                    container_name=self.container_name,
+                    storage_key=self.metrics_blob_path.removesuffix(".parquet") + ".prom",
+                    source=BytesIO(metrics.to_prometheus().encode("utf-8")),
+                    overwrite=True
+                )
+        except Exception as e:
+            logger.warning(f"Could not upload scrape metrics: {e}")
+
     def finalize(
             self,
             raise_on_invalid: bool = False
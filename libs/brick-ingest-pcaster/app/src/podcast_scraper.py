@@ -1,9 +1,20 @@
+import queue
+import time
 import pandas as pd
-from playwright.sync_api import sync_playwright
+from concurrent.futures import ThreadPoolExecutor
+from app.src.browser import LazyBrowser
+from app.src.chart_cache import ChartCache
+from app.src.context_pool import BLOCKED_RESOURCE_TYPES, ContextPool
+from app.src.fixtures import FixtureFetcher, FixtureStore
+from app.src.logging_config import logger
+from app.src.metrics import ScrapeMetrics
+from app.src.records import JOB_COLUMNS, PODCAST_COLUMNS, RecordBuffer
 from app.src.scrapers.podchaser import PodchaserScraper
 from app.src.scrapers.apple import ApplePodcastsScraper
 from app.src.scrapers.rephonic import RephonicScraper
-from typing import Literal
+from app.src.scrapers.abstract import FetchMode
+from app.src.throttle import DomainThrottle
+from typing import Literal, Optional
 
 _sources = {
     "podchaser": PodchaserScraper,
@@ -13,6 +24,9 @@ _sources = {
 _platforms = ["apple", "spotify"]
 _countries = ["us", "pl"]  
 
+# Number of parallel browsers, 1 keeps the serial scrape
+DEFAULT_CONCURRENCY = 1
+
 
 
 class PlaywrightPodcastScraper:
@@ -25,95 +39,240 @@ class PlaywrightPodcastScraper:
             self,
             sources:    list[Literal["podchaser", "apple_podcasts", "rephonic"]]    = None, # all sources
             platforms:  list[Literal["apple", "spotify"]]                           = None, # all platforms
-            countries:  list[Literal["us", "pl"]]                                   = None # all countries
+            countries:  list[Literal["us", "pl"]]                                   = None, # all countries
+            concurrency: int = DEFAULT_CONCURRENCY,
+            fetch_mode: FetchMode = "auto",
+            block_resources: bool = True,
+            chart_cache: Optional[ChartCache] = None,
+            jobs: Optional[list[tuple[str, str, str, str]]] = None,
+            fixtures: Optional[FixtureStore] = None,
+            throttle: Optional[DomainThrottle] = None,
+            slow_mo: int = 0
         ):
         """
         Initialize the PlaywrightPodcastScraper instance.
+        :param concurrency: Number of charts scraped in parallel, each worker runs its own browser.
+        :param fetch_mode: "auto" uses the scrapers' HTTP fast path where available,
+            "browser" renders every chart with Playwright.
+        :param block_resources: Abort image, font and media requests of rendered pages.
+        :param chart_cache: Loaded snapshots of the date, cached charts are not scraped again.
+        :param jobs: Explicit (source, platform, country, sort_by) charts to scrape
+            instead of all charts matching the filters, e.g. the failed jobs of a resumed run.
+        :param fixtures: Record the sites' responses to, or replay them from, a FixtureStore
+            (pages and HTTP fast paths), live network only if None.
+        :param throttle: Per domain rate limiter of the scrapers, shared process wide if None.
+        :param slow_mo: Milliseconds delay between browser actions (debugging),
+            request pacing is done per domain by the scrapers' throttle.
         """
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
         self.sources = [ s for s in sources if s in _sources.keys() ] if sources else list(_sources.keys())
         self.platforms = [ p for p in platforms if p in _platforms ] if platforms else None
         self.countries = [ c for c in countries if c in _countries ] if countries else None
+        self.concurrency = concurrency
+        self.fetch_mode = fetch_mode
+        self.block_resources = block_resources
+        self.chart_cache = chart_cache
+        self.jobs = [tuple(job) for job in jobs] if jobs is not None else None
+        self.fixtures = fixtures
+        self.fetcher = FixtureFetcher(fixtures) if fixtures is not None else None
+        self.throttle = throttle
+        self.slow_mo = slow_mo
+        # Per chart timings of the run, shared by all scrapers and workers
+        self.metrics = ScrapeMetrics()
 
-    def get_dataframes(
+    def get_buffers(
             self
-        ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        ) -> tuple[RecordBuffer, RecordBuffer]:
         """
-        Returns the DataFrames used for scraping.
-        """
-        # DataFrame to store the top podcasts
-        df_top_podcasts = pd.DataFrame(columns=[
-            "job_id",           # unique identifier for the scrape job = results index
-            "source",           # scraper source, e.g. "podchaser", "apple_podcasts",
-            "platform",         # platform for which ranking is scraped, e.g. "apple", "spotify"
-            "country",          # country code, e.g. "us", "pl"
-            "sort_by",          # sorting criteria, e.g. "top_podcasts", or genre like "news", "business", etc.
-            "rank",             # rank of the podcast in the chart, e.g. 1, 2, 3, ...
-            "podcast_title",    # title of the podcast
-            "scraped_at",       # timestamp when the data was scraped
-            "itunes_id"         # podcast id, may be empty - needs to be provided later (or added podcasting index id in another column)
-        ])
-
-        # DataFrame to store scrape job results
-        df_scrape_results = pd.DataFrame(columns=[
-            "source",       # scraper source, e.g. "podchaser", "apple_podcasts", "rephonic"
-            "platform",     # platform for which ranking is scraped, e.g. "apple", "spotify"
-            "country",      # country code, e.g. "us", "pl"
-            "sort_by",      # sorting criteria, e.g. "top_podcasts", or genre like "news", "business", etc.
-            "scraped_at",   # timestamp when the data was scraped
-            "status"        # status of the scrape job, "success" or "failed"
-        ])
+        Returns the empty buffers used for scraping,
+        top podcasts rows and scrape job results (see app.src.records for the columns).
+        """
+        return RecordBuffer(PODCAST_COLUMNS), RecordBuffer(JOB_COLUMNS)
 
-        return df_top_podcasts, df_scrape_results
+
+    def _create_scraper(
+            self,
+            source: str,
+            browser: LazyBrowser,
+            context_pool: ContextPool
+        ):
+        return _sources[source](
+            browser=browser,
+            context_pool=context_pool,
+            chart_cache=self.chart_cache,
+            platforms=self.platforms,
+            countries=self.countries,
+            fetch_mode=self.fetch_mode,
+            fetcher=self.fetcher,
+            throttle=self.throttle,
+            metrics=self.metrics
+        )
+
+
+    def _create_browser(
+            self
+        ) -> LazyBrowser:
+        """
+        Browser launched on first use, charts read over HTTP do not start it.
+        """
+        return LazyBrowser(headless=True, slow_mo=self.slow_mo)
+
+
+    def _create_context_pool(
+            self,
+            browser: LazyBrowser
+        ) -> ContextPool:
+        """
+        Warm contexts shared by the scrapers of one browser.
+        """
+        return ContextPool(
+            browser,
+            block_resources=BLOCKED_RESOURCE_TYPES if self.block_resources else None,
+            fixtures=self.fixtures
+        )
+
+
+    def get_jobs(
+            self
+        ) -> list[tuple[str, str, str, str]]:
+        """
+        Returns all (source, platform, country, sort_by) chart jobs matching the filters,
+        or the explicit jobs (of known sources) if given.
+        """
+        if self.jobs is not None:
+            return [job for job in self.jobs if job[0] in _sources]
+
+        return [
+            (source, platform, country, genre)
+            for source in self.sources
+            for platform, country, genre in _sources[source].iter_jobs(
+                platforms=self.platforms,
+                countries=self.countries
+            )
+        ]
 
 
     def scrape_podcasts(
             self
-        ) -> None:
+        ) -> tuple[pd.DataFrame, pd.DataFrame]:
         """
         Scrape top podcasts from various sources using Playwright.
         This method initializes the Playwright browser, creates instances of the scrapers,
         and iterates through them to scrape the data.
+        With concurrency > 1 the charts are spread over a pool of workers.
         It also handles the DataFrames for top podcasts and scrape results.
+        Per chart timings are collected in `metrics`.
         """
+        start = time.perf_counter()
+        if self.concurrency > 1:
+            rows, results = self._scrape_concurrently()
+        else:
+            rows, results = self._scrape_serially()
+        self.metrics.record_run("total", time.perf_counter() - start)
+        logger.info(f"Scrape metrics: {self.metrics.summary()}")
+
+        # Build the DataFrames once from the collected records
+        df_top_podcasts = rows.to_dataframe()
+        df_scrape_results = results.to_dataframe()
+
+        # Cast itunes_id to string type
+        # This is necessary for consistency, as some IDs may be numeric
+        df_top_podcasts["itunes_id"] = df_top_podcasts["itunes_id"].astype(str)
+
+        # Convert DataFrames to appropriate dtypes
+        df_top_podcasts = df_top_podcasts.convert_dtypes()
+        df_scrape_results = df_scrape_results.convert_dtypes()
+
+        return df_top_podcasts, df_scrape_results
+
 
-        # Get the DataFrames for top podcasts and scrape results
-        df_top_podcasts, df_scrape_results = self.get_dataframes()
+    def _scrape_serially(
+            self
+        ) -> tuple[RecordBuffer, RecordBuffer]:
+        """
+        Scrape all jobs one chart at a time with a single browser.
+        """
+        # Get the buffers for top podcasts and scrape results
+        rows, results = self.get_buffers()
 
         # 1 Scrape all top podcasts from various sources
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=True, 
-                # 221 milliseconds delay between actions 
-                # to avoid potential rate limiting
-                slow_mo=221 
-            ) 
-
-            # Initialize scrapers with the browser instance and specified filters
-            scrapers = [
-                _sources[source](
-                    browser=browser, 
-                    platforms=self.platforms, 
-                    countries=self.countries
-                )
-                for source in self.sources
-            ]
-
-            # Scrape data from all available sources
-            for scraper in scrapers:
-                df_top_podcasts, df_scrape_results = scraper.scrape_all(
-                    df=df_top_podcasts,
-                    results=df_scrape_results
+        with self._create_browser() as browser, self._create_context_pool(browser) as pool:
+            # Scrapers share the browser instance and specified filters
+            scrapers = {}
+            for source, platform, country, genre in self.get_jobs():
+                if source not in scrapers:
+                    scrapers[source] = self._create_scraper(source, browser, pool)
+                rows, results = scrapers[source].scrape(
+                    rows=rows,
+                    results=results,
+                    country_code=country,
+                    sort_by=genre,
+                    platform=platform
                 )
 
-            # Cast itunes_id to string type
-            # This is necessary for consistency, as some IDs may be numeric
-            df_top_podcasts["itunes_id"] = df_top_podcasts["itunes_id"].astype(str)
+        return rows, results
 
-            # Convert DataFrames to appropriate dtypes
-            df_top_podcasts = df_top_podcasts.convert_dtypes()
-            df_scrape_results = df_scrape_results.convert_dtypes()
 
-            browser.close() # Close the browser after scraping
+    def _scrape_concurrently(
+            self
+        ) -> tuple[RecordBuffer, RecordBuffer]:
+        """
+        Scrape the charts with a pool of workers.
+        The sync Playwright API is bound to its thread,
+        so every worker owns a (lazily launched) browser
+        and takes jobs from a shared queue until it is empty.
+        Each job is scraped into its own buffers,
+        merged afterwards in job order with consistent job_ids.
+        """
+        jobs = self.get_jobs()
+        outputs = [None] * len(jobs)
+
+        pending = queue.Queue()
+        for index, job in enumerate(jobs):
+            pending.put((index, job))
+
+        def worker() -> None:
+            with self._create_browser() as browser, self._create_context_pool(browser) as pool:
+                scrapers = {}
+                while True:
+                    try:
+                        index, (source, platform, country, genre) = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    if source not in scrapers:
+                        scrapers[source] = self._create_scraper(source, browser, pool)
+                    rows, results = self.get_buffers()
+                    outputs[index] = scrapers[source].scrape(
+                        rows=rows,
+                        results=results,
+                        country_code=country,
+                        sort_by=genre,
+                        platform=platform
+                    )
+
+        workers = min(self.concurrency, len(jobs))
+        logger.info(f"Scraping {len(jobs)} charts with {workers} workers.")
+        with ThreadPoolExecutor(max_workers=workers or 1) as executor:
+            futures = [executor.submit(worker) for _ in range(workers)]
+            for future in futures:
+                future.result()
 
+        return self._merge_outputs(outputs)
+
+
+    def _merge_outputs(
+            self,
+            outputs: list[tuple[RecordBuffer, RecordBuffer]]
+        ) -> tuple[RecordBuffer, RecordBuffer]:
+        """
+        Concatenate per job buffers, job_ids are offset by the number of
+        preceding results so they keep pointing at the results index.
+        """
+        rows, results = self.get_buffers()
+        for job_rows, job_results in outputs:
+            rows.extend(job_rows, offsets={"job_id": len(results)})
+            results.extend(job_results)
 
-        return df_top_podcasts, df_scrape_results
\ No newline at end of file
+        return rows, results
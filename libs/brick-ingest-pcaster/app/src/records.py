@@ -0,0 +1,134 @@
+import pandas as pd
+from typing import Iterator, Optional
+
+# Columns of the top podcasts table
+PODCAST_COLUMNS = (
+    "job_id",           # unique identifier for the scrape job = results index
+    "source",           # scraper source, e.g. "podchaser", "apple_podcasts",
+    "platform",         # platform for which ranking is scraped, e.g. "apple", "spotify"
+    "country",          # country code, e.g. "us", "pl"
+    "sort_by",          # sorting criteria, e.g. "top_podcasts", or genre like "news", "business", etc.
+    "rank",             # rank of the podcast in the chart, e.g. 1, 2, 3, ...
+    "podcast_title",    # title of the podcast
+    "scraped_at",       # timestamp when the data was scraped
+    "itunes_id"         # podcast id, may be empty - needs to be provided later (or added podcasting index id in another column)
+)
+
+# Columns of the scrape job results table
+JOB_COLUMNS = (
+    "source",       # scraper source, e.g. "podchaser", "apple_podcasts", "rephonic"
+    "platform",     # platform for which ranking is scraped, e.g. "apple", "spotify"
+    "country",      # country code, e.g. "us", "pl"
+    "sort_by",      # sorting criteria, e.g. "top_podcasts", or genre like "news", "business", etc.
+    "scraped_at",   # timestamp when the data was scraped
+    "status"        # status of the scrape job, "success" or "failed"
+)
+
+
+class RecordBuffer:
+    """
+    Append-only row store with a fixed set of columns.
+    Rows are kept as tuples and converted to a DataFrame once,
+    so collecting N rows costs O(N) instead of the O(N^2)
+    of growing a DataFrame row by row.
+
+    Usage:
+        rows = RecordBuffer(PODCAST_COLUMNS)
+        index = rows.append(source="rephonic", rank=1, ...)
+        df = rows.to_dataframe()
+    """
+    __slots__ = ("columns", "_positions", "_rows")
+
+    def __init__(
+            self,
+            columns: tuple[str, ...]
+        ):
+        """
+        :param columns: Column names, missing values of appended rows are None.
+        """
+        self.columns = tuple(columns)
+        self._positions = {column: i for i, column in enumerate(self.columns)}
+        self._rows: list[tuple] = []
+
+
+    def __len__(
+            self
+        ) -> int:
+        return len(self._rows)
+
+
+    def __iter__(
+            self
+        ) -> Iterator[dict]:
+        for row in self._rows:
+            yield dict(zip(self.columns, row))
+
+
+    def _check_columns(
+            self,
+            values: dict
+        ) -> None:
+        unknown = set(values) - set(self._positions)
+        if unknown:
+            raise KeyError(f"Unknown columns: {sorted(unknown)}")
+
+
+    def append(
+            self,
+            **values
+        ) -> int:
+        """
+        Append a row given as column=value keywords.
+        :return: Index of the new row.
+        """
+        self._check_columns(values)
+        self._rows.append(tuple(values.get(column) for column in self.columns))
+        return len(self._rows) - 1
+
+
+    def update(
+            self,
+            index: int,
+            **values
+        ) -> None:
+        """
+        Set column values of an existing row.
+        """
+        self._check_columns(values)
+        row = list(self._rows[index])
+        for column, value in values.items():
+            row[self._positions[column]] = value
+        self._rows[index] = tuple(row)
+
+
+    def extend(
+            self,
+            other: "RecordBuffer",
+            offsets: Optional[dict[str, int]] = None
+        ) -> None:
+        """
+        Append all rows of another buffer with the same columns.
+        :param offsets: Integers added to columns, e.g. {"job_id": 10} to re-index jobs.
+        """
+        if other.columns != self.columns:
+            raise ValueError("Cannot extend a RecordBuffer with different columns.")
+        if not offsets:
+            self._rows.extend(other._rows)
+            return
+
+        self._check_columns(offsets)
+        shifts = [(self._positions[column], offset) for column, offset in offsets.items()]
+        for row in other._rows:
+            row = list(row)
+            for position, offset in shifts:
+                row[position] += offset
+            self._rows.append(tuple(row))
+
+
+    def to_dataframe(
+            self
+        ) -> pd.DataFrame:
+        """
+        Build the DataFrame in one pass, the index is the row index (job_id for jobs).
+        """
+        return pd.DataFrame.from_records(self._rows, columns=list(self.columns))
@@ -0,0 +1,68 @@
+import pandas as pd
+
+# Columns identifying a chart job in scrape_job_status
+JOB_KEY = ["source", "platform", "country", "sort_by"]
+
+
+def failed_jobs(
+        df_status: pd.DataFrame
+    ) -> list[tuple[str, str, str, str]]:
+    """
+    (source, platform, country, sort_by) of the jobs that did not succeed, in job order.
+    """
+    failed = df_status[df_status["status"] != "success"]
+    return [tuple(job) for job in failed[JOB_KEY].itertuples(index=False, name=None)]
+
+
+def merge_resumed(
+        df_podcasts: pd.DataFrame,
+        df_status: pd.DataFrame,
+        df_podcasts_new: pd.DataFrame,
+        df_status_new: pd.DataFrame
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Merge a resumed (partial) scrape into the existing partitions.
+    Failed jobs are replaced by their re-scraped result, successful jobs are kept,
+    jobs not present before are appended.
+    job_ids are recomputed as the position in the merged status table
+    (the job_id of top podcasts rows is the status index, as in a full scrape).
+    :return: Tuple of DataFrames (top_podcasts, scrape_job_status).
+    """
+    df_status = df_status.reset_index(drop=True)
+    df_status_new = df_status_new.reset_index(drop=True)
+
+    old_rows = {job_id: rows for job_id, rows in df_podcasts.groupby("job_id")}
+    new_rows = {job_id: rows for job_id, rows in df_podcasts_new.groupby("job_id")}
+    new_jobs = {
+        tuple(key): job_id
+        for job_id, key in enumerate(df_status_new[JOB_KEY].itertuples(index=False, name=None))
+    }
+
+    # (status row, podcast rows) in the final job order
+    merged = []
+    for job_id, job in df_status.iterrows():
+        key = tuple(job[JOB_KEY])
+        if job["status"] != "success" and key in new_jobs:
+            new_id = new_jobs.pop(key)
+            merged.append((df_status_new.loc[new_id], new_rows.get(new_id)))
+        else:
+            merged.append((job, old_rows.get(job_id)))
+    for new_id in new_jobs.values():
+        merged.append((df_status_new.loc[new_id], new_rows.get(new_id)))
+
+    status = pd.DataFrame(
+        [job for job, _ in merged],
+        columns=df_status.columns
+    ).reset_index(drop=True)
+
+    frames = [
+        rows.assign(job_id=job_id)
+        for job_id, (_, rows) in enumerate(merged)
+        if rows is not None and not rows.empty
+    ]
+    podcasts = (
+        pd.concat(frames, ignore_index=True)
+        if frames else df_podcasts.iloc[0:0]
+    )
+
+    return podcasts.convert_dtypes(), status.convert_dtypes()
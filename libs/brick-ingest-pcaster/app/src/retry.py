@@ -0,0 +1,137 @@
+import random
+import time
+from typing import Callable, Optional, TypeVar
+import requests
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from app.src.logging_config import logger
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY = 1.0    # seconds
+DEFAULT_MAX_DELAY = 30.0    # seconds
+
+
+class HttpStatusError(Exception):
+    """
+    Error status of a page loaded in the browser
+    (Playwright does not raise on 4xx / 5xx responses).
+    """
+
+    def __init__(
+            self,
+            url: str,
+            status: int,
+            retry_after: Optional[float] = None
+        ):
+        super().__init__(f"HTTP {status} for {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(
+        value: Optional[str]
+    ) -> Optional[float]:
+    """
+    Seconds of a Retry-After header, None if missing or given as a date.
+    """
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+def error_status(
+        error: BaseException
+    ) -> Optional[int]:
+    """
+    HTTP status of a browser or requests error, None if it has none.
+    """
+    if isinstance(error, HttpStatusError):
+        return error.status
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def error_retry_after(
+        error: BaseException
+    ) -> Optional[float]:
+    """
+    Retry-After (seconds) sent with the error response, if any.
+    """
+    if isinstance(error, HttpStatusError):
+        return error.retry_after
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    return parse_retry_after(headers.get("Retry-After"))
+
+
+def is_retryable(
+        error: BaseException
+    ) -> bool:
+    """
+    Transient failures worth a retry: 429, 5xx, timeouts and connection errors.
+    """
+    if isinstance(error, (PlaywrightTimeoutError, TimeoutError, requests.Timeout, requests.ConnectionError)):
+        return True
+    status = error_status(error)
+    return status is not None and (status == 429 or status >= 500)
+
+
+class RetryPolicy:
+    """
+    Retries with exponential backoff and full jitter:
+    the n-th retry sleeps a random time in [0, min(max_delay, base_delay * 2**n)],
+    or at least the server's Retry-After.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+            base_delay: float = DEFAULT_BASE_DELAY,
+            max_delay: float = DEFAULT_MAX_DELAY
+        ):
+        """
+        :param max_attempts: Attempts including the first one, 1 disables retries.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+
+    def backoff(
+            self,
+            attempt: int,
+            retry_after: Optional[float] = None
+        ) -> float:
+        """
+        Seconds to sleep after the failed attempt (0 based).
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        return max(delay, retry_after or 0.0)
+
+
+    def run(
+            self,
+            func: Callable[[], T],
+            description: str = ""
+        ) -> T:
+        """
+        Call func, retrying retryable errors. The last error is raised.
+        """
+        for attempt in range(self.max_attempts):
+            try:
+                return func()
+            except Exception as e:
+                if attempt == self.max_attempts - 1 or not is_retryable(e):
+                    raise
+                delay = self.backoff(attempt, error_retry_after(e))
+                logger.warning(
+                    f"{description} failed (attempt {attempt + 1}/{self.max_attempts}): {e}. "
+                    f"Retrying in {delay:.1f}s."
+                )
+                time.sleep(delay)
@@ -1,15 +1,41 @@
 
-import pandas as pd
-import time, random
-from typing import Literal, Optional
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Literal, Optional
+from app.src.chart_cache import ChartCache
+from app.src.context_pool import ContextPool
+from app.src.http_client import HttpFetcher, http_fetcher
+from app.src.logging_config import logger
+from app.src.metrics import ScrapeMetrics
+from app.src.records import RecordBuffer
+from app.src.retry import (
+    HttpStatusError,
+    RetryPolicy,
+    error_retry_after,
+    is_retryable,
+    parse_retry_after
+)
+from app.src.throttle import DomainThrottle, domain_throttle
 from app.src.utils import Validate
 
+# "auto": HTTP fast path when the scraper has one, browser as fallback
+# "browser": always render the page with Playwright
+FetchMode = Literal["auto", "browser"]
+FETCH_MODES = ("auto", "browser")
+
+# Chart entry parsed by a scraper: {"podcast_title": ..., "itunes_id": ...}, in rank order
+ChartEntries = list[dict[str, Any]]
+
+
 class AbstractScraper:
     """
     Abstract base class for scrapers.
     All scrapers should inherit from this class 
-    and implement the `scrape` method.
+    and implement the `_scrape_with_browser` method.
+    Scrapers whose data is reachable without rendering
+    (embedded JSON, public feeds) also implement `_scrape_with_http`.
     """
+    source: str = ""
     base_url: str = ""
     platforms: list[str] = []
     countries: list[str] = []
@@ -21,156 +47,361 @@ class AbstractScraper:
             browser,
             platforms: Optional[list[str]] = None,
             countries: Optional[list[str]] = None,
+            throttle: Optional[DomainThrottle] = None,
+            fetch_mode: FetchMode = "auto",
+            fetcher: Optional[HttpFetcher] = None,
+            context_pool: Optional[ContextPool] = None,
+            chart_cache: Optional[ChartCache] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            metrics: Optional[ScrapeMetrics] = None
         ):
         """
         Initialize the scraper instance.
-        :param browser: The browser instance to use for scraping.
+        :param browser: The browser instance to use for scraping,
+            only used when the HTTP fast path is not available.
+        :param throttle: Per domain rate limiter, shared process wide if None.
+        :param fetch_mode: "auto" (HTTP first, browser fallback) or "browser".
+        :param fetcher: Pooled HTTP client, shared process wide if None.
+        :param context_pool: Pool of browser contexts (share it between the scrapers
+            of one browser), a private pool on the browser if None.
+        :param chart_cache: Snapshots of charts already scraped for the date, no caching if None.
+        :param retry_policy: Retries of transient failures (429, 5xx, timeouts) per fetch,
+            3 attempts with jittered exponential backoff if None.
+        :param metrics: Collector of per chart timings (share it between the scrapers of a run),
+            a private collector if None.
         """
         if browser is None:
             raise ValueError(
                 "Browser instance must be provided."
             )
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"fetch_mode must be one of {FETCH_MODES}")
         
         self.browser = browser
+        self.context_pool = context_pool or ContextPool(browser)
+        self.fetch_mode = fetch_mode
+        self.fetcher = fetcher or http_fetcher
+        self.chart_cache = chart_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.metrics = metrics or ScrapeMetrics()
 
         # All available if None
         self.available_platforms = platforms
         self.available_countries = countries
 
+        self.throttle = throttle or domain_throttle
+
 
 
     def scrape(
             self,
-            df: pd.DataFrame,
-            results: pd.DataFrame,
+            rows: RecordBuffer,
+            results: RecordBuffer,
             country_code: Literal["pl", "us"] = "us",
             sort_by: Literal[ 
                 "top_podcasts", "business", "news", "science", "technology"
             ] = "top_podcasts",
             platform: Literal["apple", "spotify"] = "apple"
-        ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        ) -> tuple[RecordBuffer, RecordBuffer]:
         """
-        Scrape data from a source.
-        This method should be implemented by subclasses.
-        :param df: DataFrame to store the scraped data.
-        :param results: DataFrame to store the scrape job results.
+        Scrape one chart of the source.
+        Charts in the chart cache are not scraped again, their rows keep the time they were scraped.
+        Otherwise the HTTP fast path is tried first (fetch_mode "auto"),
+        the page is rendered with the browser if it is not available or fails.
+        Transient failures of both are retried with the retry policy.
+        Timings, rows and bytes of the chart are recorded in `metrics`.
+        :param rows: Buffer to store the scraped chart rows.
+        :param results: Buffer to store the scrape job results.
         :param country_code: Country code for the data to be scraped.
         :param sort_by: Sorting criteria for the data to be scraped.
         :param platform: Platform for which the data is being scraped.
-        :return: Tuple of DataFrames (df, results).
+        :return: Tuple of buffers (rows, results).
+        """
+        results, job_id, scrape_date, job_result = self._create_job_entry(
+            results, self.source, sort_by, country_code, platform
+        )
+
+        cache_key = (self.source, platform, country_code, sort_by)
+        chart = f"{self.source} {platform}/{country_code}/{sort_by}"
+
+        with self.metrics.chart(cache_key) as chart_metrics:
+            try:
+                entries = None
+                cached = self.chart_cache.get(cache_key) if self.chart_cache is not None else None
+                if cached is not None:
+                    entries = cached.entries
+                    chart_metrics.method = "cache"
+                    # Rows and job status carry the time the chart was actually scraped
+                    if cached.scraped_at:
+                        scrape_date = cached.scraped_at
+                        results.update(job_id, scraped_at=scrape_date)
+                    logger.info(f"Using cached chart {chart} scraped at {scrape_date}")
+                elif self.fetch_mode == "auto":
+                    try:
+                        entries = self.retry_policy.run(
+                            lambda: self._scrape_with_http(country_code, sort_by, platform),
+                            f"HTTP fetch of {chart}"
+                        )
+                        if entries is not None:
+                            chart_metrics.method = "http"
+                    except Exception as e:
+                        logger.warning(
+                            f"HTTP fetch of {chart} failed, "
+                            f"falling back to the browser: {e}"
+                        )
+
+                if entries is None:
+                    entries = self.retry_policy.run(
+                        lambda: self._scrape_with_browser(country_code, sort_by, platform),
+                        f"Browser scrape of {chart}"
+                    )
+
+                if self.chart_cache is not None:
+                    self.chart_cache.put(cache_key, entries)
+
+                for rank, entry in enumerate(entries, start=1):
+                    rows.append(
+                        job_id=job_id,
+                        source=self.source,
+                        rank=rank,
+                        sort_by=sort_by,
+                        country=country_code,
+                        itunes_id=entry.get("itunes_id", ""),
+                        podcast_title=entry["podcast_title"],
+                        platform=platform,
+                        scraped_at=scrape_date
+                    )
+                job_result = 'success'
+                chart_metrics.rows = len(entries)
+
+            except Exception as e:
+                logger.error(f"Error scraping {self.source} charts: {e}")
+
+            finally:
+                # update the job result in the results buffer
+                results.update(job_id, status=job_result)
+                chart_metrics.status = job_result
+
+        return rows, results
+
+
+
+    def _scrape_with_http(
+            self,
+            country_code: str,
+            sort_by: str,
+            platform: str
+        ) -> Optional[ChartEntries]:
+        """
+        HTTP fast path, parse the chart without rendering the page.
+        Override in subclasses whose data is available as HTML / JSON.
+        :return: Chart entries in rank order, None if not available (browser is used).
+        """
+        return None
+
+
+
+    def _scrape_with_browser(
+            self,
+            country_code: str,
+            sort_by: str,
+            platform: str
+        ) -> ChartEntries:
+        """
+        Render the chart page with Playwright and parse it.
+        This method should be implemented by subclasses.
+        :return: Chart entries in rank order.
         :raises NotImplementedError: If the method is not implemented in a subclass.
         """
         raise NotImplementedError(
-            "Subclasses must implement the scrape method."
+            "Subclasses must implement the _scrape_with_browser method."
         )
+
+
+
+    def _fetch(
+            self,
+            url: str,
+            as_json: bool = False
+        ) -> Any:
+        """
+        GET the url with the pooled HTTP client, rate limited per domain.
+        The outcome adapts the domain's rate, the time and size are added to the chart's metrics.
+        """
+        Validate.non_empty_string(url, "url")
+        self.metrics.add_time("throttle_wait", self.throttle.wait(url))
+        try:
+            with self.metrics.span("http_fetch"):
+                if as_json:
+                    response = self.fetcher.get(url, headers={"Accept": "application/json"})
+                else:
+                    response = self.fetcher.get(url)
+        except Exception as e:
+            self._report_failure(url, e)
+            raise
+        self.throttle.on_success(url)
+        self.metrics.add_bytes(len(response.content))
+        return response.json() if as_json else response.text
+
+
+
+    def _report_failure(
+            self,
+            url: str,
+            error: BaseException
+        ) -> None:
+        """
+        Slow the domain down when it throttles us (429 / 5xx / timeouts).
+        """
+        if is_retryable(error):
+            self.throttle.on_throttled(url, error_retry_after(error))
     
 
 
+    @classmethod
+    def iter_jobs(
+            cls,
+            platforms: Optional[list[str]] = None,
+            countries: Optional[list[str]] = None
+        ) -> Iterator[tuple[str, str, str]]:
+        """
+        Yield the (platform, country, genre) chart jobs of the source.
+        Override this method in subclasses if iteration logic is different.
+        :param platforms: Platforms to scrape, all if None.
+        :param countries: Countries to scrape, all if None.
+        """
+        for platform in cls.platforms if platforms is None else platforms:
+            for country in cls.countries if countries is None else countries:
+                for genre in cls.genres:
+                    yield platform, country, genre
+
+
+
     def scrape_all(
             self,
-            df: pd.DataFrame,
-            results: pd.DataFrame
-        ) -> tuple[pd.DataFrame, pd.DataFrame]:
+            rows: RecordBuffer,
+            results: RecordBuffer
+        ) -> tuple[RecordBuffer, RecordBuffer]:
         """
         Scrape data from all sources.
         This method can be used to scrape data from multiple sources.
-        Override this method in subclasses if iteration logic is different.
-        :param df: DataFrame to store the scraped data.
-        :param results: DataFrame to store the scrape job results.
-        :return: Tuple of DataFrames (df, results).
+        Jobs come from `iter_jobs`, page loads are rate limited per domain.
+        :param rows: Buffer to store the scraped chart rows.
+        :param results: Buffer to store the scrape job results.
+        :return: Tuple of buffers (rows, results).
         """
         Validate.is_instance(
-            df, pd.DataFrame, "df"
+            rows, RecordBuffer, "rows"
         )
         Validate.is_instance(
-            results, pd.DataFrame, "results"
+            results, RecordBuffer, "results"
         )
 
-        for platform in self.platforms if self.available_platforms is None else self.available_platforms:
-            for country in self.countries if self.available_countries is None else self.available_countries:
-                for genre in self.genres:
-                    # Introduce a random delay to avoid rate limiting
-                    # This adds a delay between 0.0 and 0.4 seconds
-                    time.sleep(random.uniform(0.2, 0.5))
-                    df, results = self.scrape(
-                        df=df,
-                        results=results,
-                        country_code=country,
-                        sort_by=genre,
-                        platform=platform
-                    )
-                    
-        return df, results
+        start = time.perf_counter()
+        for platform, country, genre in self.iter_jobs(
+            platforms=self.available_platforms,
+            countries=self.available_countries
+        ):
+            rows, results = self.scrape(
+                rows=rows,
+                results=results,
+                country_code=country,
+                sort_by=genre,
+                platform=platform
+            )
+        self.metrics.record_run(self.source, time.perf_counter() - start)
+
+        return rows, results
     
 
     
     def _create_job_entry(
             self,
-            results: pd.DataFrame,
+            results: RecordBuffer,
             source: str,
             sort_by: str,
             country_code: str,
             platform: str,
-            scrape_date: str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time())),
+            scrape_date: Optional[str] = None,
             job_result: str = 'failed'
         ) -> tuple:
         """        
-        Creates a new job entry in the results DataFrame. """
-
-        # 1. Append a new job to the results DataFrame
-        results = results._append({
-            "source": source,
-            "sort_by": sort_by,
-            "country": country_code,
-            "platform": platform,
-            "scraped_at": scrape_date,
-            "status": job_result
-        }, ignore_index=True)
+        Creates a new job entry in the results buffer, job_id is its index. """
+        # Evaluated per job, not once at import time
+        scrape_date = scrape_date or time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time()))
 
-        # 2. Get index of that job
-        job_id = results.index[-1]
+        job_id = results.append(
+            source=source,
+            sort_by=sort_by,
+            country=country_code,
+            platform=platform,
+            scraped_at=scrape_date,
+            status=job_result
+        )
 
         return results, job_id, scrape_date, job_result
     
 
 
-    def _get_context_and_page(
-            self
-        ) -> tuple:
-        """
-        Creates a new browser context and page with a specific user agent.
-        This method is used to ensure that each scrape starts with a fresh context.
-        """
-        context = self.browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/116.0.0.0 Safari/537.36"
-            )
-        )
-
-        # ✅ Create a fresh page for each scrape
-        page = context.new_page()
-
-        return context, page
-    
-
-        
+    @contextmanager
     def _load_page(
             self,
             goto_url: str,
             wait_for_selector: str,
             wait_until: str = "networkidle",
             timeout: int = 10000
-        ) -> tuple:
+        ) -> Iterator:
         """ 
-        Loads a page and waits for a specific selector to be visible."""
+        Loads a page of a pooled browser context and waits for a specific selector to be visible.
+        The page is closed (and a failed context recycled) when the block exits.
+        Throttle wait, navigation, selector wait and the time spent in the block (parse)
+        are recorded in `metrics`, bytes from the Content-Length of the page's responses.
+
+        Usage:
+            with self._load_page(url, "table tr") as page:
+                rows = page.query_selector_all("table tr")
+        """
 
         Validate.non_empty_string(goto_url, "goto_url")
         Validate.non_empty_string(wait_for_selector, "wait_for_selector")
         Validate.non_empty_string(wait_until, "wait_until")
 
-        context, page = self._get_context_and_page()
-        page.goto(goto_url, wait_until=wait_until)
-        page.wait_for_selector(wait_for_selector, timeout=timeout)
-        return context, page
\ No newline at end of file
+        # Rate limit per domain (not a global sleep),
+        # other sites scraped concurrently are not slowed down
+        self.metrics.add_time("throttle_wait", self.throttle.wait(goto_url))
+
+        with self.context_pool.page() as page:
+            page.on("response", self._count_response_bytes)
+            try:
+                with self.metrics.span("navigation"):
+                    response = page.goto(goto_url, wait_until=wait_until)
+                # Playwright does not raise on error statuses
+                if response is not None and response.status >= 400:
+                    raise HttpStatusError(
+                        goto_url,
+                        response.status,
+                        parse_retry_after(response.headers.get("retry-after"))
+                    )
+                with self.metrics.span("wait_for_selector"):
+                    page.wait_for_selector(wait_for_selector, timeout=timeout)
+            except Exception as e:
+                self._report_failure(goto_url, e)
+                raise
+            self.throttle.on_success(goto_url)
+            with self.metrics.span("parse"):
+                yield page
+
+
+
+    def _count_response_bytes(
+            self,
+            response
+        ) -> None:
+        """
+        Page response handler, adds the Content-Length (transferred, compressed size)
+        to the chart's bytes. Chunked responses without the header are not counted.
+        """
+        try:
+            self.metrics.add_bytes(int(response.headers.get("content-length", 0)))
+        except (TypeError, ValueError):
+            pass
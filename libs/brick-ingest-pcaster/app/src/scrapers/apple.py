@@ -1,7 +1,6 @@
-import pandas as pd
 from app.src.logging_config import logger
-from app.src.scrapers.abstract import AbstractScraper
-from typing import Literal
+from app.src.scrapers.abstract import AbstractScraper, ChartEntries
+from typing import Optional
 
 
 class ApplePodcastsScraper(AbstractScraper):
@@ -9,37 +8,55 @@ class ApplePodcastsScraper(AbstractScraper):
     Playwright Scraper for Apple Podcasts Charts
     [https://podcasts.apple.com/us/charts]
     """
+    source = "apple_podcasts"
     base_url = "https://podcasts.apple.com"
+    # Public JSON feed of the same charts, used by the HTTP fast path
+    feed_url = "https://rss.applemarketingtools.com/api/v2"
+    chart_limit = 100
     platforms = ["apple"]
     countries = ["us", "pl"]
     genres = ["top_podcasts"]  # Apple Podcasts only has top podcasts
 
 
-    def scrape(
+    def _scrape_with_http(
             self,
-            df: pd.DataFrame,
-            results: pd.DataFrame,
-            country_code: Literal["pl", "us"] = "us",
-            sort_by: Literal[ 
-                "top_podcasts"  # , "business", "news", "science", "technology"
-            ] = "top_podcasts", # irrelevant for Apple Podcasts
-            platform: Literal["apple"] = "apple"
-        ) -> tuple[pd.DataFrame, pd.DataFrame]:
+            country_code: str,
+            sort_by: str,
+            platform: str
+        ) -> Optional[ChartEntries]:
         """
-        Scrapes the top podcasts from Apple Podcasts charts.
+        Reads the Top Shows chart from Apple's public JSON feed,
+        which also carries the iTunes ids.
         """
-
-        source = "apple_podcasts"
-        results, job_id, scrape_date, job_result = self._create_job_entry(
-            results, source, sort_by, country_code, platform
+        data = self._fetch(
+            f"{self.feed_url}/{country_code}/podcasts/top/{self.chart_limit}/podcasts.json",
+            as_json=True
         )
+        feed = data.get("feed", {}).get("results", [])
+        if not feed:
+            return None
+
+        logger.info("Scraping Apple Podcasts charts (JSON feed)...")
+        return [
+            {"podcast_title": podcast["name"], "itunes_id": podcast.get("id", "")}
+            for podcast in feed
+        ]
 
-        try: 
-            context, page = self._load_page(
-                goto_url=f"{self.base_url}/{country_code}/charts",
-                wait_for_selector="div[aria-label='Top Shows']"
-            )
 
+
+    def _scrape_with_browser(
+            self,
+            country_code: str,
+            sort_by: str,
+            platform: str
+        ) -> ChartEntries:
+        """
+        Scrapes the top podcasts from Apple Podcasts charts.
+        """
+        with self._load_page(
+            goto_url=f"{self.base_url}/{country_code}/charts",
+            wait_for_selector="div[aria-label='Top Shows']"
+        ) as page:
             # Get top shows titles
             """
             <div aria-label="Top Shows">
@@ -58,34 +75,12 @@ class ApplePodcastsScraper(AbstractScraper):
 
             logger.info("Scraping Apple Podcasts charts...")
 
-            rank = 1
-            for title_element in titles:
-                title = title_element.inner_text()
-
-                df = df._append({
-                    "job_id": job_id,
-                    "source": source,
-                    "rank": rank,
-                    "sort_by": sort_by,
-                    "country": country_code,
-                    "itunes_id": "",  # Podchaser ID can be extracted from the link if needed
-                    "podcast_title": title,
-                    "platform": platform,
-                    "scraped_at": scrape_date
-                }, ignore_index=True)
-
-                rank += 1
-
-            page.close()  
-            context.close()  
-            job_result = 'success'
-
-        except Exception as e:
-            logger.error(f"Error scraping Apple Podcasts charts: {e}")
-
-        finally:
-            # update the job result in the results DataFrame
-            results.at[job_id, "status"] = job_result
-
+            entries = [
+                {
+                    "podcast_title": title_element.inner_text(),
+                    "itunes_id": ""  # iTunes ID can be extracted from the link if needed
+                }
+                for title_element in titles
+            ]
 
-        return df, results
\ No newline at end of file
+        return entries
@@ -1,8 +1,6 @@
 import time
-import pandas as pd
 from app.src.logging_config import logger
-from app.src.scrapers.abstract import AbstractScraper
-from typing import Literal
+from app.src.scrapers.abstract import AbstractScraper, ChartEntries
 
 """
 Playwright Scrapper for Podchaser Charts 
@@ -11,43 +9,33 @@ Playwright Scrapper for Podchaser Charts
 """
 
 class PodchaserScraper(AbstractScraper):
+    source = "podchaser"
     base_url = "https://www.podchaser.com/charts"
     platforms = ["apple", "spotify"]
     countries = ["us", "pl"]
     genres = ["top_podcasts", "news"] # "business", "science", "technology"
 
-    def scrape(
+    def _scrape_with_browser(
             self,
-            df: pd.DataFrame,
-            results: pd.DataFrame,
-            country_code: Literal["pl", "us"] = "us",
-            sort_by: Literal[ 
-                "top_podcasts", "business", "news", "science", "technology"
-            ] = "top_podcasts",
-            platform: Literal["apple", "spotify"] = "apple"
-        ) -> tuple[pd.DataFrame, pd.DataFrame]:
+            country_code: str,
+            sort_by: str,
+            platform: str
+        ) -> ChartEntries:
         """
         Scrapes the top podcasts from Podchaser charts.
+        The chart table is rendered client side, there is no HTTP fast path.
         """
-
-        source = "podchaser"
-        results, job_id, scrape_date, job_result = self._create_job_entry(
-            results, source, sort_by, country_code, platform
-        )
-
-        try: 
-            context, page = self._load_page(
-                goto_url=f"{self.base_url}/{platform}/{country_code}/{sort_by.replace('_', '%20')}?date={time.strftime('%Y-%m-%d')}",
-                wait_for_selector="table tr"
-            )
-
+        with self._load_page(
+            goto_url=f"{self.base_url}/{platform}/{country_code}/{sort_by.replace('_', '%20')}?date={time.strftime('%Y-%m-%d')}",
+            wait_for_selector="table tr"
+        ) as page:
             # Get table rows
-            rows = page.query_selector_all("table tr")
+            table_rows = page.query_selector_all("table tr")
 
             logger.info("Scraping Podchaser charts...")
 
-            rank = 1
-            for row in rows:
+            entries = []
+            for row in table_rows:
                 """
                 The structure of the row is as follows:
                 <a data-testid="podcastTitle" href="..." class="...">
@@ -61,34 +49,10 @@ class PodchaserScraper(AbstractScraper):
                 title_element = row.query_selector("td:nth-child(2) a[data-testid='podcastTitle']")
 
                 if title_element:
-                    title = title_element.inner_text()
                     # link = title_element.get_attribute("href")
+                    entries.append({
+                        "podcast_title": title_element.inner_text(),
+                        "itunes_id": ""  # Podchaser ID can be extracted from the link if needed
+                    })
 
-                    # podcasts DataFrame
-                    df = df._append({
-                        "job_id": job_id,
-                        "source": source,
-                        "rank": rank,
-                        "sort_by": sort_by,
-                        "country": country_code,
-                        "itunes_id": "",  # Podchaser ID can be extracted from the link if needed
-                        "podcast_title": title,
-                        "platform": platform,
-                        "scraped_at": scrape_date
-                    }, ignore_index=True)
-
-                    rank += 1
-            
-            page.close() 
-            context.close()  
-            job_result = 'success'
-
-        except Exception as e:
-            logger.error(f"Error scraping Podchaser charts: {e}")
-
-        finally:
-            # update the job result in the results DataFrame
-            results.at[job_id, "status"] = job_result
-
-        
-        return df, results
\ No newline at end of file
+        return entries
@@ -1,9 +1,8 @@
-import time, random
-import pandas as pd
+import json
+import re
 from app.src.logging_config import logger
-from app.src.scrapers.abstract import AbstractScraper
-from typing import Literal
-from app.src.utils import Validate
+from app.src.scrapers.abstract import AbstractScraper, ChartEntries
+from typing import Iterator, Optional
 
 """
 PLaywright Scraper for Rephonic Charts
@@ -11,7 +10,14 @@ PLaywright Scraper for Rephonic Charts
 
 """
 
+_NEXT_DATA_PATTERN = re.compile(
+    r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>',
+    re.DOTALL
+)
+
+
 class RephonicScraper(AbstractScraper):
+    source = "rephonic"
     base_url = "https://rephonic.com/charts"
     platforms = [
         "spotify", 
@@ -190,105 +196,126 @@ class RephonicScraper(AbstractScraper):
         # "de": "germany",
     }
 
-    def scrape_all(
+    @classmethod
+    def iter_jobs(
+            cls,
+            platforms: Optional[list[str]] = None,
+            countries: Optional[list[str]] = None
+        ) -> Iterator[tuple[str, str, str]]:
+        """
+        Custom iteration, countries and genres are configured per platform.
+        """
+        for platform in cls.platforms:
+            if platforms is not None and platform not in platforms:
+                continue
+            for country in cls.countries[platform]:
+                if countries is not None and country not in countries:
+                    continue
+                for genre in cls.genres[platform]:
+                    yield platform, country, genre
+
+
+
+    def _chart_url(
             self,
-            df: pd.DataFrame,
-            results: pd.DataFrame
-        ) -> tuple[pd.DataFrame, pd.DataFrame]:
+            country_code: str,
+            sort_by: str,
+            platform: str
+        ) -> str:
+        # Construct the URL based on the platform, country, and genre
+        genre_name = sort_by.replace("&_", "").replace("_", "-") 
+        return f"{self.base_url}/{platform}/{self.country_names[country_code]}/{genre_name}"
+
+
+
+    @staticmethod
+    def _parse_next_data(
+            json_data: str
+        ) -> ChartEntries:
         """
-        Custom method to scrape all combinations of platforms, countries, and genres.
+        The structure of the page is complex, so we need to navigate through it carefully.
+        The main chart container is a script tag with id "__NEXT_DATA__" that contains JSON data.
+        Example structure:
+        <script id="__NEXT_DATA__" type="application/json">
+            {
+                "props": {
+                    "pageProps": {
+                        "platformId":"spotify",
+                        "countrySlug":"united-states",
+                        "categoryId":"top-podcasts",
+                        "podcasts":[
+                            {
+                                "id":"the-joe-rogan-experience",
+                                "position":1,
+                                "change":0,
+                                "itunes_id":360084272,
+                                "name":"The Joe Rogan Experience",
+                                "guests":true,
+                                "sponsored":true,
+                                "publisher": {
+                                    "id":"joe-rogan",
+                                    "name":"Joe Rogan"
+                                },
+                                "artwork_url":"https://img.rephonic.com/artwork/the-joe-rogan-experience.jpg?width=600\u0026height=600\u0026quality=95",
+                                "artwork_thumbnail_url":"https://img.rephonic.com/artwork/the-joe-rogan-experience.jpg?width=70\u0026height=70\u0026quality=95",
+                                "key":"0-the-joe-rogan-experience"
+                            }, 
+                            ...
+                        ]
+                    }
+                }
+            }
+        </script>
         """
+        data = json.loads(json_data)
 
-        Validate.is_instance(
-            df, pd.DataFrame, "df"
-        )
+        # Extract the podcasts from the JSON data
+        return [
+            {"podcast_title": podcast['name'], "itunes_id": podcast['itunes_id']}
+            for podcast in data['props']['pageProps']['podcasts']
+        ]
 
-        Validate.is_instance(
-            results, pd.DataFrame, "results"
-        )
 
-        for platform in self.platforms:
-            for country in self.countries[platform]:
-                for genre in self.genres[platform]:
-                    # Sleep to avoid being blocked by the website
-                    time.sleep(random.uniform(0.2, 0.5))
-                    df, results = self.scrape(
-                        df=df,
-                        results=results,
-                        country_code=country,
-                        sort_by=genre,
-                        platform=platform
-                    )
-                    
-        return df, results
 
-    def scrape(
+    def _scrape_with_http(
             self,
-            df: pd.DataFrame,
-            results: pd.DataFrame,
-            country_code: Literal["pl", "us"] = "us",
-            sort_by: Literal[ 
-                "top_podcasts", "trending",
-            ] = "top_podcasts",
-            platform: Literal["spotify"] = "spotify"
-        ) -> tuple[pd.DataFrame, pd.DataFrame]:
+            country_code: str,
+            sort_by: str,
+            platform: str
+        ) -> Optional[ChartEntries]:
         """
-        Scrapes the top podcasts from Podchaser charts.
+        The chart is server rendered (Next.js), the `__NEXT_DATA__` payload
+        is read from the raw HTML without rendering the page.
         """
+        html = self._fetch(self._chart_url(country_code, sort_by, platform))
+        match = _NEXT_DATA_PATTERN.search(html)
+        if not match:
+            return None
 
-        source = "rephonic"
-        results, job_id, scrape_date, job_result = self._create_job_entry(
-            results, source, sort_by, country_code, platform
-        )
+        logger.info("Scraping Rephonic charts (HTTP)...")
+        return self._parse_next_data(match.group(1))
 
-        try: 
-            # Construct the URL based on the platform, country, and genre
-            genre_name = sort_by.replace("&_", "").replace("_", "-") 
-            context, page = self._load_page(
-                goto_url=f"{self.base_url}/{platform}/{self.country_names[country_code]}/{genre_name}",
-                wait_for_selector="div[role='list']", # <-- don't touch it, it works this way, no questions asked
-            )
 
+
+    def _scrape_with_browser(
+            self,
+            country_code: str,
+            sort_by: str,
+            platform: str
+        ) -> ChartEntries:
+        """
+        Scrapes the top podcasts from Rephonic charts.
+        """
+        with self._load_page(
+            goto_url=self._chart_url(country_code, sort_by, platform),
+            wait_for_selector="div[role='list']", # <-- don't touch it, it works this way, no questions asked
+        ) as page:
             # # Get the page content for debugging
             # pc = page.content()
             # with open("tmp/debug_rephonic.html", "w", encoding="utf-8") as f:
             #     f.write(pc)            
 
-            """
-            The structure of the page is complex, so we need to navigate through it carefully.
-            The main chart container is a script tag with id "__NEXT_DATA__" that contains JSON data.
-            Example structure:
-            <script id="__NEXT_DATA__" type="application/json">
-                {
-                    "props": {
-                        "pageProps": {
-                            "platformId":"spotify",
-                            "countrySlug":"united-states",
-                            "categoryId":"top-podcasts",
-                            "podcasts":[
-                                {
-                                    "id":"the-joe-rogan-experience",
-                                    "position":1,
-                                    "change":0,
-                                    "itunes_id":360084272,
-                                    "name":"The Joe Rogan Experience",
-                                    "guests":true,
-                                    "sponsored":true,
-                                    "publisher": {
-                                        "id":"joe-rogan",
-                                        "name":"Joe Rogan"
-                                    },
-                                    "artwork_url":"https://img.rephonic.com/artwork/the-joe-rogan-experience.jpg?width=600\u0026height=600\u0026quality=95",
-                                    "artwork_thumbnail_url":"https://img.rephonic.com/artwork/the-joe-rogan-experience.jpg?width=70\u0026height=70\u0026quality=95",
-                                    "key":"0-the-joe-rogan-experience"
-                                }, 
-                                ...
-                            ]
-                        }
-                    }
-                }
-            </script>
-            """
+            entries = []
 
             # Get the main chart container
             next_script = page.query_selector("script#__NEXT_DATA__")
@@ -296,43 +323,6 @@ class RephonicScraper(AbstractScraper):
                 logger.info("Scraping Rephonic charts...")
 
                 # Get the JSON data from the script tag
-                json_data = next_script.inner_text()
-                import json
-                data = json.loads(json_data)
-
-                # Extract the podcasts from the JSON data
-                podcasts = data['props']['pageProps']['podcasts']
-
-                rank = 1
-                for podcast in podcasts:
-                    title = podcast['name']
-                    podcast_id = podcast['itunes_id']
-
-                    # podcasts DataFrame
-                    df = df._append({
-                        "job_id": job_id,  # Add job_id to the DataFrame
-                        "source": source,
-                        "rank": rank,
-                        "sort_by": sort_by,
-                        "country": country_code,
-                        "itunes_id": podcast_id,
-                        "podcast_title": title,
-                        "platform": platform,
-                        "scraped_at": scrape_date
-                    }, ignore_index=True)
-
-                    rank += 1
- 
-            page.close()
-            context.close()
-            job_result = 'success'
-
-        except Exception as e:
-            logger.error(f"Error scraping Podchaser charts: {e}")
-
-        finally:
-            # update the job result in the results DataFrame
-            results.at[job_id, "status"] = job_result
+                entries = self._parse_next_data(next_script.inner_text())
 
-        
-        return df, results
\ No newline at end of file
+        return entries
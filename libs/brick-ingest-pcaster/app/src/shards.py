@@ -0,0 +1,262 @@
+import datetime
+import re
+from typing import Callable, Optional
+import pandas as pd
+from app.src.logging_config import logger
+
+# Shard names end up in storage keys
+SHARD_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def validate_shard_name(
+        shard: str
+    ) -> str:
+    if not SHARD_NAME_PATTERN.match(shard or ""):
+        raise ValueError(f"Invalid shard name: {shard!r}, use letters, digits, '_' or '-'.")
+    return shard
+
+
+def shard_part_path(
+        sink_dir: str,
+        date: str,
+        table: str,
+        shard: str
+    ) -> str:
+    """
+    Key of a shard's part of a table, e.g. `date=D/top_podcasts/part-<shard>.parquet`.
+    """
+    return f"{sink_dir}/date={date}/{table}/part-{shard}.parquet"
+
+
+def shard_blob_paths(
+        sink_dir: str,
+        date: str,
+        shard: str
+    ) -> tuple[str, str]:
+    """
+    (top_podcasts, scrape_job_status) part keys of a shard in the date partition.
+    """
+    return (
+        shard_part_path(sink_dir, date, "top_podcasts", shard),
+        shard_part_path(sink_dir, date, "scrape_job_status", shard)
+    )
+
+
+def merge_shards(
+        parts: list[tuple[pd.DataFrame, pd.DataFrame]]
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Concatenate the (top_podcasts, scrape_job_status) parts of the shards.
+    job_ids of each shard start at 0, they are shifted by the number of jobs
+    of the preceding shards so they stay the index of the merged status table.
+    :return: Tuple of DataFrames (top_podcasts, scrape_job_status).
+    """
+    podcasts, statuses = [], []
+    offset = 0
+    for df_podcasts, df_status in parts:
+        podcasts.append(df_podcasts.assign(job_id=df_podcasts["job_id"] + offset))
+        statuses.append(df_status)
+        offset += len(df_status)
+
+    return (
+        pd.concat(podcasts, ignore_index=True).convert_dtypes(),
+        pd.concat(statuses, ignore_index=True).convert_dtypes()
+    )
+
+
+class ShardCommitter:
+    """
+    Commit step of a sharded scrape.
+    Once every expected shard wrote its parts, the parts are merged into the
+    regular `top_podcasts.parquet` and `scrape_job_status.parquet` of the date
+    (consumers read them unchanged) and scrape metrics into `scrape_metrics.parquet`,
+    a `manifest.json` describing the shards is written next to them
+    and `latest.json` is published last.
+    Nothing is published while a shard is missing.
+    """
+
+    def __init__(
+            self,
+            storage_client,
+            container_name: str,
+            sink_dir: str,
+            shards: list[str],
+            date: Optional[str] = None,
+            runner: Optional[Callable] = None
+        ):
+        """
+        :param storage_client: storage_lib client (StorageClient / LocalStorageClient).
+        :param shards: Names of the shards expected in the date partition.
+        :param date: Date partition (YYYY-MM-DD), today (UTC) if None.
+        :param runner: Retry wrapper of the uploads (helpers.retry_upload), uploads run once if None.
+        """
+        if not shards:
+            raise ValueError("At least one shard is required.")
+
+        self.storage_client = storage_client
+        self.container_name = container_name
+        self.sink_dir = sink_dir
+        self.shards = sorted({validate_shard_name(shard) for shard in shards})
+        self._now = datetime.datetime.now(datetime.UTC)
+        self.date = date or self._now.strftime("%Y-%m-%d")
+        self.runner = runner or (lambda func, *args, **kwargs: func(*args, **kwargs))
+
+        base = f"{sink_dir}/date={self.date}"
+        self.podcasts_blob_path = f"{base}/top_podcasts.parquet"
+        self.results_blob_path = f"{base}/scrape_job_status.parquet"
+        self.metrics_blob_path = f"{base}/scrape_metrics.parquet"
+        self.manifest_blob_path = f"{base}/manifest.json"
+        self.latest_blob_path = f"{sink_dir}/latest.json"
+
+
+    def missing_shards(
+            self
+        ) -> list[str]:
+        """
+        Expected shards without both parts in storage.
+        """
+        keys = {
+            shard: shard_blob_paths(self.sink_dir, self.date, shard)
+            for shard in self.shards
+        }
+        existing = self.storage_client.exists_many(
+            container_name=self.container_name,
+            storage_keys=[key for paths in keys.values() for key in paths]
+        )
+        return [
+            shard for shard, paths in keys.items()
+            if not all(existing[key].unwrap() for key in paths)
+        ]
+
+
+    def _merge_metrics(
+            self
+        ) -> Optional[pd.DataFrame]:
+        """
+        Scrape metrics parts of the shards, slowest charts first. None if no shard wrote any.
+        Metrics are diagnostics, a missing part does not block the commit.
+        """
+        keys = [
+            shard_part_path(self.sink_dir, self.date, "scrape_metrics", shard)
+            for shard in self.shards
+        ]
+        existing = self.storage_client.exists_many(
+            container_name=self.container_name,
+            storage_keys=keys
+        )
+        frames = [
+            self.storage_client.read_parquet(container_name=self.container_name, storage_key=key)
+            for key in keys if existing[key].ok and existing[key].value
+        ]
+        if not frames:
+            return None
+        return (
+            pd.concat(frames, ignore_index=True)
+            .sort_values("duration_s", ascending=False, ignore_index=True)
+            .convert_dtypes()
+        )
+
+
+    def _stamp_time(
+            self
+        ) -> datetime.datetime:
+        """
+        Time written to latest.json, it must point at the committed date partition.
+        """
+        if self._now.strftime("%Y-%m-%d") == self.date:
+            return self._now
+        return datetime.datetime.strptime(self.date, "%Y-%m-%d").replace(tzinfo=datetime.UTC)
+
+
+    def commit(
+            self
+        ) -> dict:
+        """
+        Merge the shard parts and publish the manifest and latest.json.
+        :return: The manifest.
+        :raises RuntimeError: If a shard has not finished yet.
+        """
+        missing = self.missing_shards()
+        if missing:
+            raise RuntimeError(
+                f"Shards not finished for date={self.date}: {', '.join(missing)}. Nothing published."
+            )
+
+        parts, manifest_shards = [], {}
+        for shard in self.shards:
+            podcasts_key, results_key = shard_blob_paths(self.sink_dir, self.date, shard)
+            df_podcasts = self.storage_client.read_parquet(
+                container_name=self.container_name,
+                storage_key=podcasts_key
+            )
+            df_status = self.storage_client.read_parquet(
+                container_name=self.container_name,
+                storage_key=results_key
+            )
+            parts.append((df_podcasts, df_status))
+            manifest_shards[shard] = {
+                "top_podcasts": podcasts_key,
+                "scrape_job_status": results_key,
+                "rows": len(df_podcasts),
+                "jobs": len(df_status),
+                "failed_jobs": int((df_status["status"] != "success").sum())
+            }
+
+        df_top_podcasts, df_scrape_results = merge_shards(parts)
+        df_metrics = self._merge_metrics()
+
+        self.runner(
+            self.storage_client.upload_df_as_parquet,
+            container_name=self.container_name,
+            storage_key=self.podcasts_blob_path,
+            df=df_top_podcasts,
+            skip_unchanged=True
+        )
+        self.runner(
+            self.storage_client.upload_df_as_parquet,
+            container_name=self.container_name,
+            storage_key=self.results_blob_path,
+            df=df_scrape_results,
+            skip_unchanged=True
+        )
+
+        if df_metrics is not None:
+            self.runner(
+                self.storage_client.upload_df_as_parquet,
+                container_name=self.container_name,
+                storage_key=self.metrics_blob_path,
+                df=df_metrics,
+                skip_unchanged=True
+            )
+
+        manifest = {
+            "date": self.date,
+            "committed_at": datetime.datetime.now(datetime.UTC).isoformat(),
+            "top_podcasts": self.podcasts_blob_path,
+            "scrape_job_status": self.results_blob_path,
+            "rows": len(df_top_podcasts),
+            "jobs": len(df_scrape_results),
+            "shards": manifest_shards
+        }
+        self.runner(
+            self.storage_client.upload_json,
+            storage_key=self.manifest_blob_path,
+            data=manifest,
+            container_name=self.container_name,
+            overwrite=True
+        )
+
+        # Published last, consumers only see complete partitions
+        self.runner(
+            self.storage_client.upload_timestamp,
+            container_name=self.container_name,
+            storage_key=self.latest_blob_path,
+            utc_time=self._stamp_time(),
+            overwrite=True
+        )
+
+        logger.info(
+            f"Committed {len(self.shards)} shards ({len(df_top_podcasts)} rows, "
+            f"{len(df_scrape_results)} jobs) to {self.container_name}/{self.sink_dir}/date={self.date}"
+        )
+        return manifest
@@ -0,0 +1,179 @@
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+# Default pace of a domain without an explicit rate (requests / second)
+DEFAULT_RATE = 2.0
+# Requests that may be sent back to back before the rate applies
+DEFAULT_BURST = 2
+# Adaptive limits: additive increase per success, multiplicative decrease when throttled
+DEFAULT_RATE_INCREASE = 0.1
+DEFAULT_RATE_DECREASE = 0.5
+DEFAULT_MIN_RATE = 0.1
+
+# Starting rates of the scraped sites, tuned down for the browser rendered ones
+DOMAIN_RATES = {
+    "podchaser.com": 1.0,
+    "rephonic.com": 2.0,
+    "podcasts.apple.com": 2.0,
+    "rss.applemarketingtools.com": 5.0,
+}
+
+
+class _Bucket:
+    __slots__ = ("rate", "max_rate", "tokens", "updated", "blocked_until")
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int,
+            now: float
+        ):
+        self.rate = rate
+        self.max_rate = rate * 2
+        self.tokens = float(burst)
+        self.updated = now
+        self.blocked_until = 0.0
+
+
+class DomainThrottle:
+    """
+    Thread safe adaptive rate limiter keyed by domain (token bucket per domain).
+    Each request takes a token, tokens refill at the domain's rate up to `burst`.
+    The rate adapts AIMD style: it grows by `increase` after each successful
+    request (up to twice the starting rate) and is multiplied by `decrease`
+    on 429 / 5xx / timeouts, a Retry-After pauses the whole domain.
+    Different domains do not wait for each other,
+    so concurrent workers scraping different sites run at full speed.
+
+    Usage:
+        throttle.wait(url)
+        try:
+            fetch(url)
+        except ...:
+            throttle.on_throttled(url, retry_after)
+        else:
+            throttle.on_success(url)
+    """
+
+    def __init__(
+            self,
+            rate: float = DEFAULT_RATE,
+            burst: int = DEFAULT_BURST,
+            rates: Optional[Dict[str, float]] = None,
+            increase: float = DEFAULT_RATE_INCREASE,
+            decrease: float = DEFAULT_RATE_DECREASE,
+            min_rate: float = DEFAULT_MIN_RATE
+        ):
+        """
+        :param rate: Starting requests per second of domains not in `rates`.
+        :param burst: Bucket capacity.
+        :param rates: Starting rates per domain, e.g. {"podchaser.com": 1.0}.
+        :param increase: Requests per second added after a successful request.
+        :param decrease: Factor applied to the rate when the domain throttles us.
+        :param min_rate: Lower bound of the adaptive rate.
+        """
+        if rate <= 0 or min_rate <= 0 or burst < 1:
+            raise ValueError("rate and min_rate must be positive, burst at least 1")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.rates = dict(DOMAIN_RATES if rates is None else rates)
+        self.increase = increase
+        self.decrease = decrease
+        self.min_rate = min_rate
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+
+    @staticmethod
+    def domain(
+            url: str
+        ) -> str:
+        """
+        Domain of the url without the `www.` prefix.
+        """
+        netloc = urlparse(url).netloc or url
+        return netloc.lower().removeprefix("www.")
+
+
+    def _bucket(
+            self,
+            domain: str,
+            now: float
+        ) -> _Bucket:
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = _Bucket(self.rates.get(domain, self.rate), self.burst, now)
+            self._buckets[domain] = bucket
+        return bucket
+
+
+    def wait(
+            self,
+            url: str
+        ) -> float:
+        """
+        Block until a request to the url's domain is allowed.
+        The token is reserved under the lock and the sleep happens outside of it.
+        :return: Seconds waited.
+        """
+        domain = self.domain(url)
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(domain, now)
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            bucket.tokens -= 1
+            delay = max(
+                -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0,
+                bucket.blocked_until - now
+            )
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+    def on_success(
+            self,
+            url: str
+        ) -> None:
+        """
+        Additive increase of the domain's rate.
+        """
+        with self._lock:
+            bucket = self._bucket(self.domain(url), time.monotonic())
+            bucket.rate = min(bucket.max_rate, bucket.rate + self.increase)
+
+
+    def on_throttled(
+            self,
+            url: str,
+            retry_after: Optional[float] = None
+        ) -> None:
+        """
+        Multiplicative decrease of the domain's rate,
+        and pause the domain for `retry_after` seconds if the server asked for it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(self.domain(url), now)
+            bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+            if retry_after:
+                bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+
+
+    def current_rate(
+            self,
+            url: str
+        ) -> float:
+        with self._lock:
+            return self._bucket(self.domain(url), time.monotonic()).rate
+
+
+# Shared by all scrapers (and worker threads) of the process
+domain_throttle = DomainThrottle()
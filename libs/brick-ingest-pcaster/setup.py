@@ -5,6 +5,8 @@ setup(
     version="1.0.0",
     packages=find_packages(),
     include_package_data=True,
+    # Sample fixtures of the offline benchmark
+    package_data={"app": ["fixtures/index.json", "fixtures/bodies/*.bin"]},
     install_requires=[
         "typer[all]",
         "pandas",
@@ -12,11 +14,13 @@ setup(
         #      it should be installed separately in the Dockerfile
         # "pip install libs/violet-storage-lib[pyarrow]",
         "python-dotenv",
-        "playwright"
+        "playwright",
+        "requests"
     ],
     entry_points={
         "console_scripts": [
-            "pcaster=app.cli:app"
+            "pcaster=app.cli:app",
+            "pcaster-bench=app.bench:app"
         ]
     },
 )
@@ -1,11 +1,12 @@
 import datetime
-import pyarrow.parquet as pq
 from app.src.apis.i_tunes_api import ITunesAPI
 from app.src.apis.podcast_index_api import PodcastIndexAPI
+from app.src.apis.response_cache import ResponseCache, StorageCacheTier
 from app.src.api_manager import PodcastApiManager
 from app.src.logger import logger
 from app.src.enricher import Enricher
 from app.src.get_latest_scrape_timestamp import get_latest_scrape_timestamp
+from app.src.title_index import TitleResolutionIndex
 from typing import List, Optional, Literal
 
 
@@ -34,6 +35,7 @@ def run_enricher(
 
         # Enrichment parameters
         fallback_range_days: int = 2,  
+        max_partition_age_days: int = 2,    # Refuse source partitions older than this (0 disables the check)
         top: int = 15,  
         podcast_api_search_limit: int = 3,
         countries: Optional[List[str]] = ["us", "pl"],
@@ -45,6 +47,10 @@ def run_enricher(
         batch_jobs_limit: int = 3,
         round_robin_batch_jobs: bool = True,
         verbose: bool = True,
+        api_workers: int = 8,   # Concurrent API requests (each API keeps its own rate limit)
+        api_cache: bool = True, # Cache API responses across runs (stored in the sink)
+        title_index: bool = True,           # Reuse title -> podcast ID resolutions across runs (stored in the sink)
+        title_index_reverify_days: int = 30, # Days before a resolved title is searched again
 
         # batch job parameters
         target_storage_name: str = 'default',           # Default storage name for the output path [whisperer config]
@@ -54,6 +60,8 @@ def run_enricher(
         delay: int = 1,     # Delay in seconds between retries
         retries: int = 3    # Number of retries for storage upload failures
     ):
+    response_cache = None
+    resolution_index = None
     try:
         # Construct the storage credentials
         storage_credentials = {
@@ -71,13 +79,37 @@ def run_enricher(
             credentials=storage_credentials
         )
 
+        # Responses of podcast searches and episode lookups, kept across runs in the sink
+        if api_cache:
+            response_cache = ResponseCache(
+                persistent=StorageCacheTier(
+                    storage_client=storage_client,
+                    container_name=container_name,
+                    storage_key=f"{sink_dir}/api_cache/responses.json"
+                )
+            )
+            response_cache.load()
+
+        # Title -> podcast ID resolutions of earlier runs, only new titles are searched
+        if title_index:
+            resolution_index = TitleResolutionIndex(
+                storage_client=storage_client,
+                container_name=container_name,
+                storage_key=f"{sink_dir}/title_index/titles.parquet",
+                reverify_days=title_index_reverify_days
+            )
+            resolution_index.load()
+
         # Initialize the API manager with the necessary APIs
         api_manager = PodcastApiManager(
-            itunes_api=ITunesAPI(),
+            itunes_api=ITunesAPI(cache=response_cache),
             podcasting_index_api=PodcastIndexAPI(
                 api_key=podcasting_index_api_key,
-                api_secret=podcasting_index_api_secret
-            )
+                api_secret=podcasting_index_api_secret,
+                cache=response_cache
+            ),
+            max_workers=api_workers,
+            title_index=resolution_index
         )
 
         # Get the latest scrape timestamp
@@ -93,19 +125,48 @@ def run_enricher(
             tz=datetime.timezone.utc  # Ensure we use UTC for consistency
         ).timestamp() - 60 * 60 * 24)) # 1 day ago
 
-        since = last_day
+        # Floored to the hour, reruns within the hour reuse the cached episode lookups
+        since = last_day - last_day % (60 * 60)
+
+        # Discover the latest complete scrape partition (date=YYYY-MM-DD),
+        # fall back to today if the source has no partitions yet
+        date_key = storage_client.latest_partition(
+            container_name=container_name,
+            prefix=source_dir,
+            partition_key="date",
+            required_key="top_podcasts.parquet"
+        ) or datetime.datetime.now().strftime("%Y-%m-%d")
+        logger.info(f"Using source partition date={date_key}")
+
+        # Episodes are fetched from `since` (now - 1 day) on, an old scrape would be
+        # enriched with episodes of another day, refuse it instead of reprocessing it silently
+        partition_age_days = (
+            datetime.datetime.now(tz=datetime.timezone.utc).date()
+            - datetime.date.fromisoformat(date_key)
+        ).days
+        if max_partition_age_days and partition_age_days > max_partition_age_days:
+            raise ValueError(
+                f"Latest source partition date={date_key} is {partition_age_days} days old "
+                f"(max {max_partition_age_days}), refusing to enrich it."
+            )
 
         # load the DataFrame from Azure Blob Storage
-        date_key = datetime.datetime.now().strftime("%Y-%m-%d")
         podcasts_storage_key = f"{source_dir}/date={date_key}/top_podcasts.parquet"
 
+        # Push the country / genre selection down to the Parquet reader,
+        # only matching row groups are downloaded and decoded
+        filters = []
+        if countries:
+            filters.append(("country", "in", list(countries)))
+        if filter_genre and filter_genre != "*":
+            filters.append(("sort_by", "in", [filter_genre]))
+
         logger.info(f"Reading Parquet file from {podcasts_storage_key} in container {container_name}")
-        bytesIO = storage_client.download_object(
+        df = storage_client.read_parquet(
             container_name=container_name,
-            storage_key=podcasts_storage_key
+            storage_key=podcasts_storage_key,
+            filters=filters or None
         )
-        table = pq.read_table(bytesIO)
-        df = table.to_pandas()
 
         # Initialize and run the Enricher
         _ = (
@@ -132,6 +193,7 @@ def run_enricher(
                 target_protocol=target_protocol,
                 container_name=container_name,
                 transcription_dir=transcription_dir,
+                date_key=date_key
             )
             .save_results(
                 storage_client=storage_client,
@@ -150,6 +212,13 @@ def run_enricher(
         logger.error(f"An error occurred during the enrichment process: {e}")
         raise
 
+    finally:
+        # Responses fetched so far are kept, also when the run failed
+        if response_cache is not None:
+            response_cache.flush()
+        if resolution_index is not None:
+            resolution_index.save()
+
 
 
 
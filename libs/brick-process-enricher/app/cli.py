@@ -74,6 +74,12 @@ def enrich_cmd(
         "--fallback-range-days", "-frd",
         help="Days to look back if latest scrap date isn't available from stamp"
     ),
+    max_partition_age_days: int = typer.Option(
+        int(os.getenv("MAX_PARTITION_AGE_DAYS", 2)),
+        "--max-partition-age-days", "-mpad",
+        min=0,
+        help="Refuse to enrich a latest source partition older than this many days, 0 disables the check (default is 2)"
+    ),
     top: int = typer.Option(
         int(os.getenv("TOP", 15)), 
         "--top", "-t",
@@ -132,6 +138,28 @@ def enrich_cmd(
         "--verbose", "-v",
         help="Enable verbose output for debugging (default is False)"
     ),
+    api_workers: int = typer.Option(
+        int(os.getenv("API_WORKERS", 8)),
+        "--api-workers", "-aw",
+        min=1,
+        help="Number of concurrent iTunes / Podcast Index requests, each API keeps its own rate limit (default is 8)"
+    ),
+    api_cache: bool = typer.Option(
+        os.getenv("API_CACHE", "true").lower() in ["true", "1", "yes", "y", "on", "enable", "enabled"],
+        "--api-cache/--no-api-cache",
+        help="Reuse iTunes / Podcast Index responses of earlier runs, stored in <sink-dir>/api_cache (default is True)"
+    ),
+    title_index: bool = typer.Option(
+        os.getenv("TITLE_INDEX", "true").lower() in ["true", "1", "yes", "y", "on", "enable", "enabled"],
+        "--title-index/--no-title-index",
+        help="Reuse title -> podcast ID resolutions of earlier runs, stored in <sink-dir>/title_index (default is True)"
+    ),
+    title_index_reverify_days: int = typer.Option(
+        int(os.getenv("TITLE_INDEX_REVERIFY_DAYS", 30)),
+        "--title-index-reverify-days", "-tird",
+        min=0,
+        help="Days a resolved podcast ID is used before its title is searched again (default is 30)"
+    ),
 
 
 
@@ -180,6 +208,7 @@ def enrich_cmd(
 
             # Enrichment parameters
             fallback_range_days=fallback_range_days,
+            max_partition_age_days=max_partition_age_days,
             top=top,
             podcast_api_search_limit=podcast_api_search_limit,
             countries=countries,
@@ -191,6 +220,10 @@ def enrich_cmd(
             batch_jobs_limit=batch_jobs_limit,
             round_robin_batch_jobs=round_robin_batch_jobs,
             verbose=verbose,
+            api_workers=api_workers,
+            api_cache=api_cache,
+            title_index=title_index,
+            title_index_reverify_days=title_index_reverify_days,
 
             # Sink parameters
             delay=delay,
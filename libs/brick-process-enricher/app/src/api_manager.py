@@ -1,10 +1,17 @@
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from rapidfuzz import fuzz
 import pandas as pd
 from app.src.logger import logger
 from app.src.apis.i_tunes_api import ITunesAPI
 from app.src.apis.podcast_index_api import PodcastIndexAPI
 from app.src.ranker_tools.normalize_title import normalize_title
+from app.src.title_index import TitleResolutionIndex
+from typing import Optional
+
+# Concurrent API requests, each API is additionally paced by its rate limiter
+DEFAULT_MAX_WORKERS = 8
 
 class PodcastApiManager:
     """
@@ -14,14 +21,23 @@ class PodcastApiManager:
     def __init__(
             self,
             itunes_api: ITunesAPI,
-            podcasting_index_api: PodcastIndexAPI
+            podcasting_index_api: PodcastIndexAPI,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            title_index: Optional[TitleResolutionIndex] = None
         ):
         """
         Initialize the PodcastApiManager class.
+        :param max_workers: Number of API requests in flight, 1 runs them sequentially.
+        :param title_index: Title resolutions of earlier runs, every missing ID is searched if None.
         """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
         self.itunes_api = itunes_api
         self.podcasting_index_api = podcasting_index_api
         self.normalize_title = normalize_title  # Use the imported normalize_title function
+        self.max_workers = max_workers
+        self.title_index = title_index
 
 
 
@@ -58,68 +74,241 @@ class PodcastApiManager:
 
 
 
+    def _id_batches(
+            self,
+            ids_by_column: dict[str, list[str]],
+            batch_size_attribute: str
+        ) -> list[tuple[ITunesAPI | PodcastIndexAPI, str, list[str]]]:
+        """
+        Split the distinct IDs of each ID column into (api, id column, ids) batches,
+        sized by the API's `lookup_batch_size` / `episodes_batch_size`.
+        """
+        apis = {key: api for api, key in self.api_list}
+        unknown = set(ids_by_column) - set(apis)
+        if unknown:
+            raise ValueError(f"Unknown podcast column ID: {', '.join(sorted(unknown))}")
+
+        batches = []
+        for podcast_id_column_key, ids in ids_by_column.items():
+            api = apis[podcast_id_column_key]
+            ids = list(dict.fromkeys(str(id) for id in ids))
+            size = max(1, getattr(api, batch_size_attribute))
+            batches.extend(
+                (api, podcast_id_column_key, ids[i:i + size]) for i in range(0, len(ids), size)
+            )
+        return batches
+
+
+
+    def get_episodes_for_podcasts(
+            self,
+            podcasts: list[tuple[str, str]],  # (podcast id, podcast_api_id) pairs
+            since: int,
+            limit: int = 5
+        ) -> list[tuple[list[dict], str]]:
+        """
+        Get the episodes of many podcasts with batched requests
+        (`get_episodes_for_many`, up to `episodes_batch_size` podcasts per request),
+        the batches run concurrently (thread pool of `max_workers`, each API paced by its own rate limiter).
+        Returns (episodes, fetched_at) per podcast, in the order of `podcasts`.
+        """
+        ids_by_column: dict[str, list[str]] = {}
+        for podcast_id, podcast_api_id in podcasts:
+            ids_by_column.setdefault(podcast_api_id, []).append(podcast_id)
+        batches = self._id_batches(ids_by_column, "episodes_batch_size")
+        logger.info(f"Fetching episodes of {len(podcasts)} podcasts in {len(batches)} batched requests.")
+
+        def fetch(batch: tuple) -> tuple[dict[str, list[dict]], str]:
+            api, _, ids = batch
+            episodes = api.get_episodes_for_many(
+                ids=ids,
+                since=since,
+                limit=limit
+            )
+            return episodes, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time()))
+
+        # (id column, podcast id) -> (episodes, fetched_at)
+        fetched: dict[tuple[str, str], tuple[list[dict], str]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for (_, podcast_id_column_key, ids), (episodes, fetched_at) in zip(
+                batches, executor.map(fetch, batches)
+            ):
+                for podcast_id in ids:
+                    fetched[(podcast_id_column_key, podcast_id)] = (episodes.get(podcast_id, []), fetched_at)
+
+        return [
+            fetched[(podcast_api_id, str(podcast_id))] for podcast_id, podcast_api_id in podcasts
+        ]
+
+
+
+    def lookup_podcasts(
+            self,
+            ids: list[str],
+            podcast_api_id: str = "itunes_id",
+            country: Optional[str] = None
+        ) -> dict[str, dict]:
+        """
+        Get the metadata of many podcasts of one API with batched requests
+        (`lookup_podcasts`, up to `lookup_batch_size` podcasts per request),
+        the batches run concurrently.
+        :param country: Storefront of the lookup (e.g. "pl"), the API default if None.
+        Returns podcasts by ID (as str), unknown IDs are left out.
+        """
+        batches = self._id_batches({podcast_api_id: ids}, "lookup_batch_size")
+
+        podcasts: dict[str, dict] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for found in executor.map(lambda batch: batch[0].lookup_podcasts(batch[2], country=country), batches):
+                podcasts.update(found)
+        return podcasts
+
+
+
+    def verify_podcast_ids(
+            self,
+            df: pd.DataFrame,
+            podcast_api_id: str = "itunes_id",
+            country: Optional[str] = None
+        ) -> tuple[pd.DataFrame, dict[str, pd.Series]]:
+        """
+        Verify the podcast IDs the DataFrame already has (e.g. iTunes IDs from Rephonic)
+        with batched metadata lookups (`lookup_podcasts`) in the storefront of `country`.
+        IDs unknown to the API are cleared, so `fill_missing_podcast_ids` resolves them by title,
+        pass the returned cleared IDs as its `unverified_ids` to keep the ones without a replacement.
+        A failed lookup is logged and leaves the IDs as they are.
+        Returns the updated DataFrame and the cleared IDs by row ({id column: Series}).
+        """
+        ids = df.loc[df[podcast_api_id].ne(""), podcast_api_id].astype(str).unique().tolist()
+        if not ids:
+            return df, {}
+
+        try:
+            found = self.lookup_podcasts(ids, podcast_api_id=podcast_api_id, country=country)
+        except Exception as e:
+            logger.warning(f"Could not verify {len(ids)} {podcast_api_id} values: {e}")
+            return df, {}
+
+        unknown = df[podcast_api_id].ne("") & ~df[podcast_api_id].astype(str).isin(found.keys())
+        logger.info(f"Verified {len(ids)} {podcast_api_id} values, {unknown.sum()} rows with unknown IDs.")
+        if not unknown.any():
+            return df, {}
+
+        cleared = df.loc[unknown, podcast_api_id].copy()
+        logger.warning(
+            f"Searching replacements of unknown {podcast_api_id} values: {', '.join(cleared.astype(str).unique())}"
+        )
+        df.loc[unknown, podcast_api_id] = ""
+        return df, {podcast_api_id: cleared}
+
+
+
     def fill_missing_podcast_ids(
             self,
             df: pd.DataFrame,
             title_column_name: str = "podcast_title", # clustered_title
             podcasts_limit: int = 3,
-            threshold: int = 90
+            threshold: int = 90,
+            unverified_ids: Optional[dict[str, pd.Series]] = None
         ) -> pd.DataFrame:
         """
         Fill missing podcast IDs in the DataFrame by searching for podcasts using APIs.
-        This method iterates over the DataFrame, checks for missing podcast IDs, and searches for podcasts using the APIs.
+        :param unverified_ids: IDs by row per ID column (cleared by `verify_podcast_ids`),
+            restored where the search finds no replacement.
+        The distinct titles with a missing ID are searched in all APIs concurrently
+        (thread pool of `max_workers`, each API paced by its own rate limiter).
+        Titles resolved by the title index in the last `reverify_days` are not searched,
+        expired resolutions are searched again and kept when the search finds no match.
         It uses fuzzy matching to compare podcast titles and find the best match.
+        The matched IDs are written back with one vectorized assignment per ID column.
         Returns the updated DataFrame with filled podcast IDs.
         """
+        # Matched id per title, for each id column
+        found_ids: dict[str, dict[str, str]] = {key: {} for _, key in self.api_list}
+        # Expired index ids, used when their re-verification finds no match
+        fallback_ids: dict[str, dict[str, str]] = {key: {} for _, key in self.api_list}
 
-        for api, podcast_id_column_key in self.api_list:   
-            logger.info(f"Using API: {api.__class__.__name__}")
-
-            # Create a mask for podcasts with missing itunes_id
-            missing_id_mask = df[podcast_id_column_key].eq("")
+        # (api, id column, title) searches, duplicated titles are searched once
+        searches = []
+        for api, podcast_id_column_key in self.api_list:
+            for title in df.loc[df[podcast_id_column_key].eq(""), title_column_name].unique():
+                if self.title_index is not None:
+                    entry, fresh = self.title_index.get(title, podcast_id_column_key)
+                    if fresh:
+                        if entry["podcast_id"]:
+                            found_ids[podcast_id_column_key][title] = entry["podcast_id"]
+                        continue
+                    if entry is not None and entry["podcast_id"]:
+                        fallback_ids[podcast_id_column_key][title] = entry["podcast_id"]
+                searches.append((api, podcast_id_column_key, title))
 
-            for idx, row in df[missing_id_mask].iterrows():
-                podcats_title = row[title_column_name]
+        if self.title_index is not None:
+            logger.info(
+                f"Resolved {sum(len(ids) for ids in found_ids.values())} missing IDs from the title index."
+            )
+        logger.info(
+            f"Searching {len(searches)} titles with missing IDs "
+            f"({self.max_workers} workers): "
+            + ", ".join(
+                f"{api.__class__.__name__}: {sum(1 for a, _, _ in searches if a is api)}"
+                for api, _ in self.api_list
+            )
+        )
 
-                # Search for podcasts using the API,
-                # limit the number of results to avoid excessive API calls
-                found_podcasts = api.search_podcast(
-                    search_term=podcats_title,
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    # Search for podcasts using the API,
+                    # limit the number of results to avoid excessive API calls
+                    api.search_podcast,
+                    search_term=title,
                     limit=podcasts_limit
                 )
+                for api, _, title in searches
+            ]
+
+            for (api, podcast_id_column_key, title), future in zip(searches, futures):
+                found_podcasts = future.result()
+                logger.info(f"Found {len(found_podcasts)} podcasts for search term '{title}':")
 
-                logger.info(f"Found {len(found_podcasts)} podcasts for search term '{podcats_title}':")
-                
                 # Check if any of the found podcasts match the title
                 # - uses fuzzy matching method to compare titles
-                best_title, podcast_id = self._compare_titles(
-                    original_title=podcats_title, 
+                best_title, podcast_id, similarity = self._best_match(
+                    original_title=title,
                     found_podcasts=[
                         (podcast.get("title", ""), podcast.get("id", "")) for podcast in found_podcasts],
                     threshold=threshold
                 )
-
-                if best_title is None:
-                    # No match found, continue to the next podcast
+                if best_title is not None:
+                    found_ids[podcast_id_column_key][title] = str(podcast_id)
+                elif title in fallback_ids[podcast_id_column_key]:
+                    # Keep the expired resolution (and retry it next run)
+                    found_ids[podcast_id_column_key][title] = fallback_ids[podcast_id_column_key][title]
                     continue
 
-                # condition
-                title_match = df[title_column_name] == podcats_title
-
-                # found rows - avoids repeated matches
-                if not title_match.any():
-                    # No match found in the DataFrame, continue to the next podcast
-                    continue
+                if self.title_index is not None:
+                    self.title_index.record(
+                        title,
+                        podcast_id_column_key,
+                        podcast_id=podcast_id,
+                        matched_title=best_title,
+                        score=similarity
+                    )
 
-                row_idx = df.index[title_match]
+        # Update the DataFrame with the found podcast ids, only where the id is missing
+        for podcast_id_column_key, ids in found_ids.items():
+            if not ids:
+                continue
+            matched = df[title_column_name].map(ids)
+            fill_mask = df[podcast_id_column_key].eq("") & matched.notna()
+            df.loc[fill_mask, podcast_id_column_key] = matched[fill_mask]
 
-                # Update the DataFrame with the found podcast id
-                if (
-                    row_idx is not None 
-                    and len(row_idx) > 0 
-                    and df.loc[row_idx, podcast_id_column_key].eq("").any()
-                ):
-                    df.loc[row_idx, podcast_id_column_key] = str(podcast_id)
+        # Cleared IDs are only replaced by a match, the others are restored
+        for podcast_id_column_key, ids in (unverified_ids or {}).items():
+            restore_mask = df[podcast_id_column_key].eq("") & df.index.isin(ids.index)
+            if restore_mask.any():
+                logger.info(f"Keeping {restore_mask.sum()} {podcast_id_column_key} values without a replacement.")
+                df.loc[restore_mask, podcast_id_column_key] = ids[df.index[restore_mask]]
 
         return df
 
@@ -136,16 +325,16 @@ class PodcastApiManager:
             (self.podcasting_index_api, "podcasting_index_id")
         ]
 
-    def _compare_titles(
+    def _best_match(
             self,
             original_title: str, 
             found_podcasts: list[tuple[str,str]], # list of tuples with (title, podcast_id) pairs
             threshold: int = 90                   # similarity threshold for matching - default is 90
-        ) -> tuple[str, str] | None:
+        ) -> tuple[str, str, float] | tuple[None, None, None]:
         """
         Compare two podcast titles using fuzzy matching.
-        Returns the best matching title and its podcast_id if similarity exceeds the threshold.
-        If no match is found, returns None.
+        Returns the best matching title, its podcast_id and similarity if similarity exceeds the threshold.
+        If no match is found, returns (None, None, None).
 
         - Fuzzy matching is a must here, cause scraped titles can be slightly different than API retrieved ones.
 
@@ -175,8 +364,8 @@ class PodcastApiManager:
 
             logger.info(f"Best match for '{original_title}': '{best_match[0]}' with similarity {best_match[2]}")
             
-            # Return the title and podcast_id of the best match
-            return best_match[0], best_match[1]  
+            # Return the title, podcast_id and similarity of the best match
+            return best_match  
         else:
             logger.warning(f"No match found for '{original_title}'")
-            return None, None
+            return None, None, None
@@ -1,24 +1,133 @@
-
+import threading
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from app.src.apis.rate_limiter import RateLimiter
+from app.src.apis.response_cache import ResponseCache
 from app.src.types import PodcastType, EpisodeType
 
+DEFAULT_TIMEOUT = 10        # seconds
+DEFAULT_POOL_SIZE = 10      # keep-alive connections, should cover the number of workers
+
+
 class AbstractApi:
     """
     Abstract class for API implementations.
     This class defines the basic structure and methods that any API class should implement.
+    Requests go through `_get`: one connection pooled session per API instance
+    (shared by the worker threads) and a per API rate limit.
+    Podcast searches and episode lookups go through `_cached_request`,
+    served from the optional response cache.
+    Batched lookups (`lookup_podcasts`, `get_episodes_for_many`) send up to
+    `lookup_batch_size` / `episodes_batch_size` IDs per request.
     """
+    # Default requests per second and burst, overridden by the implementations
+    requests_per_second: float = 5.0
+    burst: int = 1
+    # IDs per batched request, overridden by the implementations
+    lookup_batch_size: int = 1
+    episodes_batch_size: int = 1
 
     def __init__(
-            self
+            self,
+            requests_per_second: Optional[float] = None,
+            pool_size: int = DEFAULT_POOL_SIZE,
+            timeout: float = DEFAULT_TIMEOUT,
+            cache: Optional[ResponseCache] = None
         ):
         """
         Initialize the API instance.
-        This method can be overridden by subclasses to set up specific configurations.
+        This method can be overridden by subclasses to set up specific configurations,
+        they must call it to get the session and the rate limiter.
+        :param requests_per_second: Rate limit of the API, the class default if None.
+        :param pool_size: Connections kept alive by the session.
+        :param timeout: Seconds to wait for the server (connect and read).
+        :param cache: Response cache (can be shared between APIs), no caching if None.
+        """
+        self.rate_limiter = RateLimiter(
+            rate=requests_per_second or self.requests_per_second,
+            burst=self.burst
+        )
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.cache = cache
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(
+            self
+        ) -> requests.Session:
+        """
+        Lazily created connection pooled session.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def _get(
+            self,
+            url: str,
+            params: Optional[dict] = None,
+            headers: Optional[dict] = None
+        ) -> dict:
+        """
+        Rate limited GET of a JSON endpoint.
+        :raises requests.HTTPError: On 4xx / 5xx responses.
+        """
+        self.rate_limiter.wait()
+        response = self.session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _request(
+            self,
+            endpoint: str,
+            params: Optional[dict] = None
+        ) -> dict:
+        """
+        Request the endpoint of the API (url and authentication).
+        This method should be implemented by subclasses.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+    def _cached_request(
+            self,
+            endpoint: str,
+            params: Optional[dict] = None,
+            cache_endpoint: Optional[str] = None
+        ) -> dict:
         """
-        pass
+        `_request` served from the response cache when one is set,
+        keyed on the API, endpoint and params (not on the auth headers).
+        :param cache_endpoint: Endpoint name of the cache TTLs, `endpoint` if None
+            (e.g. when one endpoint serves both episodes and podcast metadata).
+        """
+        if self.cache is None:
+            return self._request(endpoint, params)
+        return self.cache.get_or_fetch(
+            namespace=self.__class__.__name__,
+            endpoint=cache_endpoint or endpoint,
+            params=params,
+            fetch=lambda: self._request(endpoint, params)
+        )
 
     def search_podcast(
-            self, 
+            self,
             search_term: str,
             limit: int = 6
         ) -> list["PodcastType"]:
@@ -29,9 +138,9 @@ class AbstractApi:
         :return: List of podcasts matching the search term.
         """
         raise NotImplementedError("This method should be overridden by subclasses.")
-    
+
     def get_episodes_by_podcast_id(
-            self, 
+            self,
             id: str,
             since: Optional[int] = None,
             limit: int = 5
@@ -43,4 +152,43 @@ class AbstractApi:
         :param limit: The maximum number of episodes to return.
         :return: List of episodes for the specified podcast.
         """
-        raise NotImplementedError("This method should be overridden by subclasses.")
\ No newline at end of file
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+    def lookup_podcasts(
+            self,
+            ids: list[str],
+            country: Optional[str] = None
+        ) -> dict[str, "PodcastType"]:
+        """
+        Get the metadata of many podcasts, `lookup_batch_size` IDs per request.
+        :param ids: The IDs of the podcasts.
+        :param country: Storefront of the lookup, ignored by APIs without storefronts.
+        :return: Podcasts by ID (as str), unknown IDs are left out.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+    def get_episodes_for_many(
+            self,
+            ids: list[str],
+            since: Optional[int] = None,
+            limit: int = 5
+        ) -> dict[str, list["EpisodeType"]]:
+        """
+        Get the episodes of many podcasts, `episodes_batch_size` IDs per request.
+        :param ids: The IDs of the podcasts.
+        :param since: Optional timestamp to filter episodes.
+        :param limit: The maximum number of episodes to return per podcast.
+        :return: Episodes by podcast ID (as str), an empty list for podcasts without episodes.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
+    @staticmethod
+    def _batches(
+            ids: list[str],
+            size: int
+        ) -> list[list[str]]:
+        """
+        Split the distinct IDs (as str, in order) into batches of `size`.
+        """
+        ids = list(dict.fromkeys(str(id) for id in ids))
+        return [ids[i:i + size] for i in range(0, len(ids), max(1, size))]
@@ -1,15 +1,25 @@
-import requests
 from app.src.apis.abstract import AbstractApi
+from app.src.apis.response_cache import ResponseCache
 from app.src.helpers import itunes_date_to_timestamp
 from app.src.types import PodcastType, EpisodeType
 from typing import Optional
 
 class ITunesAPI(AbstractApi):
+    # The Search API is throttled per client IP, keep a conservative pace
+    requests_per_second = 2.0
+    burst = 3
+    # lookup accepts comma separated IDs, the episode limit applies per ID
+    lookup_batch_size = 100
+    episodes_batch_size = 20
+
     def __init__(
             self,    
             base_url: str = "https://itunes.apple.com",
-            date_to_timestamp = itunes_date_to_timestamp
+            date_to_timestamp = itunes_date_to_timestamp,
+            requests_per_second: Optional[float] = None,
+            cache: Optional[ResponseCache] = None
         ):
+        super().__init__(requests_per_second=requests_per_second, cache=cache)
         self.base_url = base_url
         self.date_to_timestamp = date_to_timestamp
 
@@ -18,10 +28,7 @@ class ITunesAPI(AbstractApi):
             endpoint: str,
             params: dict = None
         ) -> dict:
-        url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._get(f"{self.base_url}/{endpoint}", params=params)
     
 
     def search_podcast(
@@ -35,7 +42,7 @@ class ITunesAPI(AbstractApi):
             "entity": "podcast",
             "limit": str(limit)
         }
-        podcasts = self._request("search", params).get("results", [])
+        podcasts = self._cached_request("search", params).get("results", [])
 
         return [
             {
@@ -69,7 +76,7 @@ class ITunesAPI(AbstractApi):
                 raise ValueError("Limit must be between 1 and 3000")
             params["limit"] = str(limit)
 
-        data = self._request("lookup", params).get("results", [])
+        data = self._cached_request("lookup", params).get("results", [])
 
         if since is not None:
             """
@@ -95,6 +102,75 @@ class ITunesAPI(AbstractApi):
         ]
 
 
+    def lookup_podcasts(
+            self,
+            ids: list[str],
+            country: Optional[str] = None
+        ) -> dict[str, "PodcastType"]:
+
+        podcasts = {}
+        for batch in self._batches(ids, self.lookup_batch_size):
+            params = {
+                "id": ",".join(batch),
+                "entity": "podcast"
+            }
+            if country:
+                # Lookups default to the US storefront
+                params["country"] = country
+            for podcast in self._cached_request("lookup", params, cache_endpoint="lookup/podcast").get("results", []):
+                if podcast.get("kind") != "podcast":
+                    continue
+                podcasts[str(podcast.get("collectionId", ""))] = {
+                    "source": "itunes_api",
+                    "id": podcast.get("collectionId", ""),
+                    "title": podcast.get("collectionName", ""),
+                    "categories": podcast.get("genres", [])
+                }
+        return podcasts
+
+
+    def get_episodes_for_many(
+            self,
+            ids: list[str],
+            since: Optional[int] = None,
+            limit: int = 5
+        ) -> dict[str, list["EpisodeType"]]:
+
+        if limit < 1 or limit > 3000:
+            raise ValueError("Limit must be between 1 and 3000")
+
+        episodes = {str(id): [] for id in ids}
+        for batch in self._batches(ids, self.episodes_batch_size):
+            params = {
+                "id": ",".join(batch),
+                "entity": "podcastEpisode",
+                "sort": "recent",
+                "limit": str(limit)     # per podcast
+            }
+            data = self._cached_request("lookup", params).get("results", [])
+
+            # The results start with the podcast of each ID, followed by its episodes
+            for episode in data:
+                if episode.get("wrapperType") != "podcastEpisode":
+                    continue
+                if since is not None and (
+                    "releaseDate" not in episode or
+                    self.date_to_timestamp(episode["releaseDate"]) < since
+                ):
+                    continue
+                podcast_episodes = episodes.setdefault(str(episode.get("collectionId", "")), [])
+                if len(podcast_episodes) < limit:
+                    podcast_episodes.append({
+                        "id": episode.get("trackId", ""),
+                        "title": episode.get("trackName", ""),
+                        "release_date": self.date_to_timestamp(episode.get("releaseDate", "")),
+                        "duration": round(episode.get("trackTimeMillis", 0) / 1000),    # Convert milliseconds to seconds
+                        "transcription": None,                                          # iTunes API does not provide transcripts
+                        "audio_source": episode.get("trackViewUrl", "")
+                    })
+        return episodes
+
+
     def get_recent_episodes(
             self, 
             since: Optional[int] = None,  # Timestamp to fetch episodes since
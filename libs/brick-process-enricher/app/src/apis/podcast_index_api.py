@@ -1,20 +1,30 @@
-import requests
 import time
 import hashlib
 from app.src.apis.abstract import AbstractApi
+from app.src.apis.response_cache import ResponseCache
 from app.src.types import PodcastType, EpisodeType
 from typing import Optional
 
 class PodcastIndexAPI(AbstractApi):
+    requests_per_second = 10.0
+    burst = 5
+    # episodes/byfeedid accepts up to 200 comma separated feed IDs,
+    # `max` applies to all of them and is capped at 1000
+    episodes_batch_size = 50
+    max_results = 1000
+
     def __init__(
             self, 
             api_key: str,
             api_secret: str,
-            base_url: str = "https://api.podcastindex.org/api/1.0"
+            base_url: str = "https://api.podcastindex.org/api/1.0",
+            requests_per_second: Optional[float] = None,
+            cache: Optional[ResponseCache] = None
         ):
         if not api_key or not api_secret:
             raise ValueError("Missing API credentials for Podcast Index")
         
+        super().__init__(requests_per_second=requests_per_second, cache=cache)
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url
@@ -39,16 +49,12 @@ class PodcastIndexAPI(AbstractApi):
             "User-Agent": "PodcastIdeaGenerator/0.1",
         }
 
-        response = requests.get(
+        return self._get(
             url=f"{self.base_url}/{endpoint}",
-            headers=headers, 
-            params=params
+            params=params,
+            headers=headers
         )
 
-        response.raise_for_status()
-
-        return response.json()
-
 
 
     def search_podcast(
@@ -57,7 +63,7 @@ class PodcastIndexAPI(AbstractApi):
             limit: int = 6
         ) -> list["PodcastType"]:
 
-        data = self._request(
+        data = self._cached_request(
             endpoint="search/byterm", 
             params={
                 "q": search_term,
@@ -100,7 +106,7 @@ class PodcastIndexAPI(AbstractApi):
         if since is not None and isinstance(since, int):
             params["since"] = since
 
-        data = self._request("episodes/byfeedid", params)
+        data = self._cached_request("episodes/byfeedid", params)
 
         return [
             {
@@ -115,6 +121,75 @@ class PodcastIndexAPI(AbstractApi):
 
 
 
+    def lookup_podcasts(
+            self,
+            ids: list[str],
+            country: Optional[str] = None
+        ) -> dict[str, "PodcastType"]:
+        """
+        Podcast Index has no batch lookup by feed ID (only by GUID),
+        the podcasts are requested one by one. Feeds are global, `country` is ignored.
+        """
+        podcasts = {}
+        for id in dict.fromkeys(str(id) for id in ids):
+            feed = self._cached_request("podcasts/byfeedid", {"id": id}).get("feed") or {}
+            if not feed:
+                continue
+            podcasts[str(feed.get("id", ""))] = {
+                "source": "podcast_index_api",
+                "id": feed.get("id", ""),
+                "title": feed.get("title", ""),
+                "categories": [category for category in (feed.get("categories") or {}).values()],
+            }
+        return podcasts
+
+
+
+    def get_episodes_for_many(
+            self,
+            ids: list[str],
+            since: Optional[int] = None,
+            limit: int = 5
+        ) -> dict[str, list["EpisodeType"]]:
+        """
+        The newest episodes of a batch come in one list, a busy feed can crowd out
+        the others. When a batch hits `max`, podcasts with less than `limit`
+        episodes are requested again on their own.
+        """
+        limit = max(1, min(limit, self.max_results))
+        batch_size = max(1, min(self.episodes_batch_size, self.max_results // limit))
+
+        episodes = {str(id): [] for id in ids}
+        for batch in self._batches(ids, batch_size):
+            params = {
+                "id": ",".join(batch),
+                "max": str(limit * len(batch)),
+                "fulltext": "true"
+            }
+            if since is not None and isinstance(since, int):
+                params["since"] = since
+
+            items = self._cached_request("episodes/byfeedid", params).get("items", [])
+            for episode in items:
+                podcast_episodes = episodes.setdefault(str(episode.get("feedId", "")), [])
+                if len(podcast_episodes) < limit:
+                    podcast_episodes.append({
+                        "id": episode.get("id", ""),
+                        "title": episode.get("title", ""),
+                        "release_date": episode.get("datePublished", ""),
+                        "duration": episode.get("duration", 0),
+                        "transcription": episode.get("transcriptUrl", ""),  # URL to the transcript of the episode
+                        "audio_source": episode.get("enclosureUrl", ""),    # This is where the audio file is located
+                    })
+
+            if len(batch) > 1 and len(items) >= limit * len(batch):
+                for id in batch:
+                    if len(episodes[id]) < limit:
+                        episodes[id] = self.get_episodes_by_podcast_id(id=id, limit=limit, since=since)
+        return episodes
+
+
+
     def get_recent_episodes(
             self, 
             since: Optional[int] = None,  # Timestamp to fetch episodes since
@@ -0,0 +1,48 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread safe token bucket limiting the request rate of one API.
+    Worker threads calling `wait()` are spaced out to `rate` requests per second,
+    with up to `burst` requests sent back to back.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int = 1
+        ):
+        """
+        :param rate: Requests per second.
+        :param burst: Bucket capacity.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+
+    def wait(
+            self
+        ) -> float:
+        """
+        Block until a request is allowed.
+        The token is reserved under the lock and the sleep happens outside of it.
+        :return: Seconds waited.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,324 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from app.src.logger import logger
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# Seconds a response is fresh, per endpoint.
+# Podcast searches and metadata are stable for days, episode lists change daily.
+DEFAULT_TTLS = {
+    "search": 7 * DAY,              # iTunes search
+    "search/byterm": 7 * DAY,       # Podcast Index search
+    "lookup": 6 * HOUR,             # iTunes episodes
+    "lookup/podcast": 7 * DAY,      # iTunes podcast metadata
+    "episodes/byfeedid": 6 * HOUR,  # Podcast Index episodes
+    "podcasts/byfeedid": 7 * DAY,   # Podcast Index podcast metadata
+}
+DEFAULT_TTL = HOUR
+# Seconds after expiry a response is still served while it is refreshed in the background
+DEFAULT_STALE_TTL = DAY
+# Endpoints without stale serving. Episodes are filtered by `since` after the request,
+# a stale list of a daily job would miss the episodes published since the previous run.
+DEFAULT_STALE_TTLS = {
+    "lookup": 0,
+    "episodes/byfeedid": 0,
+}
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class FileCacheTier:
+    """
+    Persistent tier of the response cache in a local JSON file.
+    """
+
+    def __init__(
+            self,
+            path: str
+        ):
+        self.path = path
+
+
+    def load(
+            self
+        ) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+    def save(
+            self,
+            entries: dict
+        ) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+
+
+class StorageCacheTier:
+    """
+    Persistent tier of the response cache in one JSON object of a storage_lib client,
+    downloaded once before and uploaded once after a run.
+    """
+
+    def __init__(
+            self,
+            storage_client,
+            container_name: str,
+            storage_key: str
+        ):
+        self.storage_client = storage_client
+        self.container_name = container_name
+        self.storage_key = storage_key
+
+
+    def load(
+            self
+        ) -> dict:
+        if not self.storage_client.key_exists(
+            container_name=self.container_name,
+            storage_key=self.storage_key
+        ):
+            return {}
+        return self.storage_client.download_json(
+            container_name=self.container_name,
+            storage_key=self.storage_key
+        ) or {}
+
+
+    def save(
+            self,
+            entries: dict
+        ) -> None:
+        self.storage_client.upload_json(
+            storage_key=self.storage_key,
+            data=entries,
+            container_name=self.container_name,
+            overwrite=True
+        )
+
+
+class ResponseCache:
+    """
+    Cache of decoded API responses keyed on API + endpoint + params.
+    Responses are fresh for the TTL of their endpoint. Expired responses
+    within `stale_ttl` are served immediately and refreshed in the background
+    (stale-while-revalidate), older ones are fetched again.
+    Entries live in an in-memory LRU, the optional persistent tier
+    (FileCacheTier / StorageCacheTier) is read by `load()` and written by `flush()`.
+    Thread safe, shared by the worker threads of the API manager.
+
+    Usage:
+        cache = ResponseCache(persistent=FileCacheTier(".cache/api_responses.json"))
+        cache.load()
+        data = cache.get_or_fetch("ITunesAPI", "search", params, lambda: fetch(params))
+        cache.flush()
+    """
+
+    def __init__(
+            self,
+            ttls: Optional[dict[str, float]] = None,
+            default_ttl: float = DEFAULT_TTL,
+            stale_ttl: float = DEFAULT_STALE_TTL,
+            stale_ttls: Optional[dict[str, float]] = None,
+            max_entries: int = DEFAULT_MAX_ENTRIES,
+            persistent=None
+        ):
+        """
+        :param ttls: Seconds a response is fresh per endpoint, DEFAULT_TTLS if None.
+        :param default_ttl: Seconds a response of other endpoints is fresh.
+        :param stale_ttl: Seconds after expiry a stale response is still served (while refreshed), 0 disables it.
+        :param stale_ttls: `stale_ttl` per endpoint, DEFAULT_STALE_TTLS if None.
+        :param max_entries: Entries kept in memory (least recently used are evicted).
+        :param persistent: Persistent tier, memory only if None.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.stale_ttls = dict(DEFAULT_STALE_TTLS if stale_ttls is None else stale_ttls)
+        self.max_entries = max_entries
+        self.persistent = persistent
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._revalidating: dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+
+    @staticmethod
+    def key(
+            namespace: str,
+            endpoint: str,
+            params: Optional[dict]
+        ) -> str:
+        payload = json.dumps(
+            [namespace, endpoint, {k: str(v) for k, v in (params or {}).items()}],
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+    def ttl(
+            self,
+            endpoint: str
+        ) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+
+    def stale_ttl_for(
+            self,
+            endpoint: str
+        ) -> float:
+        return self.stale_ttls.get(endpoint, self.stale_ttl)
+
+
+    def _set(
+            self,
+            key: str,
+            endpoint: str,
+            value: Any
+        ) -> None:
+        with self._lock:
+            self._entries[key] = {"endpoint": endpoint, "stored_at": time.time(), "value": value}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+    def _revalidate(
+            self,
+            key: str,
+            endpoint: str,
+            fetch: Callable[[], Any]
+        ) -> None:
+        """
+        Refresh a stale entry in the background, once per key at a time.
+        """
+        def refresh() -> None:
+            try:
+                self._set(key, endpoint, fetch())
+            except Exception as e:
+                logger.warning(f"Could not revalidate cached {endpoint} response: {e}")
+            finally:
+                with self._lock:
+                    self._revalidating.pop(key, None)
+
+        with self._lock:
+            if key in self._revalidating:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-revalidate")
+            self._revalidating[key] = self._executor.submit(refresh)
+
+
+    def get_or_fetch(
+            self,
+            namespace: str,
+            endpoint: str,
+            params: Optional[dict],
+            fetch: Callable[[], Any]
+        ) -> Any:
+        """
+        Cached response of the request, fetched (and stored) on a miss.
+        Errors of `fetch` on a miss are raised, nothing is cached then.
+        """
+        key = self.key(namespace, endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                age = time.time() - entry["stored_at"]
+                ttl = self.ttl(endpoint)
+                stale_ttl = self.stale_ttl_for(endpoint)
+
+        if entry is not None and age < ttl:
+            with self._lock:
+                self.hits += 1
+            return entry["value"]
+
+        if entry is not None and age < ttl + stale_ttl:
+            with self._lock:
+                self.stale_hits += 1
+            self._revalidate(key, endpoint, fetch)
+            return entry["value"]
+
+        with self._lock:
+            self.misses += 1
+        value = fetch()
+        self._set(key, endpoint, value)
+        return value
+
+
+    def load(
+            self
+        ) -> int:
+        """
+        Fill the memory tier from the persistent tier.
+        :return: Number of loaded entries.
+        """
+        if self.persistent is None:
+            return 0
+        try:
+            entries = self.persistent.load()
+        except Exception as e:
+            logger.warning(f"Could not load the API response cache: {e}")
+            return 0
+
+        with self._lock:
+            for key, entry in sorted(entries.items(), key=lambda item: item[1]["stored_at"]):
+                self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        logger.info(f"Loaded {len(entries)} cached API responses.")
+        return len(entries)
+
+
+    def flush(
+            self
+        ) -> None:
+        """
+        Wait for background revalidations and write the entries
+        that are still servable (fresh or stale) to the persistent tier.
+        Errors are logged, the cache must not fail a run.
+        """
+        with self._lock:
+            pending = list(self._revalidating.values())
+        for future in pending:
+            future.result()
+
+        if self.persistent is None:
+            return
+
+        now = time.time()
+        with self._lock:
+            entries = {
+                key: entry for key, entry in self._entries.items()
+                if now - entry["stored_at"]
+                < self.ttl(entry["endpoint"]) + self.stale_ttl_for(entry["endpoint"])
+            }
+        try:
+            self.persistent.save(entries)
+        except Exception as e:
+            logger.warning(f"Could not save the API response cache: {e}")
+            return
+        logger.info(f"Saved {len(entries)} cached API responses. {self.summary()}")
+
+
+    def summary(
+            self
+        ) -> str:
+        return f"API cache: {self.hits} hits, {self.stale_hits} stale hits, {self.misses} misses."
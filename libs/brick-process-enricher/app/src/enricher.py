@@ -1,4 +1,4 @@
-import dotenv, datetime, time
+import dotenv, datetime
 import json
 import pandas as pd
 from storage_lib import StorageClient
@@ -21,6 +21,20 @@ class Enricher:
         "episodes_fetch_limit_per_podcast": 5,  # Limit for the number of episodes urls to fetch per podcast
     }
 
+    # Columns of the master episodes DataFrames
+    episode_columns = [
+        # Country metadata
+        'country',
+        # Podcast metadata
+        'podcast_title', 'podcast_clustered_title', 
+        'podcast_api_id', 'podcast_id', 
+        'rank', 'borda_score', 'scraped_at', 
+        # Episode metadata
+        'fetched_at', 'episode_id', 'episode_title',
+        'release_date', 'duration', 
+        'transcription', 'audio_source'
+    ]
+
     def __init__(
         self, 
         df: pd.DataFrame,
@@ -63,28 +77,31 @@ class Enricher:
         
         target_jobs_storage_key=f"{sink_dir}/date={date_key}"
 
-        # Save master ranking DataFrame
+        # Upload all per-country parquet files in parallel
+        frames = {}
         for country, master_ranking in self.master_ranking.items():
-            storage_client.upload_df_as_parquet(
-                df=master_ranking,
-                container_name=container_name,
-                storage_key=f"{target_jobs_storage_key}/{country}/master_ranking.parquet",
-                overwrite=overwrite
-            )
-            if verbose:
+            frames[f"{target_jobs_storage_key}/{country}/master_ranking.parquet"] = master_ranking
+        for country, df_episodes in self.master_episodes.items():
+            frames[f"{target_jobs_storage_key}/{country}/master_episodes.parquet"] = df_episodes
+
+        upload_results = storage_client.upload_many_df_as_parquet(
+            frames=frames,
+            container_name=container_name,
+            overwrite=overwrite,
+            skip_unchanged=True,
+            compression="zstd"  # smaller files for the (text heavy) episode tables
+        )
+        # Re-raise the first failure, after all uploads had their chance
+        for result in upload_results.values():
+            result.unwrap()
+
+        if verbose:
+            for country, master_ranking in self.master_ranking.items():
                 logger.info(f"Master ranking for {country}:\n")
                 logger.info(self.preview_df(master_ranking, n=5))
                 logger.info(f"Master ranking for {country} uploaded successfully.")
 
-        # Save master episodes DataFrame
-        for country, df_episodes in self.master_episodes.items():
-            storage_client.upload_df_as_parquet(
-                df=df_episodes,
-                container_name=container_name,
-                storage_key=f"{target_jobs_storage_key}/{country}/master_episodes.parquet",
-                overwrite=overwrite
-            )
-            if verbose:
+            for country, df_episodes in self.master_episodes.items():
                 logger.info(f"Master episodes for {country}:\n")
                 logger.info(self.preview_df(df_episodes, n=5))
                 logger.info(f"Master episodes for {country} uploaded successfully.")
@@ -96,7 +113,8 @@ class Enricher:
                 data=self.batch_job_json,
                 container_name=container_name,
                 storage_key=f"{target_jobs_storage_key}/batch_job.json",
-                overwrite=overwrite
+                overwrite=overwrite,
+                skip_unchanged=True
             )
             # and as a separate file for the transcription jobs source
             # this one will be overwritten by the next batch job
@@ -104,7 +122,8 @@ class Enricher:
                 data=self.batch_job_json,
                 container_name=container_name,
                 storage_key=f"batch_job.json",
-                overwrite=overwrite
+                overwrite=overwrite,
+                skip_unchanged=True
             )
             if verbose:
                 logger.info("Batch job JSON generated and uploaded successfully.")
@@ -121,7 +140,7 @@ class Enricher:
             overwrite=True
         )
 
-        logger.info("Results saved successfully.")
+        logger.info(f"Results saved successfully. Transfer: {storage_client.transfer_stats.summary()}")
 
         return self
 
@@ -147,10 +166,12 @@ class Enricher:
             target_storage_name: str = 'default',  # Default storage name for the output path
             target_protocol: str = "az",  # Default protocol for the output path,
             container_name: str = 'whisperer',  # Default container name for the output path
-            transcription_dir: str = "transcriptions"  # Default directory for transcriptions
+            transcription_dir: str = "transcriptions",  # Default directory for transcriptions
+            date_key: Optional[str] = None  # Partition date of the outputs (YYYY-MM-DD), today (UTC) if None
         ) -> 'Enricher':
         """
         Generate a batch job JSON file for whisperer transcription and upload it to the storage.
+        The transcriptions are written to the `date=<date_key>` partition, the one of `save_results`.
         """
         logger.info("Generating batch job JSON...")
         # Validate the jobs_limit parameter
@@ -161,10 +182,10 @@ class Enricher:
 
         # Initialize the batch job JSON list
         batch_job_json = []
-        today = datetime.datetime.now(datetime.UTC).strftime('%Y-%m-%d')
+        partition_date = date_key or datetime.datetime.now(datetime.UTC).strftime('%Y-%m-%d')
         idx = 0
         target_prefix = f"{target_storage_name}+{target_protocol}"  # Default prefix for the output path
-        target_path = lambda c, idx: f"{target_prefix}://{container_name}/{transcription_dir}/date={today}/country={c}/{idx}.txt"
+        target_path = lambda c, idx: f"{target_prefix}://{container_name}/{transcription_dir}/date={partition_date}/country={c}/{idx}.txt"
 
         # Iterate over each country in the master ranking
         for country, df_episodes in self.master_episodes.items():
@@ -271,18 +292,27 @@ class Enricher:
         
         # Run the master ranking pipeline for each country
         for country in self.enrichment_params["countries"]:
+            # Get Master Ranking DataFrame,
+            # iTunes IDs it already has are verified with batched lookups in the country's storefront
+            df_ranking, unverified_ids = self.api_manager.verify_podcast_ids(
+                df=self._create_master_ranking(
+                    country=country
+                ),
+                podcast_api_id="itunes_id",
+                country=country
+            )
+
             # Create the master ranking for the country
             master_ranking = (
                 self.api_manager
-                    # Fill missing podcast IDs in the master ranking
+                    # Fill missing podcast IDs in the master ranking,
+                    # unverified IDs are kept when no replacement is found
                     .fill_missing_podcast_ids(
-                        # Get Master Ranking DataFrame
-                        df=self._create_master_ranking(
-                            country=country
-                        ),
+                        df=df_ranking,
                         title_column_name="podcast_title",  # clustered_title       # search by
                         podcasts_limit=podcasts_api_search_limit, 
-                        threshold=podcast_title_search_threshold
+                        threshold=podcast_title_search_threshold,
+                        unverified_ids=unverified_ids
                     ).sort_values(
                         # Sort the DataFrame by 'borda_score' in descending order
                         'borda_score', 
@@ -308,6 +338,8 @@ class Enricher:
         Run the episodes enrichment pipelines 
         for each podcast 
         in each master ranking.
+        Episodes of a country are fetched concurrently (bounded by the API manager's workers,
+        throttled per API), collected as records and turned into one DataFrame per country.
         """
         episodes_fetch_limit_per_podcast = self.enrichment_params.get(
             "episodes_fetch_limit_per_podcast"
@@ -316,106 +348,96 @@ class Enricher:
             "since_date_fetch"
         )
 
-        # Initialize the DataFrame for episodes
-        df_episodes = pd.DataFrame(
-            columns=[
-                # Country metadata
-                'country',
-                # Podcast metadata
-                'podcast_title', 'podcast_clustered_title', 
-                'podcast_api_id', 'podcast_id', 
-                'rank', 'borda_score', 'scraped_at', 
-                # Episode metadata
-                'fetched_at', 'episode_id', 'episode_title',
-                'release_date', 'duration', 
-                'transcription', 'audio_source'
-            ]
-        ) 
-
         # Iterate over each country in the master ranking
         for country, master_ranking in self.master_ranking.items():
-            for _, row in master_ranking.iterrows():
 
-
-                # Get the podcast ID from the row
+            # Podcasts with an API id, Podcast Index preferred over iTunes
+            podcasts = []
+            for row in master_ranking.to_dict("records"):
                 podcast_api_id = 'podcasting_index_id'
                 podcast_id = row.get(podcast_api_id)
                 if not podcast_id:
                     podcast_api_id = 'itunes_id'
                     podcast_id = row.get(podcast_api_id)
                 if not podcast_id:
-                    podcast_id = None
                     continue
+                podcasts.append((row, podcast_id, podcast_api_id))
 
-                # Podcast metadata for each row
-                podcast_clustered_title, podcast_title = row.get('clustered_title', None), row.get('podcast_title')
-                rank, borda_score, scraped_at = row.get('rank'), row.get('borda_score'), row.get('scraped_at')
-
-                # Fetch episodes for each podcast in the master ranking
-                episodes = self.api_manager.get_episodes_by_podcast_id(
-                    id=podcast_id,
-                    since=since_date_fetch,
-                    limit=episodes_fetch_limit_per_podcast,
-                    podcast_api_id=podcast_api_id
-                )
+            # Fetch episodes for each podcast in the master ranking
+            fetched = self.api_manager.get_episodes_for_podcasts(
+                podcasts=[(podcast_id, podcast_api_id) for _, podcast_id, podcast_api_id in podcasts],
+                since=since_date_fetch,
+                limit=episodes_fetch_limit_per_podcast
+            )
 
-                fetched_at = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time()))
-
-                # Process each episode and append to the DataFrame
-                if episodes:
-                    new_episodes_rows=[{
-                        'country': country,
-                        'podcast_title': podcast_title,
-                        'podcast_clustered_title': podcast_clustered_title,
-                        'podcast_api_id': podcast_api_id,
-                        'podcast_id': podcast_id,
-                        'rank': rank,
-                        'borda_score': borda_score,
-                        'scraped_at': scraped_at,  # Timestamp when the podcast was scraped
-                        'fetched_at': fetched_at,
-                        'episode_id': episode.get('id', ''),
-                        'episode_title': episode.get('title', ''),
-                        'release_date': episode.get('release_date', ''),
-                        'duration': episode.get('duration', 0),  # Duration in seconds
-                        'transcription': episode.get('transcription', None),  # Transcription URL or text
-                        'audio_source': episode.get('audio_source', '') if str(episode.get('audio_source', '')).endswith(('.mp3', '.m4a', '.wav')) or any(x in str(episode.get('audio_source', '')) for x in ['.mp3?', '.wav?', '.m4a?']) else None
-                    } for episode in episodes]
-
-                    df_new_episodes = pd.DataFrame(new_episodes_rows)
-
-                    # Append new episodes to the DataFrame
-                    df_episodes = pd.concat(
-                        [df_episodes, df_new_episodes],
-                        ignore_index=True
-                    )
-                else:
+            # Episode records of the country only
+            records = []
+            for (row, podcast_id, podcast_api_id), (episodes, fetched_at) in zip(podcasts, fetched):
+                if not episodes:
                     logger.warning(
                         f"No episodes found for podcast ID: {podcast_id} in country: {country}"
                     )
                     continue
 
+                # Podcast metadata for each row
+                podcast_clustered_title, podcast_title = row.get('clustered_title', None), row.get('podcast_title')
+                rank, borda_score, scraped_at = row.get('rank'), row.get('borda_score'), row.get('scraped_at')
+
+                records.extend({
+                    'country': country,
+                    'podcast_title': podcast_title,
+                    'podcast_clustered_title': podcast_clustered_title,
+                    'podcast_api_id': podcast_api_id,
+                    'podcast_id': podcast_id,
+                    'rank': rank,
+                    'borda_score': borda_score,
+                    'scraped_at': scraped_at,  # Timestamp when the podcast was scraped
+                    'fetched_at': fetched_at,
+                    'episode_id': episode.get('id', ''),
+                    'episode_title': episode.get('title', ''),
+                    'release_date': episode.get('release_date', ''),
+                    'duration': episode.get('duration', 0),  # Duration in seconds
+                    'transcription': episode.get('transcription', None),  # Transcription URL or text
+                    'audio_source': self._audio_source(episode.get('audio_source', ''))
+                } for episode in episodes)
+
             # Add dataframe to the dictionary with country as key
             # ordered by 'borda_score' descending, rank ascending
-            if df_episodes.empty:
+            if not records:
                 logger.warning(
                     f"No episodes found for country: {country}. Skipping."
                 )
                 continue
+
+            # Build the DataFrame once from the collected records
             df_episodes = (
-                df_episodes
+                pd.DataFrame.from_records(records, columns=self.episode_columns)
                     .sort_values(
                         by=['borda_score', 'rank'], 
                         ascending=[False, True]
                     )
                     .reset_index(drop=True)  # Reset index after sorting
             )
-            # Reset index to ensure it is clean
             self.master_episodes[country] = df_episodes
 
         return self
 
 
 
+    @staticmethod
+    def _audio_source(
+            audio_source: str
+        ) -> Optional[str]:
+        """
+        Audio file url of an episode, None if it does not point to an audio file.
+        """
+        audio_source = str(audio_source or '')
+        if audio_source.endswith(('.mp3', '.m4a', '.wav')) or any(x in audio_source for x in ['.mp3?', '.wav?', '.m4a?']):
+            return audio_source
+        return None
+
+
+
     def _create_master_ranking(
             self,
             country: str = "us",
@@ -0,0 +1,192 @@
+import time
+import pandas as pd
+from typing import Optional
+from app.src.logger import logger
+from app.src.ranker_tools.normalize_title import normalize_title
+
+DAY = 24 * 60 * 60
+
+# Days a matched ID is trusted before its title is searched again
+DEFAULT_REVERIFY_DAYS = 30
+# Days a title without a match is skipped before it is searched again,
+# new podcasts take a while to show up in the search APIs
+DEFAULT_MISS_REVERIFY_DAYS = 3
+
+
+class TitleResolutionIndex:
+    """
+    Persistent index of podcast title -> podcast ID resolutions, one row per
+    (normalized title, ID column) with the matched API title, its fuzzy match score
+    and the time it was last verified by an API search.
+    Stored as one Parquet file of a storage_lib client, read by `load()` before
+    and written by `save()` after a run, so only new (or expired) titles are searched.
+
+    Usage:
+        index = TitleResolutionIndex(storage_client, "whisperer", "full_podcasts_data/title_index/titles.parquet")
+        index.load()
+        entry, fresh = index.get("The Daily", "itunes_id")
+        index.record("The Daily", "itunes_id", podcast_id="1200361736", matched_title="The Daily", score=100)
+        index.save()
+    """
+    columns = ["normalized_title", "id_column", "podcast_id", "matched_title", "score", "last_verified"]
+
+    def __init__(
+            self,
+            storage_client,
+            container_name: str,
+            storage_key: str,
+            reverify_days: float = DEFAULT_REVERIFY_DAYS,
+            miss_reverify_days: float = DEFAULT_MISS_REVERIFY_DAYS
+        ):
+        """
+        :param reverify_days: Days a matched ID is used without searching its title again.
+        :param miss_reverify_days: Days a title without a match is not searched again.
+        """
+        if reverify_days < 0 or miss_reverify_days < 0:
+            raise ValueError("reverify_days and miss_reverify_days must not be negative")
+
+        self.storage_client = storage_client
+        self.container_name = container_name
+        self.storage_key = storage_key
+        self.reverify_days = reverify_days
+        self.miss_reverify_days = miss_reverify_days
+        self._entries: dict[tuple[str, str], dict] = {}
+        self._changed = False
+        self.hits = 0
+        self.expired = 0
+        self.misses = 0
+
+
+    def __len__(
+            self
+        ) -> int:
+        return len(self._entries)
+
+
+    @staticmethod
+    def key(
+            title: str,
+            id_column: str
+        ) -> tuple[str, str]:
+        return normalize_title(title), id_column
+
+
+    def get(
+            self,
+            title: str,
+            id_column: str
+        ) -> tuple[Optional[dict], bool]:
+        """
+        Indexed resolution of the title for the ID column.
+        An empty `podcast_id` records a search without a match.
+        :return: (entry, fresh), entry is None for titles that were never searched,
+            fresh is False once the entry is due for re-verification.
+        """
+        entry = self._entries.get(self.key(title, id_column))
+        if entry is None:
+            self.misses += 1
+            return None, False
+
+        max_age = (self.reverify_days if entry["podcast_id"] else self.miss_reverify_days) * DAY
+        fresh = time.time() - entry["last_verified"] < max_age
+        if fresh:
+            self.hits += 1
+        else:
+            self.expired += 1
+        return entry, fresh
+
+
+    def record(
+            self,
+            title: str,
+            id_column: str,
+            podcast_id: str = "",
+            matched_title: str = "",
+            score: float = 0
+        ) -> None:
+        """
+        Store the result of a search for the title, an empty podcast_id when nothing matched.
+        """
+        self._entries[self.key(title, id_column)] = {
+            "podcast_id": str(podcast_id or ""),
+            "matched_title": matched_title or "",
+            "score": float(score or 0),
+            "last_verified": int(time.time())
+        }
+        self._changed = True
+
+
+    def to_dataframe(
+            self
+        ) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                {"normalized_title": normalized_title, "id_column": id_column, **entry}
+                for (normalized_title, id_column), entry in self._entries.items()
+            ],
+            columns=self.columns
+        ).sort_values(["id_column", "normalized_title"], ignore_index=True)
+
+
+    def load(
+            self
+        ) -> int:
+        """
+        Read the index from storage, an empty index if it does not exist (yet)
+        or can not be read.
+        :return: Number of loaded entries.
+        """
+        try:
+            if not self.storage_client.key_exists(
+                container_name=self.container_name,
+                storage_key=self.storage_key
+            ):
+                logger.info(f"No title index at {self.storage_key}, starting an empty one.")
+                return 0
+            df = self.storage_client.read_parquet(
+                container_name=self.container_name,
+                storage_key=self.storage_key,
+                columns=self.columns
+            )
+        except Exception as e:
+            logger.warning(f"Could not load the title index: {e}")
+            return 0
+
+        for row in df.fillna({"podcast_id": "", "matched_title": "", "score": 0}).itertuples(index=False):
+            self._entries[(row.normalized_title, row.id_column)] = {
+                "podcast_id": str(row.podcast_id),
+                "matched_title": row.matched_title,
+                "score": float(row.score),
+                "last_verified": int(row.last_verified)
+            }
+        logger.info(f"Loaded {len(df)} title resolutions from {self.storage_key}.")
+        return len(df)
+
+
+    def save(
+            self
+        ) -> None:
+        """
+        Write the index to storage when it changed during the run.
+        Errors are logged, the index must not fail a run.
+        """
+        if not self._changed:
+            return
+        try:
+            self.storage_client.upload_df_as_parquet(
+                storage_key=self.storage_key,
+                df=self.to_dataframe(),
+                container_name=self.container_name,
+                overwrite=True
+            )
+        except Exception as e:
+            logger.warning(f"Could not save the title index: {e}")
+            return
+        self._changed = False
+        logger.info(f"Saved {len(self)} title resolutions to {self.storage_key}. {self.summary()}")
+
+
+    def summary(
+            self
+        ) -> str:
+        return f"Title index: {self.hits} hits, {self.expired} re-verified, {self.misses} new titles."
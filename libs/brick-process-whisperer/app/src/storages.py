@@ -1,6 +1,7 @@
 
 import os
 import logging
+import threading
 from typing import List, Dict, Any
 from storage_lib import StorageClient
 from app.src.utils import str_to_bool, false_or_path, get_file_or_env
@@ -12,6 +13,10 @@ from app.conf.conf import (
 
 STORAGE_CONFIGURATIONS_DIR = 'config/'
 
+# Connection pool size of each storage client,
+# can be overridden per storage with `conn.max_pool_connections`
+STORAGE_MAX_POOL_CONNECTIONS = int(os.getenv("STORAGE_MAX_POOL_CONNECTIONS", 10))
+
 class Storages:
     """
     Singleton class to manage storage configurations.
@@ -24,6 +29,8 @@ class Storages:
         if cls._instance is None:
             cls._instance = super(Storages, cls).__new__(cls)
             cls._instance.storages = []
+            cls._instance._clients = {}
+            cls._instance._clients_lock = threading.Lock()
         return cls._instance
 
 
@@ -43,13 +50,21 @@ class Storages:
         ) -> object:
         """
         Returns the storage client by name.
+        Clients are created once per (name, type) and shared between tasks.
         """
-        for config in self.configs:
-            if config.get("conn.name", None) == name:
-                if type and config.get("conn.type") != type:
-                    continue
-                print(f"Found config: {name} of type {config.get('conn.type')}")
-                return self.get_storage_client(config)
+        with self._clients_lock:
+            client = self._clients.get((name, type))
+            if client is not None:
+                return client
+
+            for config in self.configs:
+                if config.get("conn.name", None) == name:
+                    if type and config.get("conn.type") != type:
+                        continue
+                    print(f"Found config: {name} of type {config.get('conn.type')}")
+                    client = self.get_storage_client(config)
+                    self._clients[(name, type)] = client
+                    return client
         raise ValueError(f"Storage client with name '{name}' not found.")
     
 
@@ -185,8 +200,14 @@ class Storages:
         else:
             raise ValueError(f"Unsupported connection type: {conn_type}. Supported types are: {supported_conn_types}")
         
-        # Create and return the storage client
-        return StorageClient( credentials=credentials )
+        # Create and return the storage client,
+        # backend clients with the same credentials are shared process-wide
+        return StorageClient(
+            credentials=credentials,
+            max_pool_connections=int(
+                config.get("conn.max_pool_connections", STORAGE_MAX_POOL_CONNECTIONS)
+            )
+        )
 
 
 
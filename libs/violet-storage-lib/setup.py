@@ -11,6 +11,9 @@ from setuptools import setup, find_packages
 #
 # parquet support can be added by installing the optional dependency:
 # pip install /path-to/violet-storage-lib[parquet]
+#
+# async clients (AsyncStorageClient) require:
+# pip install /path-to/violet-storage-lib[async]
 
 setup(
     name="violet-storage-lib",
@@ -23,7 +26,8 @@ setup(
         "boto3",
     ],
     extras_require={
-        "parquet": ["pyarrow"],
+        "parquet": ["pyarrow>=14"],
+        "async": ["aiobotocore", "aiohttp"],
     },
     python_requires=">=3.8",
 )
@@ -2,13 +2,21 @@ from .client import StorageClient
 from .local_client import LocalStorageClient
 from .client_s3 import S3StorageClient
 from .client_azure import AzureBlobStorageClient
+from .client_async import AsyncStorageClient
 from .errors import StorageDownloadError, StorageUploadError
+from .utils.batch import BatchResult
+from .utils.content_hash import TransferStats
 
 __all__ = [
     "StorageClient",
     "LocalStorageClient",
     "S3StorageClient",
     "AzureBlobStorageClient",
+    # Async Client
+    "AsyncStorageClient",
+    # Batch results
+    "BatchResult",
+    "TransferStats",
     # Errors
     "StorageDownloadError",
     "StorageUploadError"
@@ -2,14 +2,42 @@ from io import BytesIO
 import json
 import datetime
 from storage_lib.utils.logger import logger
-from storage_lib.decorators.parquet_decorator import parquet_writes
+from storage_lib.decorators.parquet_decorator import parquet_writes, parquet_reads
+from storage_lib.decorators.batch_decorator import batch_operations
+from storage_lib.decorators.partition_decorator import partition_listing
 from storage_lib.utils.latest_stamper import LatestStamper
-from typing import Optional
+from storage_lib.utils.transfer import (
+    DEFAULT_PART_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_LIST_PAGE_SIZE,
+    StreamSource
+)
+from storage_lib.utils.range_reader import (
+    RangeReader,
+    DEFAULT_BLOCK_SIZE,
+    DEFAULT_MAX_CACHED_BLOCKS,
+    DEFAULT_RANGE_CONCURRENCY
+)
+from storage_lib.utils.client_registry import (
+    client_registry,
+    make_client_key,
+    DEFAULT_MAX_POOL_CONNECTIONS
+)
+from storage_lib.utils.content_hash import (
+    CONTENT_MD5_METADATA_KEY,
+    TransferStats,
+    content_md5
+)
+from typing import Iterator, Optional
 
 from storage_lib.client_azure import AzureBlobStorageClient
 from storage_lib.client_s3 import S3StorageClient
 
+@partition_listing
+@batch_operations
 @parquet_writes
+@parquet_reads
 class StorageClient:
     azure_storage_constructor = AzureBlobStorageClient
     s3_storage_constructor = S3StorageClient
@@ -21,30 +49,46 @@ class StorageClient:
             self, 
             credentials: dict = None,
             # container_name: str = "whisper",
+            max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+            reuse_client: bool = True
         ):
+        """
+        :param max_pool_connections: HTTP connection pool size of the backend client.
+        :param reuse_client: Share the backend client with every StorageClient
+            created with the same credentials and pool size in this process.
+        """
         # Azure Blob Storage credentials
         az_storage_account = credentials.get("azure_storage_account", "")
         # S3 credentials
         s3_access_key = credentials.get("s3_access_key", "")
         # stamper placeholder
         self._stamper = None
+        # uploaded / skipped bytes of this client
+        self.transfer_stats = TransferStats()
 
         # Try Azure Blob Storage client initialization
         if az_storage_account:
-            self.storage_client = self.azure_storage_constructor(
+            backend = "azure"
+            constructor = self.azure_storage_constructor
+            backend_kwargs = dict(
                 azure_storage_account = credentials.get("azure_storage_account", ""),
-                azure_storage_key = credentials.get("azure_storage_key", "")
+                azure_storage_key = credentials.get("azure_storage_key", ""),
+                azure_storage_connection_string = credentials.get("azure_storage_connection_string", None),
+                max_pool_connections = max_pool_connections
             )
             # self.storage_client.container_name = container_name
 
         # Try S3 client initialization
         elif s3_access_key:
-            self.storage_client = self.s3_storage_constructor(
+            backend = "s3"
+            constructor = self.s3_storage_constructor
+            backend_kwargs = dict(
                 s3_access_key = credentials.get("s3_access_key", ""),
                 s3_secret_key = credentials.get("s3_secret_key", ""),
                 s3_endpoint_url = credentials.get("s3_endpoint_url", ""),
                 s3_use_ssl = credentials.get("s3_use_ssl", "true"),
-                s3_region_name = credentials.get("s3_region_name", "")
+                s3_region_name = credentials.get("s3_region_name", ""),
+                max_pool_connections = max_pool_connections
             )
             # self.storage_client.container_name = container_name
         else:
@@ -53,6 +97,15 @@ class StorageClient:
                 "Please provide either Azure Blob Storage or S3 credentials."
             )
 
+        if reuse_client:
+            # constructor is part of the key, so subclasses get their own clients
+            self.storage_client = client_registry.get_or_create(
+                make_client_key(backend, constructor=constructor, **backend_kwargs),
+                lambda: constructor(**backend_kwargs)
+            )
+        else:
+            self.storage_client = constructor(**backend_kwargs)
+
     def list_containers(self) -> list:
         """
         List all containers in Storage.
@@ -60,6 +113,30 @@ class StorageClient:
         return self.storage_client.list_containers()
     
 
+    def list_keys(
+            self, 
+            container_name: str,
+            prefix: str = "",
+            delimiter: Optional[str] = None,
+            page_size: int = DEFAULT_LIST_PAGE_SIZE,
+            start_after: Optional[str] = None
+        ) -> Iterator[str]:
+        """
+        Lazily list keys in Storage starting with the prefix.
+        Pages of `page_size` keys are requested only as the iterator is consumed.
+        With a delimiter (e.g. "/"), deeper keys are rolled up into
+        a single "directory" entry ending with the delimiter.
+        Only keys sorting after `start_after` are returned.
+        """
+        return self.storage_client.list_keys(
+            container_name=container_name,
+            prefix=prefix,
+            delimiter=delimiter,
+            page_size=page_size,
+            start_after=start_after
+        )
+
+
     def key_exists(
             self, 
             container_name: str,
@@ -80,17 +157,37 @@ class StorageClient:
             storage_key: str, 
             source: BytesIO,
             container_name: str, 
-            overwrite: bool = True
+            overwrite: bool = True,
+            skip_unchanged: bool = False
         ) -> None:
         """
         Upload a file to Storage.
+        The content MD5 is stored as object metadata, with `skip_unchanged`
+        the upload is skipped if the remote object already has the same content.
         """
-        self.storage_client.upload_object(
+        digest = content_md5(source)
+        size = source.getbuffer().nbytes
+
+        if skip_unchanged and self.storage_client.get_content_hash(
+            container_name=container_name,
+            storage_key=storage_key
+        ) == digest:
+            logger.info(f"{storage_key} is unchanged. Skipping upload.")
+            self.transfer_stats.record_skip(size)
+            return
+
+        uploaded = self.storage_client.upload_object(
             storage_key=storage_key,
             source=source,
             container_name=container_name,
-            overwrite=overwrite
+            overwrite=overwrite,
+            metadata={CONTENT_MD5_METADATA_KEY: digest}
         )
+        # The backends skip existing keys when overwrite is False
+        if uploaded is False:
+            self.transfer_stats.record_skip(size)
+        else:
+            self.transfer_stats.record_upload(size)
 
 
     def set_latest_stamper(
@@ -131,6 +228,30 @@ class StorageClient:
         )
 
 
+    def upload_stream(
+            self, 
+            storage_key: str, 
+            source: StreamSource,
+            container_name: str, 
+            overwrite: bool = True,
+            part_size: int = DEFAULT_PART_SIZE,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+        ) -> None:
+        """
+        Upload a file handle or an iterator of bytes chunks to Storage.
+        The source is handed to the backend multipart/block upload,
+        so memory use stays flat regardless of the object size.
+        """
+        self.storage_client.upload_stream(
+            storage_key=storage_key,
+            source=source,
+            container_name=container_name,
+            overwrite=overwrite,
+            part_size=part_size,
+            max_concurrency=max_concurrency
+        )
+
+
     def upload_timestamp(
             self, 
             storage_key: str, 
@@ -184,6 +305,72 @@ class StorageClient:
         )
 
 
+    def open_read(
+            self, 
+            storage_key: str,
+            container_name: str,
+            block_size: int = DEFAULT_BLOCK_SIZE,
+            max_cached_blocks: int = DEFAULT_MAX_CACHED_BLOCKS,
+            max_concurrency: int = DEFAULT_RANGE_CONCURRENCY
+        ) -> RangeReader:
+        """
+        Open a file in Storage as a seekable, read-only file-like object.
+        Data is fetched on demand with range requests and cached in blocks,
+        so readers like pyarrow.parquet only download the parts they need.
+        """
+        size = self.storage_client.get_object_size(
+            container_name=container_name, 
+            storage_key=storage_key,
+        )
+
+        def fetch_range(offset: int, length: int) -> bytes:
+            return self.storage_client.download_range(
+                container_name=container_name, 
+                storage_key=storage_key,
+                offset=offset,
+                length=length
+            )
+
+        return RangeReader(
+            fetch_range=fetch_range,
+            size=size,
+            block_size=block_size,
+            max_cached_blocks=max_cached_blocks,
+            max_concurrency=max_concurrency,
+            name=f"{container_name}/{storage_key}"
+        )
+
+
+    def iter_chunks(
+            self, 
+            storage_key: str,
+            container_name: str,
+            chunk_size: int = DEFAULT_CHUNK_SIZE
+        ) -> Iterator[bytes]:
+        """
+        Stream a file from Storage as chunks of bytes.
+        """
+        return self.storage_client.iter_chunks(
+            container_name=container_name, 
+            storage_key=storage_key,
+            chunk_size=chunk_size
+        )
+
+
+    def delete_object(
+            self, 
+            storage_key: str,
+            container_name: str,
+        ) -> None:
+        """
+        Delete a file from Storage, missing files are ignored.
+        """
+        self.storage_client.delete_object(
+            container_name=container_name, 
+            storage_key=storage_key,
+        )
+
+
     def download_json(
             self, 
             storage_key: str,
@@ -209,7 +396,8 @@ class StorageClient:
             storage_key: str, 
             data: dict | list,
             container_name: str, 
-            overwrite: bool = True
+            overwrite: bool = True,
+            skip_unchanged: bool = False
         ) -> None:
         """
         Upload a JSON file to Storage.
@@ -222,5 +410,6 @@ class StorageClient:
             storage_key=storage_key,
             source=source,
             container_name=container_name,
-            overwrite=overwrite
+            overwrite=overwrite,
+            skip_unchanged=skip_unchanged
         )
\ No newline at end of file
@@ -0,0 +1,230 @@
+from io import BytesIO
+import asyncio
+import json
+import datetime
+from storage_lib.utils.logger import logger
+from storage_lib.utils.parquet import df_to_parquet_buffer
+from storage_lib.utils.latest_stamper import LatestStamper
+from storage_lib.utils.transfer import DEFAULT_ASYNC_POOL_CONNECTIONS
+from typing import Any, Optional
+
+from storage_lib.client_azure_async import AsyncAzureBlobStorageClient
+from storage_lib.client_s3_async import AsyncS3StorageClient
+
+
+class AsyncStorageClient:
+    azure_storage_constructor = AsyncAzureBlobStorageClient
+    s3_storage_constructor = AsyncS3StorageClient
+
+    """
+    Async client for Azure Blob Storage / S3 Storage.
+    Mirrors StorageClient for use inside an event loop (e.g. FastAPI handlers).
+    The backend client keeps one pooled connection set per instance,
+    so create it once per process and share it between tasks.
+
+    Usage:
+        async with AsyncStorageClient(credentials) as client:
+            await client.upload_json("key.json", data, "whisperer")
+    """
+    def __init__(
+            self,
+            credentials: dict = None,
+            max_pool_connections: int = DEFAULT_ASYNC_POOL_CONNECTIONS
+        ):
+        credentials = credentials or {}
+        # Azure Blob Storage credentials
+        az_storage_account = credentials.get("azure_storage_account", "")
+        # S3 credentials
+        s3_access_key = credentials.get("s3_access_key", "")
+        # stamper placeholder
+        self._stamper = None
+
+        # Try Azure Blob Storage client initialization
+        if az_storage_account:
+            self.storage_client = self.azure_storage_constructor(
+                azure_storage_account = credentials.get("azure_storage_account", ""),
+                azure_storage_key = credentials.get("azure_storage_key", ""),
+                max_pool_connections = max_pool_connections
+            )
+
+        # Try S3 client initialization
+        elif s3_access_key:
+            self.storage_client = self.s3_storage_constructor(
+                s3_access_key = credentials.get("s3_access_key", ""),
+                s3_secret_key = credentials.get("s3_secret_key", ""),
+                s3_endpoint_url = credentials.get("s3_endpoint_url", ""),
+                s3_use_ssl = credentials.get("s3_use_ssl", "true"),
+                s3_region_name = credentials.get("s3_region_name", ""),
+                max_pool_connections = max_pool_connections
+            )
+        else:
+            raise ValueError(
+                "No valid storage credentials provided. "
+                "Please provide either Azure Blob Storage or S3 credentials."
+            )
+
+    async def __aenter__(self) -> "AsyncStorageClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the backend client and release pooled connections.
+        """
+        await self.storage_client.close()
+
+
+    async def list_containers(self) -> list:
+        """
+        List all containers in Storage.
+        """
+        return await self.storage_client.list_containers()
+
+
+    async def key_exists(
+            self,
+            container_name: str,
+            storage_key: str,
+        ) -> bool:
+        """
+        Check if a file exists in Storage.
+        """
+        return await self.storage_client.key_exists(
+            container_name=container_name,
+            storage_key=storage_key
+        )
+
+
+    async def upload_object(
+            self,
+            storage_key: str,
+            source: BytesIO,
+            container_name: str,
+            overwrite: bool = True
+        ) -> None:
+        """
+        Upload a file to Storage.
+        """
+        await self.storage_client.upload_object(
+            storage_key=storage_key,
+            source=source,
+            container_name=container_name,
+            overwrite=overwrite
+        )
+
+
+    async def download_object(
+            self,
+            storage_key: str,
+            container_name: str,
+        ) -> BytesIO:
+        """
+        Download a file from Storage and return it as a BytesIO object.
+        """
+        return await self.storage_client.download_object(
+            container_name=container_name,
+            storage_key=storage_key,
+        )
+
+
+    def set_latest_stamper(
+            self,
+            utc_time: Optional[datetime.datetime] = None
+        ) -> LatestStamper:
+        """
+        Set the latest timestamp stamper.
+        """
+        self._stamper = LatestStamper(
+            utc_time=utc_time or datetime.datetime.now(datetime.UTC)
+        )
+
+    @property
+    def stamper(self) -> LatestStamper:
+        """
+        Get the latest timestamp stamper.
+        """
+        if not self._stamper:
+            self.set_latest_stamper()
+        return self._stamper
+
+
+    async def upload_timestamp(
+            self,
+            storage_key: str,
+            container_name: str,
+            utc_time: Optional[datetime.datetime] = None,
+            overwrite: bool = True
+        ) -> None:
+        """
+        Upload a timestamp to Storage.
+        """
+        self.set_latest_stamper(utc_time=utc_time)
+
+        logger.info(f"Uploading latest timestamp to {container_name}/{storage_key}")
+
+        await self.storage_client.upload_object(
+            storage_key=storage_key,
+            source=self._stamper.json_bytes_io,
+            container_name=container_name,
+            overwrite=overwrite
+        )
+
+
+    async def download_json(
+            self,
+            storage_key: str,
+            container_name: str,
+        ) -> dict:
+        """
+        Download a JSON file from Storage and return it as a dictionary.
+        """
+        bytesIO = await self.download_object(
+            storage_key=storage_key,
+            container_name=container_name,
+        )
+        return json.loads(bytesIO.read().decode('utf-8'))
+
+
+    async def upload_json(
+            self,
+            storage_key: str,
+            data: dict | list,
+            container_name: str,
+            overwrite: bool = True
+        ) -> None:
+        """
+        Upload a JSON file to Storage.
+        """
+        json_data = json.dumps(data, indent=4)
+        source = BytesIO(json_data.encode('utf-8'))
+        await self.upload_object(
+            storage_key=storage_key,
+            source=source,
+            container_name=container_name,
+            overwrite=overwrite
+        )
+
+
+    async def upload_df_as_parquet(
+            self,
+            storage_key: str,
+            df: "DataFrame",
+            container_name: str,
+            overwrite: bool = True,
+            **parquet_options: Any
+        ) -> None:
+        """
+        Write a DataFrame to a Parquet file in Storage.
+        Parquet encoding is CPU bound, so it runs in a worker thread
+        to keep the event loop responsive.
+        :param parquet_options: Writer options of df_to_parquet_buffer.
+        """
+        buffer = await asyncio.to_thread(df_to_parquet_buffer, df, **parquet_options)
+        await self.upload_object(
+            storage_key=storage_key,
+            source=buffer,
+            container_name=container_name,
+            overwrite=overwrite
+        )
@@ -1,11 +1,29 @@
 import os
+import base64
 from io import BytesIO
-from azure.storage.blob import BlobServiceClient
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from azure.storage.blob import BlobServiceClient, BlobBlock
 from azure.identity import DefaultAzureCredential
+from azure.core.pipeline.transport import RequestsTransport
+from azure.core.exceptions import ResourceNotFoundError
+from requests import Session
+from requests.adapters import HTTPAdapter
 from storage_lib.errors import StorageUploadError, StorageDownloadError
 from storage_lib.utils.logger import logger
-from typing import Optional
+from typing import Iterator, Optional
 from storage_lib.utils.validate import Validate
+from storage_lib.utils.transfer import (
+    DEFAULT_PART_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_LIST_PAGE_SIZE,
+    StreamSource,
+    as_readable,
+    read_part,
+    validate_transfer_settings
+)
+from storage_lib.utils.client_registry import DEFAULT_MAX_POOL_CONNECTIONS
+from storage_lib.utils.content_hash import CONTENT_MD5_METADATA_KEY
 
 
 class AzureBlobStorageClient:
@@ -16,17 +34,22 @@ class AzureBlobStorageClient:
             self, 
             azure_storage_account: Optional[str],
             azure_storage_key: Optional[str] = None,
-            azure_storage_connection_string: Optional[str] = None
+            azure_storage_connection_string: Optional[str] = None,
+            max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS
         ):
 
         Validate.non_empty_string(azure_storage_account, "azure_storage_account")
 
+        # Shared transport with a pool sized for the threads using this client
+        transport = self._build_transport(max_pool_connections)
+
         if azure_storage_connection_string:
             """
             Use connection string for authentication.
             """
             self.blob_service_client = BlobServiceClient.from_connection_string(
-                azure_storage_connection_string
+                azure_storage_connection_string,
+                transport=transport
             )
         elif azure_storage_account and azure_storage_key:
             """
@@ -40,7 +63,8 @@ class AzureBlobStorageClient:
             )
         
             self.blob_service_client = BlobServiceClient.from_connection_string(
-                connection_string
+                connection_string,
+                transport=transport
             )
         elif azure_storage_account:
             """
@@ -61,7 +85,8 @@ class AzureBlobStorageClient:
 
             self.blob_service_client = BlobServiceClient(
                 account_url=f"https://{azure_storage_account}.blob.core.windows.net",
-                credential=credential
+                credential=credential,
+                transport=transport
             )
         else:
             raise ValueError(
@@ -69,6 +94,23 @@ class AzureBlobStorageClient:
                 "Or at least Azure Storage Account for DefaultAzureCredential."
             )
 
+    @staticmethod
+    def _build_transport(
+            max_pool_connections: int
+        ) -> RequestsTransport:
+        """
+        Build a requests based transport with a connection pool of the given size.
+        """
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_pool_connections,
+            pool_maxsize=max_pool_connections
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return RequestsTransport(session=session, session_owner=False)
+
+
     def list_containers(
             self
         ) -> list:
@@ -83,6 +125,44 @@ class AzureBlobStorageClient:
             raise StorageDownloadError(f"Failed to list containers: {e}")
 
 
+    def list_keys(
+            self, 
+            container_name: str,
+            prefix: str = "",
+            delimiter: Optional[str] = None,
+            page_size: int = DEFAULT_LIST_PAGE_SIZE,
+            start_after: Optional[str] = None
+        ) -> Iterator[str]:
+        """
+        Lazily list blob names in a container, pages are fetched on demand.
+        With a delimiter, blobs below the next delimiter are rolled up
+        into a single virtual directory name ending with the delimiter.
+        """
+        Validate.non_empty_string(container_name, "container_name")
+
+        container_client = self.blob_service_client.get_container_client(container_name)
+        try:
+            if delimiter:
+                items = container_client.walk_blobs(
+                    name_starts_with=prefix or None,
+                    delimiter=delimiter,
+                    results_per_page=page_size
+                )
+            else:
+                items = container_client.list_blobs(
+                    name_starts_with=prefix or None,
+                    results_per_page=page_size
+                )
+
+            for item in items:
+                if start_after and item.name <= start_after:
+                    continue
+                yield item.name
+
+        except ResourceNotFoundError:
+            raise StorageDownloadError(f"Container {container_name} does not exist.")
+
+
     def key_exists(
             self, 
             container_name: str,
@@ -119,16 +199,81 @@ class AzureBlobStorageClient:
         if not os.path.exists(source):
             raise FileNotFoundError(f"Local file {source} does not exist.")
         
+        # Stream the file handle, the file is never loaded into memory
         with open(source, "rb") as f:
-            _data = BytesIO(f.read())
-    
-        self.upload_object(
-            source=_data, 
-            storage_key=storage_key, 
-            container_name=container_name, 
-            overwrite=overwrite
-        )
-        
+            self.upload_stream(
+                source=f, 
+                storage_key=storage_key, 
+                container_name=container_name, 
+                overwrite=overwrite
+            )
+
+
+    def upload_stream(
+            self, 
+            source: StreamSource,
+            storage_key: str, 
+            container_name: str, 
+            overwrite: bool = True,
+            part_size: int = DEFAULT_PART_SIZE,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+        ) -> None:
+        """
+        Upload a file handle or an iterator of bytes chunks to Azure Blob Storage.
+        The source is staged as blocks of part_size bytes, with at most
+        max_concurrency blocks in flight, and committed as a single blob.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+        validate_transfer_settings(part_size, max_concurrency)
+
+        try:
+            blob_client = self.blob_service_client.get_blob_client(
+                container=container_name, 
+                blob=storage_key
+            )
+
+            if not overwrite and blob_client.exists():
+                logger.warning(f"{storage_key} already exists. Skipping upload.")
+                return
+
+            reader = as_readable(source)
+            block_list = []
+            pending = set()
+
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                while True:
+                    chunk = read_part(reader, part_size)
+                    if not chunk:
+                        break
+
+                    # Block ids must be base64 and of equal length within a blob
+                    block_id = base64.b64encode(
+                        f"{len(block_list):08d}".encode("utf-8")
+                    ).decode("utf-8")
+                    block_list.append(BlobBlock(block_id=block_id))
+
+                    pending.add(executor.submit(
+                        blob_client.stage_block,
+                        block_id=block_id,
+                        data=chunk
+                    ))
+
+                    # Bound the number of buffered parts
+                    if len(pending) >= max_concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+
+                for future in pending:
+                    future.result()
+
+            blob_client.commit_block_list(block_list)
+            logger.info(f"Streamed {storage_key} to Azure Blob Storage.")
+
+        except Exception as e:
+            raise StorageUploadError(f"Failed to stream file to Azure Blob: {e}")
+
 
 
     def upload_object(
@@ -136,10 +281,12 @@ class AzureBlobStorageClient:
             source: BytesIO,
             storage_key: str, 
             container_name: str, 
-            overwrite: bool = True
-        ) -> None:
+            overwrite: bool = True,
+            metadata: Optional[dict] = None
+        ) -> bool:
         """
         Upload a BytesIO object to Azure Blob Storage.
+        :return: False if the upload was skipped (existing blob and overwrite=False).
         """
         Validate.non_empty_string(storage_key, "storage_key")
         Validate.non_empty_string(container_name, "container_name")
@@ -153,16 +300,47 @@ class AzureBlobStorageClient:
 
             if not blob_client.exists() or overwrite:
                 source.seek(0)  # Reset pointer for proper read
-                blob_client.upload_blob(source, overwrite=overwrite)
+                blob_client.upload_blob(source, overwrite=overwrite, metadata=metadata)
                 logger.info(f"Uploaded {storage_key} to Azure Blob Storage.")
-            else:
-                logger.warning(f"{storage_key} already exists. Skipping upload.")
+                return True
+            logger.warning(f"{storage_key} already exists. Skipping upload.")
+            return False
         
         except Exception as e:
             print(f"Error uploading data to '{container_name}/{storage_key}': {e}")
             raise StorageUploadError(f"Failed to upload file to Azure Blob: {e}")
 
 
+    def get_content_hash(
+            self, 
+            storage_key: str, 
+            container_name: str
+        ) -> Optional[str]:
+        """
+        Get the hex MD5 of a blob from its properties (single request),
+        from stored metadata or the service Content-MD5. None if missing or unknown.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        blob_client = self.blob_service_client.get_blob_client(
+            container=container_name, 
+            blob=storage_key
+        )
+        try:
+            properties = blob_client.get_blob_properties()
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            raise StorageDownloadError(f"Failed to get blob properties from Azure Blob: {e}")
+
+        stored = (properties.metadata or {}).get(CONTENT_MD5_METADATA_KEY)
+        if stored:
+            return stored
+        content_md5 = properties.content_settings.content_md5
+        return bytes(content_md5).hex() if content_md5 else None
+
+
     def _get_existing_blob_client(self, container_name: str, blob_name: str):
         blob_client = self.blob_service_client.get_blob_client(
             container=container_name,
@@ -203,11 +381,93 @@ class AzureBlobStorageClient:
         
 
 
+    def get_object_size(
+            self, 
+            storage_key: str, 
+            container_name: str, 
+        ) -> int:
+        """
+        Get the size in bytes of a blob in Azure Blob Storage.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        blob_client = self._get_existing_blob_client(
+            container_name=container_name, 
+            blob_name=storage_key
+        )
+
+        try:
+            return int(blob_client.get_blob_properties().size)
+        except Exception as e:
+            raise StorageDownloadError(
+                f"Failed to get blob size from Azure Blob: {e}"
+            )
+
+
+    def download_range(
+            self, 
+            storage_key: str, 
+            container_name: str, 
+            offset: int,
+            length: int
+        ) -> bytes:
+        """
+        Download a byte range [offset, offset + length) of a blob from Azure Blob Storage.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        if length <= 0:
+            return b""
+
+        blob_client = self.blob_service_client.get_blob_client(
+            container=container_name, 
+            blob=storage_key
+        )
+
+        try:
+            return blob_client.download_blob(
+                offset=offset, 
+                length=length
+            ).readall()
+        except Exception as e:
+            raise StorageDownloadError(
+                f"Failed to download range from Azure Blob: {e}"
+            )
+
+
+    def iter_chunks(
+            self, 
+            storage_key: str, 
+            container_name: str, 
+            chunk_size: int = DEFAULT_CHUNK_SIZE
+        ) -> Iterator[bytes]:
+        """
+        Stream a blob from Azure Blob Storage as chunks of bytes,
+        without loading the whole blob into memory.
+        Each chunk is fetched with a separate range request.
+        """
+        size = self.get_object_size(
+            storage_key=storage_key, 
+            container_name=container_name
+        )
+
+        for offset in range(0, size, chunk_size):
+            yield self.download_range(
+                storage_key=storage_key, 
+                container_name=container_name, 
+                offset=offset, 
+                length=min(chunk_size, size - offset)
+            )
+
+
     def download_file(
             self, 
             storage_key: str, 
             container_name: str, 
-            destination_path: str
+            destination_path: str,
+            overwrite: bool = True
         ) -> None:
         """
         Download a blob from Azure Blob Storage to a local file.
@@ -216,6 +476,10 @@ class AzureBlobStorageClient:
         Validate.non_empty_string(container_name, "container_name")
         Validate.non_empty_string(destination_path, "destination_path")
 
+        if not overwrite and os.path.exists(destination_path):
+            logger.warning(f"File already exists at {destination_path}. Skipping download.")
+            return
+
         blob_client = self._get_existing_blob_client(
             container_name=container_name, 
             blob_name=storage_key
@@ -237,10 +501,35 @@ class AzureBlobStorageClient:
                 os.makedirs(destination_dir)
 
             with open(destination_path, "wb") as f:
-                f.write(download_stream.readall())
+                download_stream.readinto(f)
             
             logger.info(f"Downloaded {storage_key} to {destination_path}.")
         except Exception as e:
             raise StorageDownloadError(
                 f"Failed to write downloaded file to {destination_path}: {e}"
-            )
\ No newline at end of file
+            )
+
+
+    def delete_object(
+            self, 
+            storage_key: str, 
+            container_name: str
+        ) -> None:
+        """
+        Delete a blob from Azure Blob Storage, missing blobs are ignored.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        blob_client = self.blob_service_client.get_blob_client(
+            container=container_name, 
+            blob=storage_key
+        )
+
+        try:
+            blob_client.delete_blob()
+            logger.info(f"Deleted {storage_key} from Azure Blob Storage.")
+        except ResourceNotFoundError:
+            logger.warning(f"Blob {storage_key} does not exist in container {container_name}.")
+        except Exception as e:
+            raise StorageUploadError(f"Failed to delete blob from Azure Blob: {e}")
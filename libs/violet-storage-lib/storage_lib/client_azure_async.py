@@ -0,0 +1,214 @@
+import asyncio
+from io import BytesIO
+from typing import Optional
+from storage_lib.errors import StorageUploadError, StorageDownloadError
+from storage_lib.utils.logger import logger
+from storage_lib.utils.validate import Validate
+from storage_lib.utils.transfer import DEFAULT_ASYNC_POOL_CONNECTIONS
+
+try:
+    import aiohttp
+    from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+    from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+    from azure.core.pipeline.transport import AioHttpTransport
+    from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+except ImportError:
+    aiohttp = None
+    AsyncBlobServiceClient = None
+
+
+class AsyncAzureBlobStorageClient:
+    """
+    Async client for Azure Blob Storage.
+    Uses azure.storage.blob.aio over a single aiohttp session,
+    the connection pool is created lazily inside the running event loop.
+    """
+    def __init__(
+            self,
+            azure_storage_account: Optional[str],
+            azure_storage_key: Optional[str] = None,
+            azure_storage_connection_string: Optional[str] = None,
+            max_pool_connections: int = DEFAULT_ASYNC_POOL_CONNECTIONS
+        ):
+        if AsyncBlobServiceClient is None:
+            raise ImportError(
+                "azure-storage-blob[aio] is required for the async Azure client. "
+                "Install with `pip install /path-to/violet-storage-lib[async]`."
+            )
+
+        Validate.non_empty_string(azure_storage_account, "azure_storage_account")
+
+        if azure_storage_connection_string:
+            self._connection_string = azure_storage_connection_string
+        elif azure_storage_account and azure_storage_key:
+            self._connection_string = (
+                "DefaultEndpointsProtocol=https;"
+                f"AccountName={azure_storage_account};"
+                f"AccountKey={azure_storage_key};"
+                "EndpointSuffix=core.windows.net"
+            )
+        elif azure_storage_account:
+            # DefaultAzureCredential is created with the client
+            self._connection_string = None
+        else:
+            raise ValueError(
+                "Azure Storage Account and Key must be provided for string based authentication."
+                "Or at least Azure Storage Account for DefaultAzureCredential."
+            )
+
+        self._account_url = f"https://{azure_storage_account}.blob.core.windows.net"
+        self._max_pool_connections = max_pool_connections
+        self._session = None
+        self._credential = None
+        self.blob_service_client = None
+        self._client_lock = asyncio.Lock()
+
+
+    async def _get_client(
+            self
+        ) -> "AsyncBlobServiceClient":
+        """
+        Create the pooled BlobServiceClient on first use.
+        """
+        if self.blob_service_client is None:
+            async with self._client_lock:
+                if self.blob_service_client is None:
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(limit=self._max_pool_connections)
+                    )
+                    transport = AioHttpTransport(
+                        session=self._session,
+                        session_owner=False
+                    )
+
+                    if self._connection_string:
+                        self.blob_service_client = AsyncBlobServiceClient.from_connection_string(
+                            self._connection_string,
+                            transport=transport
+                        )
+                    else:
+                        self._credential = AsyncDefaultAzureCredential()
+                        self.blob_service_client = AsyncBlobServiceClient(
+                            account_url=self._account_url,
+                            credential=self._credential,
+                            transport=transport
+                        )
+        return self.blob_service_client
+
+
+    async def close(
+            self
+        ) -> None:
+        """
+        Close the client, the credential and the underlying aiohttp session.
+        """
+        if self.blob_service_client is not None:
+            await self.blob_service_client.close()
+        if self._credential is not None:
+            await self._credential.close()
+        if self._session is not None:
+            await self._session.close()
+        self.blob_service_client = None
+        self._credential = None
+        self._session = None
+
+
+    async def list_containers(
+            self
+        ) -> list:
+        """
+        List all containers in the Azure Blob Storage account.
+        """
+        blob_service_client = await self._get_client()
+        try:
+            return [
+                container.name
+                async for container in blob_service_client.list_containers()
+            ]
+        except Exception as e:
+            logger.error(f"Failed to list containers: {e}")
+            raise StorageDownloadError(f"Failed to list containers: {e}")
+
+
+    async def key_exists(
+            self,
+            container_name: str,
+            storage_key: str,
+        ) -> bool:
+        """
+        Check if a blob exists in Azure Blob Storage.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        blob_service_client = await self._get_client()
+        blob_client = blob_service_client.get_blob_client(
+            container=container_name,
+            blob=storage_key
+        )
+        return await blob_client.exists()
+
+
+    async def upload_object(
+            self,
+            source: BytesIO,
+            storage_key: str,
+            container_name: str,
+            overwrite: bool = True
+        ) -> None:
+        """
+        Upload a BytesIO object to Azure Blob Storage.
+        Without overwrite the upload is conditional, so no separate existence check is made.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+        Validate.is_instance(source, BytesIO, "source")
+
+        blob_service_client = await self._get_client()
+        blob_client = blob_service_client.get_blob_client(
+            container=container_name,
+            blob=storage_key
+        )
+
+        try:
+            await blob_client.upload_blob(source.getvalue(), overwrite=overwrite)
+            logger.info(f"Uploaded {storage_key} to Azure Blob Storage.")
+
+        except ResourceExistsError:
+            logger.warning(f"{storage_key} already exists. Skipping upload.")
+
+        except Exception as e:
+            raise StorageUploadError(f"Failed to upload file to Azure Blob: {e}")
+
+
+    async def download_object(
+            self,
+            storage_key: str,
+            container_name: str,
+        ) -> BytesIO:
+        """
+        Download a blob from Azure Blob Storage.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        blob_service_client = await self._get_client()
+        blob_client = blob_service_client.get_blob_client(
+            container=container_name,
+            blob=storage_key
+        )
+
+        try:
+            download_stream = await blob_client.download_blob()
+            data = BytesIO(await download_stream.readall())
+            data.seek(0)
+            logger.info(f"Downloaded {storage_key} from Azure Blob Storage.")
+            return data
+
+        except ResourceNotFoundError:
+            raise FileNotFoundError(f"Blob {storage_key} does not exist in container {container_name}.")
+
+        except Exception as e:
+            raise StorageDownloadError(
+                f"Failed to download file from Azure Blob: {e}"
+            )
@@ -1,10 +1,24 @@
 import os
 from io import BytesIO
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from storage_lib.utils.logger import logger
-from typing import Optional
+from typing import Iterator, Optional
 from storage_lib.errors import StorageUploadError, StorageDownloadError
 from storage_lib.utils.validate import Validate
+from storage_lib.utils.transfer import (
+    DEFAULT_PART_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_LIST_PAGE_SIZE,
+    S3_MIN_PART_SIZE,
+    StreamSource,
+    as_readable,
+    validate_transfer_settings
+)
+from storage_lib.utils.client_registry import DEFAULT_MAX_POOL_CONNECTIONS
+from storage_lib.utils.content_hash import CONTENT_MD5_METADATA_KEY, etag_to_md5
 
 class S3StorageClient:
     """
@@ -17,7 +31,8 @@ class S3StorageClient:
             s3_secret_key: str,
             s3_endpoint_url: str = "",
             s3_use_ssl: str = "true",
-            s3_region_name: str = ""
+            s3_region_name: str = "",
+            max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS
         ):
 
         Validate.non_empty_string(s3_access_key, "s3_access_key")
@@ -45,7 +60,12 @@ class S3StorageClient:
             if value not in (None, ''):
                 kwargs[key] = value
 
-        self.s3_client = boto3.client('s3', **kwargs)
+        # Pool sized for the threads sharing this client (batch, multipart)
+        self.s3_client = boto3.client(
+            's3', 
+            config=Config(max_pool_connections=max_pool_connections),
+            **kwargs
+        )
 
 
     def key_exists(
@@ -86,6 +106,43 @@ class S3StorageClient:
             )
 
 
+    def list_keys(
+            self, 
+            container_name: str,
+            prefix: str = "",
+            delimiter: Optional[str] = None,
+            page_size: int = DEFAULT_LIST_PAGE_SIZE,
+            start_after: Optional[str] = None
+        ) -> Iterator[str]:
+        """
+        Lazily list keys in a bucket, one page request at a time.
+        With a delimiter, keys below the next delimiter are rolled up
+        into a single prefix ending with the delimiter (S3 CommonPrefixes).
+        """
+        Validate.non_empty_string(container_name, "container_name")
+
+        kwargs = {
+            'Bucket': container_name,
+            'Prefix': prefix or "",
+            'PaginationConfig': {'PageSize': page_size}
+        }
+        if delimiter:
+            kwargs['Delimiter'] = delimiter
+        if start_after:
+            kwargs['StartAfter'] = start_after
+
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        try:
+            for page in paginator.paginate(**kwargs):
+                names = [obj['Key'] for obj in page.get('Contents', [])]
+                names += [common['Prefix'] for common in page.get('CommonPrefixes', [])]
+                yield from sorted(names)
+        except self.s3_client.exceptions.ClientError as e:
+            raise StorageDownloadError(
+                f"Failed to list keys in S3: {e.response['Error']['Message']}"
+            )
+
+
     def upload_file(
             self, 
             storage_key: str, 
@@ -103,18 +160,62 @@ class S3StorageClient:
         if not os.path.exists(source):
             raise FileNotFoundError(f"Local file {source} does not exist.")
         
-        # Read the file into a BytesIO object
+        # Stream the file handle, the file is never loaded into memory
         with open(source, "rb") as f:
-            _data = BytesIO(f.read())
-        _data.seek(0)
-
-        self.upload_object(
-            storage_key=storage_key, 
-            source=_data, 
-            container_name=container_name, 
-            overwrite=overwrite
-        )
+            self.upload_stream(
+                storage_key=storage_key, 
+                source=f, 
+                container_name=container_name, 
+                overwrite=overwrite
+            )
+
+
+    def upload_stream(
+            self, 
+            storage_key: str, 
+            source: StreamSource,
+            container_name: str, 
+            overwrite: bool = True,
+            part_size: int = DEFAULT_PART_SIZE,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+        ) -> None:
+        """
+        Upload a file handle or an iterator of bytes chunks to S3 Storage.
+        Uses multipart upload with the given part size and concurrency,
+        so memory use does not depend on the object size.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+        validate_transfer_settings(part_size, max_concurrency, S3_MIN_PART_SIZE)
+
+        try:
+            if not overwrite and self.key_exists(
+                container_name=container_name, 
+                storage_key=storage_key
+            ):
+                logger.warning(f"{storage_key} already exists. Skipping upload.")
+                return
 
+            self.s3_client.upload_fileobj(
+                Fileobj=as_readable(source),
+                Bucket=container_name, 
+                Key=storage_key,
+                Config=TransferConfig(
+                    multipart_threshold=part_size,
+                    multipart_chunksize=part_size,
+                    max_concurrency=max_concurrency,
+                    use_threads=max_concurrency > 1
+                )
+            )
+
+            logger.info(
+                f"File {storage_key} streamed to {container_name} successfully."
+            )
+
+        except Exception as e:
+            raise StorageUploadError(
+                f"Failed to stream file to S3: {e}"
+            )
 
 
     def upload_object(
@@ -122,10 +223,12 @@ class S3StorageClient:
             storage_key: str, 
             source: BytesIO,
             container_name: str, 
-            overwrite: bool = True
-        ) -> None:
+            overwrite: bool = True,
+            metadata: Optional[dict] = None
+        ) -> bool:
         """
         Upload a file to S3 Storage.
+        :return: False if the upload was skipped (existing key and overwrite=False).
         """
         Validate.non_empty_string(storage_key, "storage_key")
         Validate.non_empty_string(container_name, "container_name")
@@ -140,7 +243,7 @@ class S3StorageClient:
                         Key=storage_key
                     )
                     logger.warning(f"{storage_key} already exists. Skipping upload.")
-                    return 
+                    return False
                 except self.s3_client.exceptions.ClientError as e:
                     # If the error is 404, the file does not exist
                     # If it's a different error, re-raise it
@@ -151,12 +254,14 @@ class S3StorageClient:
             self.s3_client.upload_fileobj(
                 Fileobj=source,
                 Bucket=container_name, 
-                Key=storage_key
+                Key=storage_key,
+                ExtraArgs={'Metadata': metadata} if metadata else None
             )
 
             logger.info(
                 f"File {storage_key} uploaded to {container_name} successfully."
             )
+            return True
 
         except Exception as e:
             raise StorageUploadError(
@@ -164,6 +269,36 @@ class S3StorageClient:
             )
 
 
+    def get_content_hash(
+            self, 
+            storage_key: str, 
+            container_name: str
+        ) -> Optional[str]:
+        """
+        Get the hex MD5 of an object in S3 Storage from a single HEAD request,
+        from stored metadata or a single part ETag. None if missing or unknown.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        try:
+            response = self.s3_client.head_object(
+                Bucket=container_name, 
+                Key=storage_key
+            )
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response['Error']['Code'] == '404':
+                return None
+            raise StorageDownloadError(
+                f"Failed to get object metadata from S3: {e.response['Error']['Message']}"
+            )
+
+        return (
+            response.get('Metadata', {}).get(CONTENT_MD5_METADATA_KEY)
+            or etag_to_md5(response.get('ETag'))
+        )
+
+
     def download_object(
             self, 
             storage_key: str, 
@@ -191,6 +326,94 @@ class S3StorageClient:
                 f"Failed to download file from S3: {e.response['Error']['Message']}"
             )
         
+    def get_object_size(
+            self, 
+            storage_key: str, 
+            container_name: str
+        ) -> int:
+        """
+        Get the size in bytes of a file in S3 Storage.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        try:
+            response = self.s3_client.head_object(
+                Bucket=container_name, 
+                Key=storage_key
+            )
+            return int(response['ContentLength'])
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"File {storage_key} not found in {container_name}.")
+            raise StorageDownloadError(
+                f"Failed to get file size from S3: {e.response['Error']['Message']}"
+            )
+
+
+    def download_range(
+            self, 
+            storage_key: str, 
+            container_name: str,
+            offset: int,
+            length: int
+        ) -> bytes:
+        """
+        Download a byte range [offset, offset + length) of a file from S3 Storage.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        if length <= 0:
+            return b""
+
+        try:
+            response = self.s3_client.get_object(
+                Bucket=container_name, 
+                Key=storage_key,
+                Range=f"bytes={offset}-{offset + length - 1}"
+            )
+            return response['Body'].read()
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"File {storage_key} not found in {container_name}.")
+            raise StorageDownloadError(
+                f"Failed to download range from S3: {e.response['Error']['Message']}"
+            )
+
+
+    def iter_chunks(
+            self, 
+            storage_key: str, 
+            container_name: str,
+            chunk_size: int = DEFAULT_CHUNK_SIZE
+        ) -> Iterator[bytes]:
+        """
+        Stream a file from S3 Storage as chunks of bytes,
+        without loading the whole object into memory.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        try:
+            response = self.s3_client.get_object(
+                Bucket=container_name, 
+                Key=storage_key
+            )
+        except self.s3_client.exceptions.ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"File {storage_key} not found in {container_name}.")
+            raise StorageDownloadError(
+                f"Failed to download file from S3: {e.response['Error']['Message']}"
+            )
+
+        body = response['Body']
+        try:
+            yield from body.iter_chunks(chunk_size=chunk_size)
+        finally:
+            body.close()
+
+
     def download_file(
             self, 
             storage_key: str, 
@@ -227,4 +450,27 @@ class S3StorageClient:
                 raise FileNotFoundError(f"File {storage_key} not found in {container_name}.")
             raise StorageDownloadError(
                 f"Failed to download file from S3: {e.response['Error']['Message']}"
-            )
\ No newline at end of file
+            )
+
+
+    def delete_object(
+            self, 
+            storage_key: str, 
+            container_name: str
+        ) -> None:
+        """
+        Delete a file from S3 Storage, missing files are ignored.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        try:
+            self.s3_client.delete_object(
+                Bucket=container_name, 
+                Key=storage_key
+            )
+            logger.info(f"File {storage_key} deleted from {container_name}.")
+        except self.s3_client.exceptions.ClientError as e:
+            raise StorageUploadError(
+                f"Failed to delete file from S3: {e.response['Error']['Message']}"
+            )
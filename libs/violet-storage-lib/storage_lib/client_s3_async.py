@@ -0,0 +1,210 @@
+import asyncio
+from io import BytesIO
+from contextlib import AsyncExitStack
+from storage_lib.utils.logger import logger
+from storage_lib.errors import StorageUploadError, StorageDownloadError
+from storage_lib.utils.validate import Validate
+from storage_lib.utils.transfer import DEFAULT_ASYNC_POOL_CONNECTIONS
+
+try:
+    from aiobotocore.session import get_session
+    from aiobotocore.config import AioConfig
+    from botocore.exceptions import ClientError
+except ImportError:
+    get_session = None
+    AioConfig = None
+    ClientError = None
+
+
+class AsyncS3StorageClient:
+    """
+    Async client for S3 Storage.
+    This client uses aiobotocore, a single pooled client is opened lazily
+    on first use and shared by all concurrent calls.
+    """
+    def __init__(
+            self,
+            s3_access_key: str,
+            s3_secret_key: str,
+            s3_endpoint_url: str = "",
+            s3_use_ssl: str = "true",
+            s3_region_name: str = "",
+            max_pool_connections: int = DEFAULT_ASYNC_POOL_CONNECTIONS
+        ):
+        if get_session is None:
+            raise ImportError(
+                "aiobotocore is required for the async S3 client. "
+                "Install with `pip install /path-to/violet-storage-lib[async]`."
+            )
+
+        Validate.non_empty_string(s3_access_key, "s3_access_key")
+
+        if not s3_access_key or not s3_secret_key:
+            raise ValueError(
+                "S3 Access Key and Secret Key must be provided for authentication."
+            )
+
+        # Normalize s3_use_ssl to a boolean value
+        if isinstance(s3_use_ssl, str):
+            s3_use_ssl_val = s3_use_ssl.lower() in ('true', '1', 'yes')
+        else:
+            s3_use_ssl_val = s3_use_ssl
+
+        # Prepare the kwargs for aiobotocore client initialization
+        self._client_kwargs = {}
+        for key, value in [
+            ('aws_access_key_id', s3_access_key),
+            ('aws_secret_access_key', s3_secret_key),
+            ('endpoint_url', s3_endpoint_url),
+            ('use_ssl', s3_use_ssl_val),
+            ('region_name', s3_region_name)
+        ]:
+            if value not in (None, ''):
+                self._client_kwargs[key] = value
+
+        self._config = AioConfig(max_pool_connections=max_pool_connections)
+        self._exit_stack = None
+        self._s3_client = None
+        self._client_lock = asyncio.Lock()
+
+
+    async def _get_client(
+            self
+        ):
+        """
+        Open the pooled aiobotocore client on first use.
+        """
+        if self._s3_client is None:
+            async with self._client_lock:
+                if self._s3_client is None:
+                    exit_stack = AsyncExitStack()
+                    self._s3_client = await exit_stack.enter_async_context(
+                        get_session().create_client(
+                            's3',
+                            config=self._config,
+                            **self._client_kwargs
+                        )
+                    )
+                    self._exit_stack = exit_stack
+        return self._s3_client
+
+
+    async def close(
+            self
+        ) -> None:
+        """
+        Close the pooled client and release its connections.
+        """
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+        self._s3_client = None
+
+
+    async def key_exists(
+            self,
+            container_name: str,
+            storage_key: str,
+        ) -> bool:
+        """
+        Check if a file exists in S3 Storage.
+        """
+        Validate.non_empty_string(container_name, "container_name")
+        Validate.non_empty_string(storage_key, "storage_key")
+
+        s3_client = await self._get_client()
+        try:
+            await s3_client.head_object(
+                Bucket=container_name,
+                Key=storage_key
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == '404':
+                return False
+            raise  # Re-raise if it's a different error
+
+
+    async def list_containers(
+            self
+        ) -> list:
+        """
+        List all containers (buckets) in S3 Storage.
+        """
+        s3_client = await self._get_client()
+        try:
+            response = await s3_client.list_buckets()
+            return [bucket['Name'] for bucket in response.get('Buckets', [])]
+        except Exception as e:
+            raise StorageDownloadError(
+                f"Failed to list containers in S3: {e}"
+            )
+
+
+    async def upload_object(
+            self,
+            storage_key: str,
+            source: BytesIO,
+            container_name: str,
+            overwrite: bool = True
+        ) -> None:
+        """
+        Upload a BytesIO object to S3 Storage.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+        Validate.is_instance(source, BytesIO, "source")
+
+        try:
+            if not overwrite and await self.key_exists(
+                container_name=container_name,
+                storage_key=storage_key
+            ):
+                logger.warning(f"{storage_key} already exists. Skipping upload.")
+                return
+
+            s3_client = await self._get_client()
+            await s3_client.put_object(
+                Bucket=container_name,
+                Key=storage_key,
+                Body=source.getvalue()
+            )
+
+            logger.info(
+                f"File {storage_key} uploaded to {container_name} successfully."
+            )
+
+        except Exception as e:
+            raise StorageUploadError(
+                f"Failed to upload file to S3: {e}"
+            )
+
+
+    async def download_object(
+            self,
+            storage_key: str,
+            container_name: str
+        ) -> BytesIO:
+        """
+        Download a file from S3 Storage.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        s3_client = await self._get_client()
+        try:
+            response = await s3_client.get_object(
+                Bucket=container_name,
+                Key=storage_key
+            )
+            async with response['Body'] as stream:
+                data = BytesIO(await stream.read())
+            data.seek(0)
+            logger.info(f"File {storage_key} downloaded from {container_name} successfully.")
+            return data
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                raise FileNotFoundError(f"File {storage_key} not found in {container_name}.")
+            raise StorageDownloadError(
+                f"Failed to download file from S3: {e.response['Error']['Message']}"
+            )
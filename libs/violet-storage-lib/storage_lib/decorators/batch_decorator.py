@@ -0,0 +1,94 @@
+from io import BytesIO
+from storage_lib.utils.logger import logger
+from storage_lib.utils.batch import BatchResult, run_batch, DEFAULT_BATCH_WORKERS
+from typing import Dict, Iterable
+
+
+def batch_operations(cls):
+    """
+    Decorator to add bulk methods (upload_many, download_many, exists_many) to a storage client.
+    Each bulk method runs the single-key method of the class on a bounded thread pool,
+    so N independent requests cost about one round trip instead of N.
+    Results and errors are returned per key as BatchResult objects.
+    """
+    def upload_many(
+            self,
+            items: Dict[str, BytesIO],
+            container_name: str,
+            overwrite: bool = True,
+            max_workers: int = DEFAULT_BATCH_WORKERS,
+            skip_unchanged: bool = False
+        ) -> Dict[str, BatchResult]:
+        """
+        Upload many BytesIO objects in parallel.
+        :param items: Mapping of storage_key -> BytesIO source.
+        """
+        results = run_batch(
+            lambda storage_key: self.upload_object(
+                storage_key=storage_key,
+                source=items[storage_key],
+                container_name=container_name,
+                overwrite=overwrite,
+                skip_unchanged=skip_unchanged
+            ),
+            items.keys(),
+            max_workers=max_workers
+        )
+        _log_failures("upload", results)
+        return results
+
+    def download_many(
+            self,
+            storage_keys: Iterable[str],
+            container_name: str,
+            max_workers: int = DEFAULT_BATCH_WORKERS
+        ) -> Dict[str, BatchResult]:
+        """
+        Download many objects in parallel, values are BytesIO objects.
+        """
+        results = run_batch(
+            lambda storage_key: self.download_object(
+                storage_key=storage_key,
+                container_name=container_name
+            ),
+            storage_keys,
+            max_workers=max_workers
+        )
+        _log_failures("download", results)
+        return results
+
+    def exists_many(
+            self,
+            storage_keys: Iterable[str],
+            container_name: str,
+            max_workers: int = DEFAULT_BATCH_WORKERS
+        ) -> Dict[str, BatchResult]:
+        """
+        Check existence of many keys in parallel, values are booleans.
+        """
+        results = run_batch(
+            lambda storage_key: self.key_exists(
+                storage_key=storage_key,
+                container_name=container_name
+            ),
+            storage_keys,
+            max_workers=max_workers
+        )
+        _log_failures("existence check", results)
+        return results
+
+    # Attach new methods to the class
+    cls.upload_many = upload_many
+    cls.download_many = download_many
+    cls.exists_many = exists_many
+
+    return cls
+
+
+def _log_failures(
+        operation: str,
+        results: Dict[str, BatchResult]
+    ) -> None:
+    failed = [result for result in results.values() if not result.ok]
+    for result in failed:
+        logger.error(f"Batch {operation} failed for {result.key}: {result.error}")
@@ -2,14 +2,23 @@ from __future__ import annotations
 from io import BytesIO
 # from pandas import DataFrame # Saving space a bit
 from storage_lib.utils.logger import logger
-from typing import Any
-
-try:
-    import pyarrow as pa
-    import pyarrow.parquet as pq
-except ImportError as e:
-    pa = None
-    pq = None
+from storage_lib.utils.batch import BatchResult, run_batch, DEFAULT_BATCH_WORKERS
+from storage_lib.utils.parquet import (
+    DEFAULT_COMPRESSION,
+    DEFAULT_ROW_GROUP_SIZE,
+    Filters,
+    ParquetStreamWriter,
+    SortingColumns,
+    add_partition_columns,
+    df_to_parquet_buffer,
+    parse_hive_partitions,
+    partition_matches,
+    split_partition_filters,
+    _require_pyarrow,
+    pa,
+    pq
+)
+from typing import Any, Dict, List, Optional, Union
 
 
 def parquet_writes(cls):
@@ -18,34 +27,95 @@ def parquet_writes(cls):
     This decorator adds a method to the class that allows uploading a DataFrame as a Parquet file.
     """
     def upload_df_as_parquet(
-            self, 
-            storage_key: str, 
+            self,
+            storage_key: str,
             df: "DataFrame", # type hint for pandas DataFrame
-            container_name: str, 
-            overwrite: bool = True
+            container_name: str,
+            overwrite: bool = True,
+            skip_unchanged: bool = False,
+            compression: Optional[str] = DEFAULT_COMPRESSION,
+            use_dictionary: Union[bool, List[str]] = True,
+            row_group_size: Optional[int] = None,
+            sorting_columns: SortingColumns = None
         ) -> None:
         """
         Write a DataFrame to a Parquet file in Azure Blob Storage.
+        Writer options are passed to pyarrow, see df_to_parquet_buffer.
         """
-        if pa is None or pq is None:
-            raise ImportError(
-                "pyarrow is required for Parquet support. "
-                "Install with `pip install /path-to/violet-storage-lib[parquet]`."
-            )
-        try:
-            table = pa.Table.from_pandas(df)
-            buffer = BytesIO()
-            pq.write_table(table, buffer)
-            buffer.seek(0)
-        except Exception as e:
-            logger.error(f"Error converting DataFrame to Parquet: {e}")
-            raise
+        buffer = df_to_parquet_buffer(
+            df,
+            compression=compression,
+            use_dictionary=use_dictionary,
+            row_group_size=row_group_size,
+            sorting_columns=sorting_columns
+        )
 
         self.upload_object(
-            storage_key=storage_key, 
-            source=buffer, 
-            container_name=container_name, 
-            overwrite=overwrite
+            storage_key=storage_key,
+            source=buffer,
+            container_name=container_name,
+            overwrite=overwrite,
+            skip_unchanged=skip_unchanged
+        )
+
+    def upload_many_df_as_parquet(
+            self,
+            frames: Dict[str, "DataFrame"],
+            container_name: str,
+            overwrite: bool = True,
+            max_workers: int = DEFAULT_BATCH_WORKERS,
+            skip_unchanged: bool = False,
+            **parquet_options: Any
+        ) -> Dict[str, BatchResult]:
+        """
+        Write many DataFrames as Parquet files in parallel.
+        :param frames: Mapping of storage_key -> DataFrame.
+        :param parquet_options: Writer options of upload_df_as_parquet.
+        """
+        results = run_batch(
+            lambda storage_key: self.upload_df_as_parquet(
+                storage_key=storage_key,
+                df=frames[storage_key],
+                container_name=container_name,
+                overwrite=overwrite,
+                skip_unchanged=skip_unchanged,
+                **parquet_options
+            ),
+            frames.keys(),
+            max_workers=max_workers
+        )
+        for result in results.values():
+            if not result.ok:
+                logger.error(f"Parquet upload failed for {result.key}: {result.error}")
+        return results
+
+    def open_parquet_writer(
+            self,
+            storage_key: str,
+            container_name: str,
+            overwrite: bool = True,
+            schema: Optional["pa.Schema"] = None,
+            compression: Optional[str] = DEFAULT_COMPRESSION,
+            use_dictionary: Union[bool, List[str]] = True,
+            row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+            sorting_columns: SortingColumns = None
+        ) -> ParquetStreamWriter:
+        """
+        Open a streaming Parquet writer, chunks are written one row group at a time
+        and the file is uploaded with upload_stream when the writer is closed.
+        """
+        return ParquetStreamWriter(
+            upload=lambda source: self.upload_stream(
+                storage_key=storage_key,
+                source=source,
+                container_name=container_name,
+                overwrite=overwrite
+            ),
+            schema=schema,
+            compression=compression,
+            use_dictionary=use_dictionary,
+            row_group_size=row_group_size,
+            sorting_columns=sorting_columns
         )
 
     # Attach new methods to the class
@@ -53,5 +123,104 @@ def parquet_writes(cls):
     cls.upload_df_as_parquet.__doc__ = (
         "Write a DataFrame to a Parquet file in Azure Blob Storage."
     )
+    cls.upload_many_df_as_parquet = upload_many_df_as_parquet
+    cls.open_parquet_writer = open_parquet_writer
+
+    return cls
+
+
+def parquet_reads(cls):
+    """
+    Decorator to add methods for reading Parquet files from Storage.
+    Files are opened with the ranged `open_read`, so column projection and
+    row group filtering (from the footer statistics) are pushed down to pyarrow
+    and only the needed byte ranges are downloaded.
+    """
+    def read_parquet(
+            self,
+            container_name: str,
+            storage_key: str,
+            columns: Optional[List[str]] = None,
+            filters: Optional[list] = None,
+            to_pandas: bool = True
+        ) -> Union["DataFrame", "pa.Table"]:
+        """
+        Read a Parquet file from Storage.
+        :param columns: Columns to read, all if None.
+        :param filters: Row filters in pyarrow form, e.g. [("country", "in", ["us", "pl"])].
+        :param to_pandas: Return a DataFrame (default) or a pyarrow Table.
+        """
+        _require_pyarrow()
+        with self.open_read(
+            container_name=container_name,
+            storage_key=storage_key
+        ) as source:
+            table = pq.read_table(source, columns=columns, filters=filters)
+        return table.to_pandas() if to_pandas else table
+
+    def read_parquet_dataset(
+            self,
+            container_name: str,
+            prefix: str,
+            columns: Optional[List[str]] = None,
+            filters: Filters = None,
+            to_pandas: bool = True,
+            max_workers: int = DEFAULT_BATCH_WORKERS
+        ) -> Union["DataFrame", "pa.Table"]:
+        """
+        Read all Parquet files below a Hive-partitioned prefix as one table.
+        Partition values (`name=value` path segments) are added as string columns.
+        Filters on partition columns prune whole files by path before any read,
+        the remaining filters are pushed down to each file.
+        Files are read in parallel.
+        :param filters: Flat list of (column, op, value) tuples (AND).
+        """
+        _require_pyarrow()
+        base = f"{prefix.rstrip('/')}/" if prefix else ""
+
+        files = {}
+        for storage_key in self.list_keys(container_name=container_name, prefix=base):
+            if storage_key.endswith(".parquet"):
+                files[storage_key] = parse_hive_partitions(storage_key, base)
+
+        partition_names = {name for partitions in files.values() for name in partitions}
+        partition_filters, file_filters = split_partition_filters(filters, partition_names)
+        selected = {
+            storage_key: partitions for storage_key, partitions in files.items()
+            if partition_matches(partitions, partition_filters)
+        }
+        logger.info(f"Reading {len(selected)} of {len(files)} Parquet files below {base}")
+
+        file_columns = (
+            [column for column in columns if column not in partition_names]
+            if columns else None
+        )
+        results = run_batch(
+            lambda storage_key: add_partition_columns(
+                self.read_parquet(
+                    container_name=container_name,
+                    storage_key=storage_key,
+                    columns=file_columns,
+                    filters=file_filters,
+                    to_pandas=False
+                ),
+                selected[storage_key]
+            ),
+            selected.keys(),
+            max_workers=max_workers
+        )
+
+        tables = [result.unwrap() for result in results.values()]
+        if not tables:
+            table = pa.table({})
+        else:
+            table = pa.concat_tables(tables, promote_options="default")
+            if columns:
+                table = table.select(columns)
+        return table.to_pandas() if to_pandas else table
+
+    # Attach new methods to the class
+    cls.read_parquet = read_parquet
+    cls.read_parquet_dataset = read_parquet_dataset
 
     return cls
@@ -0,0 +1,82 @@
+from storage_lib.utils.logger import logger
+from typing import List, Optional
+
+
+def _partition_prefix(
+        prefix: str,
+        partition_key: str
+    ) -> str:
+    """
+    Build the listing prefix of Hive-style partitions, e.g. `raw/date=`.
+    """
+    base = f"{prefix.rstrip('/')}/" if prefix else ""
+    return f"{base}{partition_key}="
+
+
+def partition_listing(cls):
+    """
+    Decorator to add Hive-style partition discovery (list_partitions, latest_partition)
+    to a storage client providing `list_keys` and `key_exists`.
+    Partitions are discovered with a single delimited listing
+    (one request per 1000 partitions), without listing the files inside them.
+    """
+    def list_partitions(
+            self,
+            container_name: str,
+            prefix: str = "",
+            partition_key: str = "date",
+            start_after: Optional[str] = None
+        ) -> List[str]:
+        """
+        List values of the `{prefix}/{partition_key}=<value>/` partitions, sorted.
+        :param start_after: Only values greater than this one are returned,
+            allows downstream jobs to pick up new partitions incrementally.
+        """
+        search = _partition_prefix(prefix, partition_key)
+        values = set()
+
+        for name in self.list_keys(
+                container_name=container_name,
+                prefix=search,
+                delimiter="/",
+                start_after=f"{search}{start_after}" if start_after else None
+            ):
+            # only "directories" are partitions, files directly under prefix are skipped
+            if name.endswith("/"):
+                values.add(name[len(search):-1])
+
+        if start_after is not None:
+            values = {value for value in values if value > start_after}
+        return sorted(values)
+
+    def latest_partition(
+            self,
+            container_name: str,
+            prefix: str = "",
+            partition_key: str = "date",
+            required_key: Optional[str] = None
+        ) -> Optional[str]:
+        """
+        Return the greatest partition value, or None if there are no partitions.
+        :param required_key: Only partitions containing this key are considered
+            (e.g. `top_podcasts.parquet`), skipping partitions still being written.
+        """
+        search = _partition_prefix(prefix, partition_key)
+        for value in reversed(self.list_partitions(
+                container_name=container_name,
+                prefix=prefix,
+                partition_key=partition_key
+            )):
+            if required_key is None or self.key_exists(
+                container_name=container_name,
+                storage_key=f"{search}{value}/{required_key}"
+            ):
+                return value
+            logger.warning(f"Partition {search}{value} has no {required_key}, skipping.")
+        return None
+
+    # Attach new methods to the class
+    cls.list_partitions = list_partitions
+    cls.latest_partition = latest_partition
+
+    return cls
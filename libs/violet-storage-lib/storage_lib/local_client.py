@@ -2,78 +2,488 @@
 
 
 import os
+import json
+import hashlib
+import shutil
+import datetime
+import tempfile
 from io import BytesIO
-from storage_lib.decorators.parquet_decorator import parquet_writes
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+from storage_lib.utils.logger import logger
+from storage_lib.decorators.parquet_decorator import parquet_writes, parquet_reads
+from storage_lib.decorators.batch_decorator import batch_operations
+from storage_lib.decorators.partition_decorator import partition_listing
+from storage_lib.utils.latest_stamper import LatestStamper
+from storage_lib.utils.mapped_reader import MappedReader
+from storage_lib.utils.content_hash import TransferStats, content_md5
 from storage_lib.utils.validate import Validate
+from storage_lib.utils.transfer import (
+    DEFAULT_PART_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_LIST_PAGE_SIZE,
+    StreamSource,
+    as_readable
+)
 
+# Root directory of the local storage, containers are subdirectories
+DEFAULT_LOCAL_ROOT = os.getenv("LOCAL_STORAGE_ROOT", "tmp")
 
+# Prefix of in-progress writes, never listed as keys
+_TMP_PREFIX = ".tmp-"
+
+
+@partition_listing
+@batch_operations
 @parquet_writes
+@parquet_reads
 class LocalStorageClient:
     """
-    A class to handle local storage for debugging purposes.
-    It provides methods to save and retrieve data 
-    in a local tmp directory as if it were in Azure Blob Storage.
+    A class to handle local storage for debugging and benchmarking.
+    It provides the same methods as StorageClient, backed by
+    a local directory (`{root_dir}/{container_name}/{storage_key}`).
+    Writes are atomic (temp file + rename), reads are memory-mapped.
     """
 
     def __init__(
             self,
             *args,
+            root_dir: Optional[str] = None,
             **kwargs
         ):
         """
         Initialize the LocalStorageClient.
-        This client is used for debugging purposes and does not connect to any remote storage.
+        This client does not connect to any remote storage,
+        credentials and other StorageClient arguments are ignored.
+        :param root_dir: Root directory, defaults to $LOCAL_STORAGE_ROOT or `tmp`.
+        """
+        self.root_dir = root_dir or DEFAULT_LOCAL_ROOT
+        # stamper placeholder
+        self._stamper = None
+        # uploaded / skipped bytes of this client
+        self.transfer_stats = TransferStats()
+
+
+    def _path(
+            self,
+            container_name: str,
+            storage_key: str = ""
+        ) -> str:
+        """
+        Resolve the local path of a key, rejecting keys escaping the container.
+        """
+        container_dir = os.path.abspath(os.path.join(self.root_dir, container_name))
+        full_path = os.path.abspath(os.path.join(container_dir, storage_key))
+        if full_path != container_dir and not full_path.startswith(container_dir + os.sep):
+            raise ValueError(f"Invalid storage key: {storage_key}")
+        return full_path
+
+
+    @contextmanager
+    def _atomic_write(
+            self,
+            full_path: str
+        ) -> Iterator[BinaryIO]:
+        """
+        Open a temp file next to `full_path` and rename it into place on success,
+        so readers never see partially written files.
+        """
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(full_path),
+            prefix=_TMP_PREFIX
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+    def _skip_existing(
+            self,
+            full_path: str,
+            storage_key: str,
+            overwrite: bool
+        ) -> bool:
+        if not overwrite and os.path.exists(full_path):
+            logger.warning(f"{storage_key} already exists. Skipping upload.")
+            return True
+        return False
+
+
+    def list_containers(
+            self
+        ) -> list:
+        """
+        List all containers (subdirectories of the root directory).
         """
-        pass
+        if not os.path.isdir(self.root_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root_dir)
+            if os.path.isdir(os.path.join(self.root_dir, name))
+        )
 
 
     def key_exists(
-            self, 
-            storage_key: str, 
+            self,
+            storage_key: str,
             container_name: str = "debug"
         ) -> bool:
         """
         Check if a file exists in the local storage.
-        :param file_path: The path of the file to check.
-        :param container_name: The name of the container (not used in local storage).
+        :param storage_key: The path of the file to check.
+        :param container_name: The name of the container (subdirectory of root_dir).
         :return: True if the file exists, False otherwise.
         """
-        Validate.non_empty_string(storage_key, "file_path")
+        Validate.non_empty_string(storage_key, "storage_key")
         Validate.non_empty_string(container_name, "container_name")
 
-        full_blob_path = f"tmp/{container_name}/{storage_key}"
-        return os.path.exists(full_blob_path)
-    
+        return os.path.isfile(self._path(container_name, storage_key))
+
 
     def upload_object(
-            self, 
-            storage_key: str, 
-            source: BytesIO, 
+            self,
+            storage_key: str,
+            source: BytesIO,
+            container_name: str = "debug",
+            overwrite: bool = True,
+            skip_unchanged: bool = False
+        ) -> None:
+        """
+        Save a BytesIO object to a local file.
+        :param storage_key: The path where the data will be saved.
+        :param source: The data to save.
+        :param container_name: The name of the container (subdirectory of root_dir).
+        :param overwrite: Whether to overwrite the file if it exists, skipped otherwise.
+        :param skip_unchanged: Skip the write if the file already has the same content.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+        Validate.is_instance(source, BytesIO, "source")
+
+        full_path = self._path(container_name, storage_key)
+        size = source.getbuffer().nbytes
+        if self._skip_existing(full_path, storage_key, overwrite):
+            self.transfer_stats.record_skip(size)
+            return
+
+        if skip_unchanged and self.get_content_hash(storage_key, container_name) == content_md5(source):
+            logger.info(f"{storage_key} is unchanged. Skipping upload.")
+            self.transfer_stats.record_skip(size)
+            return
+
+        with self._atomic_write(full_path) as f:
+            f.write(source.getbuffer()) # writes the buffer without copying it
+        self.transfer_stats.record_upload(size)
+
+
+    def get_content_hash(
+            self,
+            storage_key: str,
+            container_name: str = "debug"
+        ) -> Optional[str]:
+        """
+        Hex MD5 of a local file, None if it does not exist.
+        """
+        if not self.key_exists(storage_key=storage_key, container_name=container_name):
+            return None
+        with self.open_read(storage_key, container_name) as reader:
+            return hashlib.md5(reader.getbuffer()).hexdigest()
+
+
+    def upload_file(
+            self,
+            storage_key: str,
+            source: str,
             container_name: str = "debug",
             overwrite: bool = True
         ) -> None:
         """
-        Save data to a local file for debugging.
-        :param blob_path: The path where the data will be saved.
-        :param data: The data to save.
-        :param container_name: The name of the container (not used in local storage).
-        :param overwrite: Whether to overwrite the file if it exists.
+        Copy a local file into the storage.
+        :param storage_key: The path where the file will be saved.
+        :param source: Path of the file to copy.
+        :param container_name: The name of the container (subdirectory of root_dir).
+        :param overwrite: Whether to overwrite the file if it exists, skipped otherwise.
         """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+        Validate.non_empty_string(source, "source")
+
+        if not os.path.isfile(source):
+            raise FileNotFoundError(f"Source file {source} does not exist.")
+
+        full_path = self._path(container_name, storage_key)
+        if self._skip_existing(full_path, storage_key, overwrite):
+            return
+
+        with self._atomic_write(full_path) as f, open(source, "rb") as src:
+            shutil.copyfileobj(src, f, length=DEFAULT_PART_SIZE)
 
+
+    def upload_stream(
+            self,
+            storage_key: str,
+            source: StreamSource,
+            container_name: str = "debug",
+            overwrite: bool = True,
+            part_size: int = DEFAULT_PART_SIZE,
+            max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+        ) -> None:
+        """
+        Copy a file handle or an iterator of bytes chunks to a local file.
+        :param storage_key: The path where the data will be saved.
+        :param source: Readable binary file-like object or iterable of bytes.
+        :param container_name: The name of the container (subdirectory of root_dir).
+        :param overwrite: Whether to overwrite the file if it exists, skipped otherwise.
+        :param part_size: Size of the copy buffer.
+        :param max_concurrency: Not used in local storage.
+        """
         Validate.non_empty_string(storage_key, "storage_key")
         Validate.non_empty_string(container_name, "container_name")
-        Validate.is_instance(source, BytesIO, "source")
 
-        mode = 'wb' if overwrite else 'ab'
-        # Ensure the directory exists
-        full_blob_path = f"tmp/{container_name}/{storage_key}"
-        os.makedirs(
-            os.path.dirname(f"tmp/{container_name}/{storage_key}"),
-            exist_ok=True
+        full_path = self._path(container_name, storage_key)
+        if self._skip_existing(full_path, storage_key, overwrite):
+            return
+
+        with self._atomic_write(full_path) as f:
+            shutil.copyfileobj(as_readable(source), f, length=part_size)
+
+
+    def set_latest_stamper(
+            self,
+            utc_time: Optional[datetime.datetime] = None
+        ) -> LatestStamper:
+        """
+        Set the latest timestamp stamper.
+        """
+        self._stamper = LatestStamper(
+            utc_time=utc_time or datetime.datetime.now(datetime.UTC)
+        )
+
+    @property
+    def stamper(self) -> LatestStamper:
+        """
+        Get the latest timestamp stamper.
+        """
+        if not self._stamper:
+            self.set_latest_stamper()
+        return self._stamper
+
+
+    def upload_timestamp(
+            self,
+            storage_key: str,
+            container_name: str = "debug",
+            utc_time: Optional[datetime.datetime] = None,
+            overwrite: bool = True
+        ) -> None:
+        """
+        Save a timestamp to a local file.
+        """
+        self.set_latest_stamper(utc_time=utc_time)
+        self.upload_object(
+            storage_key=storage_key,
+            source=self._stamper.json_bytes_io,
+            container_name=container_name,
+            overwrite=overwrite
+        )
+
+
+    def upload_json(
+            self,
+            storage_key: str,
+            data: dict | list,
+            container_name: str = "debug",
+            overwrite: bool = True,
+            skip_unchanged: bool = False
+        ) -> None:
+        """
+        Save data (dict or list) as a JSON file.
+        """
+        json_data = json.dumps(data, indent=4)
+        self.upload_object(
+            storage_key=storage_key,
+            source=BytesIO(json_data.encode('utf-8')),
+            container_name=container_name,
+            overwrite=overwrite,
+            skip_unchanged=skip_unchanged
         )
 
-        with open(full_blob_path, mode) as f:
-            f.write(source.getvalue()) # gets the bytes from BytesIO
+
+    def open_read(
+            self,
+            storage_key: str,
+            container_name: str = "debug",
+            **kwargs
+        ) -> MappedReader:
+        """
+        Open a local file as a seekable, read-only, memory-mapped file object.
+        :param storage_key: The path of the file to open.
+        :param container_name: The name of the container (subdirectory of root_dir).
+        :param kwargs: Range reader settings, not used in local storage.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        full_path = self._path(container_name, storage_key)
+        if not os.path.isfile(full_path):
+            raise FileNotFoundError(f"File {storage_key} not found in {container_name}.")
+        return MappedReader(full_path, name=f"{container_name}/{storage_key}")
+
+
+    def download_object(
+            self,
+            storage_key: str,
+            container_name: str = "debug"
+        ) -> BytesIO:
+        """
+        Read a local file into a BytesIO object.
+        :param storage_key: The path of the file to read.
+        :param container_name: The name of the container (subdirectory of root_dir).
+        """
+        with self.open_read(storage_key, container_name) as reader:
+            data = BytesIO(reader.getbuffer())
+        data.seek(0)
+        return data
+
+
+    def download_json(
+            self,
+            storage_key: str,
+            container_name: str = "debug",
+        ) -> dict:
+        """
+        Read a JSON file and return it as a dictionary.
+        """
+        with self.open_read(storage_key, container_name) as reader:
+            return json.loads(reader.getbuffer().tobytes().decode('utf-8'))
+
+
+    def download_file(
+            self,
+            storage_key: str,
+            container_name: str = "debug",
+            destination_path: str = "",
+            overwrite: bool = True
+        ) -> None:
+        """
+        Copy a file from the storage to a local path.
+        :param storage_key: The path of the file to copy.
+        :param container_name: The name of the container (subdirectory of root_dir).
+        :param destination_path: Local destination path.
+        :param overwrite: Whether to overwrite the destination if it exists.
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+        Validate.non_empty_string(destination_path, "destination_path")
+
+        full_path = self._path(container_name, storage_key)
+        if not os.path.isfile(full_path):
+            raise FileNotFoundError(f"File {storage_key} not found in {container_name}.")
+
+        if not overwrite and os.path.exists(destination_path):
+            logger.warning(f"File already exists at {destination_path}. Skipping download.")
+            return
+
+        dir_path = os.path.dirname(destination_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+
+        # copyfile uses sendfile / copy_file_range where available
+        shutil.copyfile(full_path, destination_path)
+
+
+    def iter_chunks(
+            self,
+            storage_key: str,
+            container_name: str = "debug",
+            chunk_size: int = DEFAULT_CHUNK_SIZE
+        ) -> Iterator[bytes]:
+        """
+        Read a local file as chunks of bytes.
+        :param storage_key: The path of the file to read.
+        :param container_name: The name of the container (subdirectory of root_dir).
+        :param chunk_size: Size of the yielded chunks.
+        """
+        with self.open_read(storage_key, container_name) as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+
+    def list_keys(
+            self,
+            container_name: str = "debug",
+            prefix: str = "",
+            delimiter: Optional[str] = None,
+            page_size: int = DEFAULT_LIST_PAGE_SIZE,
+            start_after: Optional[str] = None
+        ) -> Iterator[str]:
+        """
+        Lazily list keys in a container.
+        :param container_name: The name of the container (subdirectory of root_dir).
+        :param prefix: Only keys starting with the prefix are returned.
+        :param delimiter: Roll up keys below the next delimiter into one entry ending with it.
+        :param page_size: Not used in local storage.
+        :param start_after: Only keys sorting after this one are returned.
+        """
+        Validate.non_empty_string(container_name, "container_name")
+
+        container_dir = self._path(container_name)
+        if not os.path.isdir(container_dir):
+            return
+
+        def walk(directory: str, relative: str) -> Iterator[str]:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            for entry in entries:
+                key = f"{relative}{entry.name}"
+                if entry.is_dir():
+                    # descend only into directories that can contain matching keys
+                    if key.startswith(prefix[:len(key)]):
+                        yield from walk(entry.path, key + "/")
+                elif not entry.name.startswith(_TMP_PREFIX) and key.startswith(prefix):
+                    yield key
+
+        last_rolled_up = None
+        for key in walk(container_dir, ""):
+            if delimiter:
+                index = key.find(delimiter, len(prefix))
+                if index >= 0:
+                    key = key[:index + len(delimiter)]
+                    if key == last_rolled_up:
+                        continue
+                    last_rolled_up = key
+            if start_after and key <= start_after:
+                continue
+            yield key
+
+
+    def delete_object(
+            self,
+            storage_key: str,
+            container_name: str = "debug"
+        ) -> None:
+        """
+        Delete a file from the local storage, missing files are ignored.
+        :param storage_key: The path of the file to delete.
+        :param container_name: The name of the container (subdirectory of root_dir).
+        """
+        Validate.non_empty_string(storage_key, "storage_key")
+        Validate.non_empty_string(container_name, "container_name")
+
+        try:
+            os.remove(self._path(container_name, storage_key))
+        except FileNotFoundError:
+            logger.warning(f"{storage_key} does not exist in {container_name}.")
 
 
-client = LocalStorageClient()
\ No newline at end of file
+client = LocalStorageClient()
@@ -0,0 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+# Default number of worker threads for batch operations.
+# Backend clients (boto3 client, BlobServiceClient) are thread-safe
+# and shared between the workers.
+DEFAULT_BATCH_WORKERS = 8
+
+
+class BatchResult:
+    """
+    Result of a single operation in a batch.
+    Holds either the returned value or the raised exception.
+    """
+    __slots__ = ("key", "value", "error")
+
+    def __init__(
+            self,
+            key: Hashable,
+            value: Any = None,
+            error: Optional[BaseException] = None
+        ):
+        self.key = key
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(
+            self
+        ) -> bool:
+        """
+        True if the operation finished without an exception.
+        """
+        return self.error is None
+
+    def unwrap(
+            self
+        ) -> Any:
+        """
+        Return the value or re-raise the stored exception.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(
+            self
+        ) -> str:
+        if self.ok:
+            return f"BatchResult(key={self.key!r}, value={self.value!r})"
+        return f"BatchResult(key={self.key!r}, error={self.error!r})"
+
+
+def run_batch(
+        fn: Callable[[Hashable], Any],
+        keys: Iterable[Hashable],
+        max_workers: int = DEFAULT_BATCH_WORKERS
+    ) -> Dict[Hashable, BatchResult]:
+    """
+    Run fn for every key on a bounded thread pool.
+    Exceptions are captured per key instead of aborting the batch.
+    Returns a dict of key -> BatchResult, in the order of the given keys.
+    """
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+
+    keys = list(dict.fromkeys(keys))  # drop duplicates, keep order
+    if not keys:
+        return {}
+
+    def _call(key: Hashable) -> BatchResult:
+        try:
+            return BatchResult(key, value=fn(key))
+        except Exception as e:
+            return BatchResult(key, error=e)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+        results = list(executor.map(_call, keys))
+
+    return {result.key: result for result in results}
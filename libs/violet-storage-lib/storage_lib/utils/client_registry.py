@@ -0,0 +1,75 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+# Default size of the HTTP connection pool of a shared backend client.
+# Should be >= the number of threads using the client at once
+# (batch workers, multipart concurrency), otherwise connections are
+# discarded and re-opened (new TLS handshake) after each request.
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+
+class ClientRegistry:
+    """
+    Process-wide, thread-safe cache of backend clients.
+    Clients are keyed by their connection config, so every StorageClient
+    created with the same credentials shares one backend client
+    (and so one connection pool) instead of building a new one.
+
+    boto3 clients and azure BlobServiceClients are thread-safe,
+    so sharing them between threads / tasks is safe.
+    """
+
+    def __init__(
+            self
+        ):
+        self._clients: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+
+    def get_or_create(
+            self,
+            key: Hashable,
+            factory: Callable[[], Any]
+        ) -> Any:
+        """
+        Return the client cached under `key`, creating it with `factory` on first use.
+        The factory runs under the lock, so a client is never built twice for the same key.
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+            return client
+
+
+    def clear(
+            self
+        ) -> None:
+        """
+        Drop all cached clients (e.g. after a fork or a credentials rotation).
+        """
+        with self._lock:
+            self._clients.clear()
+
+
+    def __len__(
+            self
+        ) -> int:
+        with self._lock:
+            return len(self._clients)
+
+
+def make_client_key(
+        backend: str,
+        **config
+    ) -> tuple:
+    """
+    Build a hashable registry key from a backend name and its connection config.
+    """
+    return (backend,) + tuple(sorted(
+        (name, value) for name, value in config.items() if value not in (None, '')
+    ))
+
+
+client_registry = ClientRegistry()
@@ -0,0 +1,76 @@
+import hashlib
+import threading
+from io import BytesIO
+from typing import Optional
+
+# User metadata key holding the hex MD5 of the uploaded content.
+# Written on every upload_object, so unchanged writes can be detected
+# even when the backend checksum is missing (Azure staged blocks)
+# or is not an MD5 (S3 multipart ETags).
+CONTENT_MD5_METADATA_KEY = "content_md5"
+
+
+def content_md5(
+        source: BytesIO
+    ) -> str:
+    """
+    Hex MD5 digest of the whole BytesIO buffer (position is left untouched).
+    """
+    return hashlib.md5(source.getbuffer()).hexdigest()
+
+
+def etag_to_md5(
+        etag: Optional[str]
+    ) -> Optional[str]:
+    """
+    Return the MD5 digest carried by an S3 ETag, or None for multipart ETags (`<hash>-<parts>`).
+    """
+    if not etag:
+        return None
+    etag = etag.strip('"')
+    return None if "-" in etag else etag.lower()
+
+
+class TransferStats:
+    """
+    Thread-safe counters of uploaded and skipped (unchanged) objects.
+    """
+
+    def __init__(
+            self
+        ):
+        self._lock = threading.Lock()
+        self.uploaded_objects = 0
+        self.uploaded_bytes = 0
+        self.skipped_objects = 0
+        self.skipped_bytes = 0
+
+    def record_upload(
+            self,
+            size: int
+        ) -> None:
+        with self._lock:
+            self.uploaded_objects += 1
+            self.uploaded_bytes += size
+
+    def record_skip(
+            self,
+            size: int
+        ) -> None:
+        with self._lock:
+            self.skipped_objects += 1
+            self.skipped_bytes += size
+
+    def summary(
+            self
+        ) -> str:
+        with self._lock:
+            return (
+                f"uploaded {self.uploaded_objects} objects ({self.uploaded_bytes} bytes), "
+                f"skipped {self.skipped_objects} unchanged or existing ({self.skipped_bytes} bytes saved)"
+            )
+
+    def __repr__(
+            self
+        ) -> str:
+        return f"<TransferStats {self.summary()}>"
@@ -0,0 +1,147 @@
+import io
+import os
+import mmap
+from typing import Optional
+
+
+class MappedReader(io.RawIOBase):
+    """
+    Seekable, read-only file-like object over a memory-mapped local file.
+    The file is mapped once, reads slice the mapping directly,
+    so no intermediate buffers or read syscalls are involved and
+    `readinto` copies straight into the caller's buffer.
+
+    Mirrors RangeReader for the local backend.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            name: Optional[str] = None
+        ):
+        """
+        :param path: Path of the local file to map.
+        :param name: Optional name of the object, used in repr.
+        """
+        super().__init__()
+        self._position = 0
+        self.name = name or path
+
+        with open(path, "rb") as f:
+            self._size = os.fstat(f.fileno()).st_size
+            # Empty files can not be mapped
+            self._mmap = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if self._size > 0 else None
+            )
+        self._view = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+
+
+    def __repr__(
+            self
+        ) -> str:
+        return f"<MappedReader name={self.name!r} size={self._size}>"
+
+    @property
+    def size(
+            self
+        ) -> int:
+        return self._size
+
+    def readable(
+            self
+        ) -> bool:
+        return True
+
+    def seekable(
+            self
+        ) -> bool:
+        return True
+
+    def tell(
+            self
+        ) -> int:
+        return self._position
+
+    def seek(
+            self,
+            offset: int,
+            whence: int = io.SEEK_SET
+        ) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence value: {whence}")
+
+        if position < 0:
+            raise ValueError("Negative seek position")
+
+        self._position = position
+        return self._position
+
+
+    def getbuffer(
+            self
+        ) -> memoryview:
+        """
+        Return a read-only view of the whole file, without copying.
+        The view is only valid until the reader is closed.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        return self._view
+
+
+    def read(
+            self,
+            size: int = -1
+        ) -> bytes:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if size is None or size < 0:
+            size = self._size - self._position
+
+        start = self._position
+        end = min(start + size, self._size)
+        if start >= end:
+            return b""
+
+        self._position = end
+        return self._view[start:end].tobytes()
+
+    def readall(
+            self
+        ) -> bytes:
+        return self.read(-1)
+
+    def readinto(
+            self,
+            b
+        ) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        start = self._position
+        end = min(start + len(b), self._size)
+        if start >= end:
+            return 0
+
+        n = end - start
+        memoryview(b).cast("B")[:n] = self._view[start:end]
+        self._position = end
+        return n
+
+
+    def close(
+            self
+        ) -> None:
+        if not self.closed:
+            self._view.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        super().close()
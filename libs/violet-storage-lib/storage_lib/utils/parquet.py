@@ -0,0 +1,369 @@
+from __future__ import annotations
+import tempfile
+from io import BytesIO
+from storage_lib.utils.logger import logger
+from typing import Any, BinaryIO, Callable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:
+    pa = None
+    pq = None
+
+# Default Parquet writer settings.
+# Row groups of ~128k rows keep per-group statistics useful for
+# predicate pushdown while bounding the memory of streaming writes.
+DEFAULT_COMPRESSION = "snappy"
+DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+
+# Column name, or (column name, descending)
+SortingColumns = Optional[Sequence[Union[str, Tuple[str, bool]]]]
+
+
+def _require_pyarrow() -> None:
+    if pa is None or pq is None:
+        raise ImportError(
+            "pyarrow is required for Parquet support. "
+            "Install with `pip install /path-to/violet-storage-lib[parquet]`."
+        )
+
+
+def _normalize_sorting_columns(
+        sorting_columns: SortingColumns
+    ) -> List[Tuple[str, bool]]:
+    return [
+        (column, False) if isinstance(column, str) else (column[0], bool(column[1]))
+        for column in (sorting_columns or [])
+    ]
+
+
+def _parquet_sorting_columns(
+        schema: "pa.Schema",
+        sorting_columns: List[Tuple[str, bool]]
+    ) -> Optional[list]:
+    """
+    Translate (name, descending) pairs to pq.SortingColumn metadata.
+    """
+    if not sorting_columns:
+        return None
+    return [
+        pq.SortingColumn(schema.get_field_index(name), descending=descending)
+        for name, descending in sorting_columns
+    ]
+
+
+def to_arrow_table(
+        data: Any,
+        schema: Optional["pa.Schema"] = None,
+        preserve_index: Optional[bool] = None
+    ) -> "pa.Table":
+    """
+    Convert a DataFrame, RecordBatch or Table to a pyarrow Table,
+    cast to `schema` when given.
+    """
+    _require_pyarrow()
+    if isinstance(data, pa.Table):
+        table = data
+    elif isinstance(data, pa.RecordBatch):
+        table = pa.Table.from_batches([data])
+    else:
+        table = pa.Table.from_pandas(data, preserve_index=preserve_index)
+
+    if schema is not None and not table.schema.equals(schema, check_metadata=False):
+        table = table.select(schema.names).cast(schema)
+    return table
+
+
+def df_to_parquet_buffer(
+        df: "DataFrame",
+        compression: Optional[str] = DEFAULT_COMPRESSION,
+        use_dictionary: Union[bool, List[str]] = True,
+        row_group_size: Optional[int] = None,
+        sorting_columns: SortingColumns = None
+    ) -> BytesIO:
+    """
+    Convert a DataFrame to Parquet bytes in a BytesIO buffer (rewound).
+    :param compression: Codec (snappy, zstd, gzip, brotli, lz4, none).
+    :param use_dictionary: Dictionary encode all columns, none, or the listed ones.
+    :param row_group_size: Maximum rows per row group (pyarrow default if None).
+    :param sorting_columns: Columns to sort the rows by, recorded in the file metadata.
+    """
+    _require_pyarrow()
+    try:
+        table = pa.Table.from_pandas(df)
+        sorting = _normalize_sorting_columns(sorting_columns)
+        if sorting:
+            table = table.sort_by([
+                (name, "descending" if descending else "ascending")
+                for name, descending in sorting
+            ])
+
+        buffer = BytesIO()
+        pq.write_table(
+            table,
+            buffer,
+            compression=compression,
+            use_dictionary=use_dictionary,
+            row_group_size=row_group_size,
+            sorting_columns=_parquet_sorting_columns(table.schema, sorting)
+        )
+        buffer.seek(0)
+    except Exception as e:
+        logger.error(f"Error converting DataFrame to Parquet: {e}")
+        raise
+    return buffer
+
+
+class ParquetStreamWriter:
+    """
+    Incremental Parquet writer with bounded memory.
+    Chunks (DataFrames, RecordBatches or Tables) are buffered up to one row group,
+    encoded into a temporary file and the finished file is handed to `upload`
+    (a streaming multipart / block upload) on close.
+
+    Usage:
+        with client.open_parquet_writer("episodes.parquet", "whisperer") as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+
+    The upload happens when the context exits without an error,
+    on error the partial file is discarded.
+    """
+
+    def __init__(
+            self,
+            upload: Callable[[BinaryIO], None],
+            schema: Optional["pa.Schema"] = None,
+            compression: Optional[str] = DEFAULT_COMPRESSION,
+            use_dictionary: Union[bool, List[str]] = True,
+            row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+            sorting_columns: SortingColumns = None,
+            spool_dir: Optional[str] = None
+        ):
+        """
+        :param upload: Callable receiving the finished file (rewound) to upload.
+        :param schema: Schema of the file, inferred from the first chunk if None.
+        :param row_group_size: Rows per row group, also the size of the write buffer.
+        :param sorting_columns: Sort order recorded in the metadata,
+            chunks must already be written in this order.
+        :param spool_dir: Directory for the temporary file.
+        """
+        _require_pyarrow()
+        if not isinstance(row_group_size, int) or row_group_size < 1:
+            raise ValueError("row_group_size must be a positive integer")
+
+        self._upload = upload
+        self._schema = schema
+        self._compression = compression
+        self._use_dictionary = use_dictionary
+        self._row_group_size = row_group_size
+        self._sorting_columns = _normalize_sorting_columns(sorting_columns)
+        self._file = tempfile.TemporaryFile(dir=spool_dir)
+        self._writer = None
+        self._pending: List["pa.Table"] = []
+        self._pending_rows = 0
+        self._closed = False
+        self.rows_written = 0
+
+
+    def __enter__(
+            self
+        ) -> "ParquetStreamWriter":
+        return self
+
+    def __exit__(
+            self,
+            exc_type,
+            exc,
+            tb
+        ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+    def write(
+            self,
+            data: Any
+        ) -> None:
+        """
+        Append a DataFrame, RecordBatch or Table chunk.
+        DataFrame indexes are not stored.
+        """
+        if self._closed:
+            raise ValueError("Writer is closed.")
+
+        table = to_arrow_table(data, schema=self._schema, preserve_index=False)
+        if self._schema is None:
+            self._schema = table.schema
+
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+
+        while self._pending_rows >= self._row_group_size:
+            self._flush_row_group()
+
+
+    def _flush_row_group(
+            self,
+            final: bool = False
+        ) -> None:
+        """
+        Write one full row group (or the remainder when final) from the buffer.
+        """
+        if not self._pending_rows:
+            return
+
+        buffered = pa.concat_tables(self._pending)
+        size = buffered.num_rows if final else self._row_group_size
+
+        self._get_writer().write_table(buffered.slice(0, size), row_group_size=size)
+        self.rows_written += size
+
+        rest = buffered.slice(size)
+        self._pending = [rest] if rest.num_rows else []
+        self._pending_rows = rest.num_rows
+
+
+    def _get_writer(
+            self
+        ) -> "pq.ParquetWriter":
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self._file,
+                self._schema,
+                compression=self._compression,
+                use_dictionary=self._use_dictionary,
+                sorting_columns=_parquet_sorting_columns(self._schema, self._sorting_columns)
+            )
+        return self._writer
+
+
+    def close(
+            self
+        ) -> None:
+        """
+        Flush the buffer, finish the file and upload it.
+        """
+        if self._closed:
+            return
+        if self._schema is None:
+            self.abort()
+            raise ValueError("Nothing was written and no schema was given.")
+
+        try:
+            self._flush_row_group(final=True)
+            self._get_writer().close()
+            self._file.seek(0)
+            self._upload(self._file)
+            logger.info(f"Streamed {self.rows_written} rows as Parquet.")
+        finally:
+            self._closed = True
+            self._file.close()
+
+
+    def abort(
+            self
+        ) -> None:
+        """
+        Discard the written data without uploading.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._pending = []
+        try:
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            self._file.close()
+
+
+# Filters in pyarrow conjunctive form: [(column, op, value), ...]
+Filters = Optional[List[Tuple[str, str, Any]]]
+
+_FILTER_OPS = {
+    "=": lambda a, b: a == b,
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "in": lambda a, b: a in b,
+    "not in": lambda a, b: a not in b,
+}
+
+
+def parse_hive_partitions(
+        storage_key: str,
+        prefix: str = ""
+    ) -> dict:
+    """
+    Extract `name=value` path segments below the prefix,
+    e.g. `data/date=2025-06-13/country=us/x.parquet` -> {"date": "2025-06-13", "country": "us"}.
+    """
+    relative = storage_key[len(prefix):] if storage_key.startswith(prefix) else storage_key
+    partitions = {}
+    for segment in relative.strip("/").split("/")[:-1]:
+        if "=" in segment:
+            name, value = segment.split("=", 1)
+            partitions[name] = value
+    return partitions
+
+
+def split_partition_filters(
+        filters: Filters,
+        partition_names: set
+    ) -> Tuple[list, Filters]:
+    """
+    Split conjunctive filters into filters on partition columns
+    (evaluated on paths) and the rest (pushed down to the file reader).
+    """
+    if not filters:
+        return [], None
+    if any(not isinstance(f, tuple) for f in filters):
+        raise ValueError(
+            "Dataset filters must be a flat list of (column, op, value) tuples."
+        )
+    for _, op, _ in filters:
+        if op not in _FILTER_OPS:
+            raise ValueError(f"Unsupported filter operator: {op}")
+
+    partition_filters = [f for f in filters if f[0] in partition_names]
+    file_filters = [f for f in filters if f[0] not in partition_names]
+    return partition_filters, (file_filters or None)
+
+
+def partition_matches(
+        partitions: dict,
+        partition_filters: list
+    ) -> bool:
+    """
+    Evaluate partition filters against path values (compared as strings).
+    """
+    for name, op, value in partition_filters:
+        if name not in partitions:
+            return False
+        if op in ("in", "not in"):
+            value = {str(v) for v in value}
+        else:
+            value = str(value)
+        if not _FILTER_OPS[op](partitions[name], value):
+            return False
+    return True
+
+
+def add_partition_columns(
+        table: "pa.Table",
+        partitions: dict
+    ) -> "pa.Table":
+    """
+    Append partition values as constant string columns (unless present in the file).
+    """
+    for name, value in partitions.items():
+        if name not in table.column_names:
+            table = table.append_column(name, pa.array([value] * table.num_rows, pa.string()))
+    return table
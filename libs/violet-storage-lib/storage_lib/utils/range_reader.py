@@ -0,0 +1,216 @@
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+# Default settings for ranged reads.
+# Parquet footers and column chunks are usually well below a few MiB,
+# so 1 MiB blocks keep over-fetching small while limiting request count.
+DEFAULT_BLOCK_SIZE = 1024 * 1024        # 1 MiB
+DEFAULT_MAX_CACHED_BLOCKS = 32
+DEFAULT_RANGE_CONCURRENCY = 4
+
+
+class RangeReader(io.RawIOBase):
+    """
+    Seekable, read-only file-like object over a remote object.
+    Data is fetched lazily with HTTP range requests in fixed size blocks,
+    recently used blocks are kept in an LRU cache.
+    Reads spanning several missing blocks fetch them in parallel.
+
+    Suitable for libraries that only need parts of a file,
+    e.g. pyarrow.parquet reading the footer and selected column chunks.
+    """
+
+    def __init__(
+            self,
+            fetch_range: Callable[[int, int], bytes],
+            size: int,
+            block_size: int = DEFAULT_BLOCK_SIZE,
+            max_cached_blocks: int = DEFAULT_MAX_CACHED_BLOCKS,
+            max_concurrency: int = DEFAULT_RANGE_CONCURRENCY,
+            name: Optional[str] = None
+        ):
+        """
+        :param fetch_range: Callable (offset, length) -> bytes issuing a range request.
+        :param size: Total size of the remote object in bytes.
+        :param block_size: Size of a single fetched and cached block.
+        :param max_cached_blocks: Maximum number of blocks kept in memory.
+        :param max_concurrency: Maximum number of parallel range requests.
+        :param name: Optional name of the object, used in repr.
+        """
+        if not isinstance(block_size, int) or block_size < 1:
+            raise ValueError("block_size must be a positive integer")
+        if not isinstance(max_cached_blocks, int) or max_cached_blocks < 1:
+            raise ValueError("max_cached_blocks must be a positive integer")
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+
+        super().__init__()
+        self._fetch_range = fetch_range
+        self._size = size
+        self._block_size = block_size
+        self._max_cached_blocks = max_cached_blocks
+        self._max_concurrency = max_concurrency
+        self._position = 0
+        self._cache: "OrderedDict[int, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.name = name
+        self.requests_made = 0
+
+
+    def __repr__(
+            self
+        ) -> str:
+        return f"<RangeReader name={self.name!r} size={self._size}>"
+
+    @property
+    def size(
+            self
+        ) -> int:
+        return self._size
+
+    def readable(
+            self
+        ) -> bool:
+        return True
+
+    def seekable(
+            self
+        ) -> bool:
+        return True
+
+    def tell(
+            self
+        ) -> int:
+        return self._position
+
+    def seek(
+            self,
+            offset: int,
+            whence: int = io.SEEK_SET
+        ) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence value: {whence}")
+
+        if position < 0:
+            raise ValueError("Negative seek position")
+
+        self._position = position
+        return self._position
+
+
+    def read(
+            self,
+            size: int = -1
+        ) -> bytes:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        if size is None or size < 0:
+            size = self._size - self._position
+
+        start = self._position
+        end = min(start + size, self._size)
+        if start >= end:
+            return b""
+
+        data = self._read_range(start, end)
+        self._position = end
+        return data
+
+    def readall(
+            self
+        ) -> bytes:
+        return self.read(-1)
+
+    def readinto(
+            self,
+            b
+        ) -> int:
+        data = self.read(len(b))
+        n = len(data)
+        b[:n] = data
+        return n
+
+
+    def _read_range(
+            self,
+            start: int,
+            end: int
+        ) -> bytes:
+        """
+        Assemble bytes [start, end) from cached or freshly fetched blocks.
+        """
+        first_block = start // self._block_size
+        last_block = (end - 1) // self._block_size
+
+        blocks = self._get_blocks(range(first_block, last_block + 1))
+
+        data = b"".join(blocks[i] for i in range(first_block, last_block + 1))
+        offset = start - first_block * self._block_size
+        return data[offset:offset + (end - start)]
+
+
+    def _get_blocks(
+            self,
+            indexes: range
+        ) -> dict:
+        """
+        Return the requested blocks, fetching missing ones
+        (in parallel when more than one is missing).
+        """
+        blocks = {}
+        missing = []
+
+        with self._lock:
+            for index in indexes:
+                if index in self._cache:
+                    self._cache.move_to_end(index)
+                    blocks[index] = self._cache[index]
+                else:
+                    missing.append(index)
+
+        if len(missing) > 1 and self._max_concurrency > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_concurrency, len(missing))
+            ) as executor:
+                fetched = list(executor.map(self._fetch_block, missing))
+        else:
+            fetched = [self._fetch_block(index) for index in missing]
+
+        with self._lock:
+            for index, data in zip(missing, fetched):
+                blocks[index] = data
+                self._cache[index] = data
+                self._cache.move_to_end(index)
+            while len(self._cache) > self._max_cached_blocks:
+                self._cache.popitem(last=False)
+
+        return blocks
+
+
+    def _fetch_block(
+            self,
+            index: int
+        ) -> bytes:
+        offset = index * self._block_size
+        length = min(self._block_size, self._size - offset)
+        with self._lock:
+            self.requests_made += 1
+        return self._fetch_range(offset, length)
+
+
+    def close(
+            self
+        ) -> None:
+        with self._lock:
+            self._cache.clear()
+        super().close()
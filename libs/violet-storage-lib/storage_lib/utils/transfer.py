@@ -0,0 +1,110 @@
+import io
+from typing import BinaryIO, Iterable, Union
+
+# Default transfer settings for streaming (multipart / block) uploads.
+# Memory used by a single upload is roughly part_size * (max_concurrency + 1),
+# independent of the size of the uploaded object.
+DEFAULT_PART_SIZE = 8 * 1024 * 1024     # 8 MiB
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Default chunk size for streaming (iter_chunks) downloads
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024    # 4 MiB
+
+# Default page size of key listings (max allowed by S3 / Azure per request)
+DEFAULT_LIST_PAGE_SIZE = 1000
+
+# Default size of the connection pool for async clients,
+# bounds the number of concurrent transfers per backend client
+DEFAULT_ASYNC_POOL_CONNECTIONS = 100
+
+# S3 rejects multipart parts smaller than 5 MiB (except the last one)
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+StreamSource = Union[BinaryIO, Iterable[bytes]]
+
+
+class IterableReader(io.RawIOBase):
+    """
+    Read-only file-like wrapper over an iterator of bytes chunks.
+    Lets generators (e.g. chunked downloads, encoders) be passed
+    to backends that expect a file handle.
+    """
+
+    def __init__(
+            self,
+            chunks: Iterable[bytes]
+        ):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(
+            self
+        ) -> bool:
+        return True
+
+    def readinto(
+            self,
+            b
+        ) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = bytes(next(self._chunks))
+            except StopIteration:
+                return 0
+
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+def as_readable(
+        source: StreamSource
+    ) -> BinaryIO:
+    """
+    Return a readable binary file-like object for the given source.
+    File handles are passed through, iterables of bytes are wrapped.
+    """
+    if hasattr(source, "read"):
+        return source
+    if isinstance(source, (bytes, bytearray, str)):
+        raise TypeError(
+            "source must be a binary file-like object or an iterable of bytes chunks"
+        )
+    return io.BufferedReader(IterableReader(source))
+
+
+def read_part(
+        reader: BinaryIO,
+        size: int
+    ) -> bytes:
+    """
+    Read up to `size` bytes from the reader.
+    Keeps reading until the part is full or the stream is exhausted,
+    since raw streams may return short reads.
+    """
+    parts = []
+    remaining = size
+    while remaining > 0:
+        data = reader.read(remaining)
+        if not data:
+            break
+        parts.append(data)
+        remaining -= len(data)
+    return b"".join(parts)
+
+
+def validate_transfer_settings(
+        part_size: int,
+        max_concurrency: int,
+        min_part_size: int = 1
+    ) -> None:
+    """
+    Validate streaming upload settings.
+    Raises ValueError for non-positive or too small values.
+    """
+    if not isinstance(part_size, int) or part_size < min_part_size:
+        raise ValueError(f"part_size must be an integer >= {min_part_size}")
+    if not isinstance(max_concurrency, int) or max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer")